@@ -0,0 +1,62 @@
+#!/usr/bin/env python3
+"""
+Benchmark batch_check_dates against one check_date call per date.
+
+Both runs start from an empty engine and check the same random dates spread
+over ten years, as a planner scoring candidate dates would.
+
+Usage:
+    python benchmarks/bench_batch_check_dates.py [--dates 500]
+"""
+
+import argparse
+import asyncio
+import random
+import time
+from datetime import date, timedelta
+
+from lunar_mcp_server.engine import LunarEngine
+from lunar_mcp_server.server import LunarMCPServer
+
+ACTIVITY = "wedding"
+
+
+def new_server() -> LunarMCPServer:
+    """Create a server with a fresh engine and a loaded ephemeris."""
+    server = LunarMCPServer(LunarEngine())
+    server.lunar_calc.load_ephemeris()
+    return server
+
+
+async def main() -> None:
+    """Run the benchmark and print a summary."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--dates", type=int, default=500)
+    parser.add_argument("--seed", type=int, default=7)
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    dates = [
+        (date(2020, 1, 1) + timedelta(days=rng.randrange(3650))).isoformat()
+        for _ in range(args.dates)
+    ]
+
+    server = new_server()
+    started = time.perf_counter()
+    for day in dates:
+        await server.auspicious_checker.check_date(day, ACTIVITY)
+    sequential_ms = (time.perf_counter() - started) * 1000
+
+    server = new_server()
+    started = time.perf_counter()
+    await server._batch_check_dates(dates, ACTIVITY)
+    batch_ms = (time.perf_counter() - started) * 1000
+
+    print(f"{len(dates)} dates")
+    print(f"  sequential check_date: {sequential_ms:8.1f} ms")
+    print(f"  batch_check_dates:     {batch_ms:8.1f} ms")
+    print(f"  speedup:               {sequential_ms / batch_ms:8.1f}x")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
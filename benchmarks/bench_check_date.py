@@ -0,0 +1,63 @@
+#!/usr/bin/env python3
+"""
+Benchmark check_date on poor dates, with and without the alternative date
+search.
+
+Every run starts from an empty engine and checks consecutive poor dates, so
+the day facts cache only helps where neighbors overlap between calls.
+
+Usage:
+    python benchmarks/bench_check_date.py [--days 200]
+"""
+
+import argparse
+import asyncio
+import time
+from datetime import date, timedelta
+
+from lunar_mcp_server.auspicious_dates import AuspiciousDateChecker
+from lunar_mcp_server.engine import LunarEngine
+
+ACTIVITY = "wedding"
+
+
+def new_checker() -> AuspiciousDateChecker:
+    """Create a checker with a fresh engine and a loaded ephemeris."""
+    checker = AuspiciousDateChecker(LunarEngine())
+    checker.engine.lunar_calc.load_ephemeris()
+    return checker
+
+
+async def poor_dates(days: int) -> list[str]:
+    """Find the dates scoring below 7 in the first ``days`` days of 2024."""
+    checker = new_checker()
+    found = []
+    for offset in range(days):
+        day = (date(2024, 1, 1) + timedelta(days=offset)).isoformat()
+        result = await checker.check_date(day, ACTIVITY, find_alternatives=False)
+        if result["score"] < 7:
+            found.append(day)
+    return found
+
+
+async def main() -> None:
+    """Run the benchmark and print a summary."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--days", type=int, default=200)
+    args = parser.parse_args()
+
+    dates = await poor_dates(args.days)
+    for find_alternatives in (False, True):
+        checker = new_checker()
+        started = time.perf_counter()
+        for day in dates:
+            await checker.check_date(day, ACTIVITY, find_alternatives=find_alternatives)
+        mean_ms = (time.perf_counter() - started) * 1000 / len(dates)
+        print(
+            f"find_alternatives={find_alternatives!s:>5}: "
+            f"{len(dates)} poor dates, {mean_ms:.3f} ms per check_date"
+        )
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
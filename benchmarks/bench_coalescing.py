@@ -0,0 +1,78 @@
+#!/usr/bin/env python3
+"""
+Benchmark bursts of identical concurrent tool calls with and without
+single-flight coalescing.
+
+Each burst sends the same call from many clients at once through the MCP
+call_tool handler of a fresh server, as agents in different sessions asking
+for the same year of moon phases or festivals would.
+
+Usage:
+    python benchmarks/bench_coalescing.py [--clients 32]
+"""
+
+import argparse
+import asyncio
+import time
+from typing import Any
+
+from mcp.types import CallToolRequest, CallToolRequestParams
+
+from lunar_mcp_server.config import Settings
+from lunar_mcp_server.engine import LunarEngine
+from lunar_mcp_server.server import LunarMCPServer
+
+CALLS = [
+    ("predict_moon_phases", {"start_date": "2024-01-01", "end_date": "2025-12-31"}),
+    ("get_annual_festivals", {"year": 2024}),
+    (
+        "find_good_dates",
+        {"start_date": "2024-01-01", "end_date": "2024-12-31", "activity": "wedding"},
+    ),
+]
+
+
+async def burst(
+    coalesce: bool, name: str, arguments: dict[str, Any], clients: int
+) -> tuple[float, int]:
+    """Send one burst to a fresh server, returning its time and computations."""
+    server = LunarMCPServer(LunarEngine(Settings(coalesce_calls=coalesce)))
+    server.lunar_calc.load_ephemeris()
+    registered = server.tools[name]
+    computed = 0
+
+    async def counting_handler(**kwargs: Any) -> dict[str, Any]:
+        nonlocal computed
+        computed += 1
+        return await registered.handler(**kwargs)
+
+    server.tools[name] = registered._replace(handler=counting_handler)
+    handler = server.server.request_handlers[CallToolRequest]
+    request = CallToolRequest(
+        method="tools/call",
+        params=CallToolRequestParams(name=name, arguments=arguments),
+    )
+    started = time.perf_counter()
+    await asyncio.gather(*(handler(request) for _ in range(clients)))
+    elapsed_ms = (time.perf_counter() - started) * 1000
+    server.worker_pool.shutdown()
+    return elapsed_ms, computed
+
+
+async def main() -> None:
+    """Run the benchmark and print a summary."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--clients", type=int, default=32)
+    args = parser.parse_args()
+
+    for name, arguments in CALLS:
+        for coalesce in (False, True):
+            elapsed_ms, computed = await burst(coalesce, name, arguments, args.clients)
+            print(
+                f"{name:>20} coalesce={coalesce!s:>5}: {args.clients} calls in "
+                f"{elapsed_ms:8.1f} ms, {computed} computed"
+            )
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
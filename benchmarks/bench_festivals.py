@@ -0,0 +1,71 @@
+#!/usr/bin/env python3
+"""
+Benchmark festival lookups.
+
+Reports the cost of get_festivals_for_date over every day of a year and of
+get_next_festival from every day of a year, cold (empty festival index) and
+warm, and of building the get_annual_festivals calendar.
+
+Usage:
+    python benchmarks/bench_festivals.py [--year 2024]
+"""
+
+import argparse
+import asyncio
+import time
+from collections.abc import Awaitable, Callable
+from datetime import date, timedelta
+from typing import Any
+
+from lunar_mcp_server.engine import LunarEngine
+from lunar_mcp_server.festivals import FestivalManager
+
+
+async def time_days(
+    call: Callable[[str], Awaitable[dict[str, Any]]], days: list[str]
+) -> float:
+    """Call a lookup for every day and return the mean time in ms."""
+    started = time.perf_counter()
+    for day in days:
+        await call(day)
+    return (time.perf_counter() - started) * 1000 / len(days)
+
+
+async def main() -> None:
+    """Run the benchmark and print a summary."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--year", type=int, default=2024)
+    args = parser.parse_args()
+
+    first = date(args.year, 1, 1)
+    days = [
+        (first + timedelta(days=offset)).isoformat()
+        for offset in range((date(args.year + 1, 1, 1) - first).days)
+    ]
+
+    for name in ("get_festivals_for_date", "get_next_festival"):
+        manager = FestivalManager(LunarEngine())
+        call = getattr(manager, name)
+        started = time.perf_counter()
+        await call(days[0])
+        cold_ms = (time.perf_counter() - started) * 1000
+        warm_ms = await time_days(call, days)
+        print(f"{name:>24}: first call {cold_ms:7.2f} ms   warm {warm_ms:7.4f} ms/call")
+
+    manager = FestivalManager(LunarEngine())
+    started = time.perf_counter()
+    await manager.get_annual_festivals(args.year)
+    cold_ms = (time.perf_counter() - started) * 1000
+    rounds = 1000
+    started = time.perf_counter()
+    for _ in range(rounds):
+        await manager.get_annual_festivals(args.year)
+    warm_ms = (time.perf_counter() - started) * 1000 / rounds
+    print(
+        f"{'get_annual_festivals':>24}: first call {cold_ms:7.2f} ms   "
+        f"warm {warm_ms:7.4f} ms/call"
+    )
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
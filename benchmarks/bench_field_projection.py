@@ -0,0 +1,79 @@
+#!/usr/bin/env python3
+"""
+Benchmark tools returning all fields against a projection to a few fields.
+
+Every run starts from an empty engine and calls a tool for consecutive
+dates, so field sets that need the moon phase pay for the ephemeris.
+
+Usage:
+    python benchmarks/bench_field_projection.py [--days 200]
+"""
+
+import argparse
+import asyncio
+import time
+from datetime import date, timedelta
+
+from lunar_mcp_server.engine import LunarEngine
+from lunar_mcp_server.server import LunarMCPServer
+
+# Tool, fixed arguments and the field sets to compare (None is all fields)
+CASES = [
+    (
+        "check_auspicious_date",
+        {"activity": "wedding"},
+        [None, ["score", "auspicious_level"], ["score", "moon_phase"]],
+    ),
+    ("get_daily_fortune", {}, [None, ["lucky_colors", "lucky_numbers"]]),
+    ("get_zodiac_info", {}, [None, ["year_zodiac", "daily_zodiac"]]),
+]
+
+
+def new_server() -> LunarMCPServer:
+    """Create a server with a fresh engine and a loaded ephemeris."""
+    server = LunarMCPServer(LunarEngine())
+    server.lunar_calc.load_ephemeris()
+    return server
+
+
+async def time_tool(
+    tool: str, arguments: dict, fields: list[str] | None, days: int
+) -> float:
+    """Mean milliseconds per call over ``days`` consecutive dates."""
+    handler = new_server().tools[tool].handler
+    started = time.perf_counter()
+    for offset in range(days):
+        day = (date(2024, 1, 1) + timedelta(days=offset)).isoformat()
+        await handler(date=day, fields=fields, **arguments)
+    return (time.perf_counter() - started) * 1000 / days
+
+
+async def time_festival_details(fields: list[str] | None, calls: int) -> float:
+    """Mean milliseconds per get_festival_details call."""
+    handler = new_server().tools["get_festival_details"].handler
+    started = time.perf_counter()
+    for _ in range(calls):
+        await handler(festival_name="Mid-Autumn Festival", fields=fields)
+    return (time.perf_counter() - started) * 1000 / calls
+
+
+async def main() -> None:
+    """Run the benchmark and print a summary."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--days", type=int, default=200)
+    args = parser.parse_args()
+
+    for tool, arguments, field_sets in CASES:
+        for fields in field_sets:
+            mean_ms = await time_tool(tool, arguments, fields, args.days)
+            label = ",".join(fields) if fields else "all"
+            print(f"{tool:>22} [{label}]: {mean_ms:.3f} ms per call")
+
+    for fields in (None, ["name", "foods"]):
+        mean_ms = await time_festival_details(fields, args.days)
+        label = ",".join(fields) if fields else "all"
+        print(f"{'get_festival_details':>22} [{label}]: {mean_ms:.3f} ms per call")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,71 @@
+#!/usr/bin/env python3
+"""
+Benchmark find_good_dates against the previous per-day check_date scan.
+
+The per-day scan calls ``check_date`` (with its alternative date search) for
+every day until ``limit`` good days are found, as find_good_dates used to.
+
+Usage:
+    python benchmarks/bench_find_good_dates.py
+"""
+
+import asyncio
+import time
+from datetime import date, timedelta
+
+from lunar_mcp_server.auspicious_dates import AuspiciousDateChecker
+from lunar_mcp_server.engine import LunarEngine
+
+RANGES = {
+    "month": (date(2024, 1, 1), date(2024, 1, 31)),
+    "year": (date(2024, 1, 1), date(2024, 12, 31)),
+    "10 years": (date(2020, 1, 1), date(2029, 12, 31)),
+}
+
+ACTIVITIES = ["wedding", "travel", "funeral"]
+
+
+async def per_day(
+    checker: AuspiciousDateChecker, start: date, end: date, activity: str, limit: int
+) -> int:
+    """Scan a range one check_date call at a time."""
+    found = 0
+    current = start
+    while current <= end and found < limit:
+        result = await checker.check_date(current.strftime("%Y-%m-%d"), activity)
+        if result.get("auspicious_level") in ["very_good", "good"]:
+            found += 1
+        current += timedelta(days=1)
+    return found
+
+
+async def main() -> None:
+    """Run the benchmark and print a summary."""
+    for activity in ACTIVITIES:
+        for limit in (10, 1000):
+            for label, (start, end) in RANGES.items():
+                # Fresh engines so neither side benefits from the other's cache
+                checker = AuspiciousDateChecker(LunarEngine())
+                checker.engine.lunar_calc.load_ephemeris()
+                started = time.perf_counter()
+                await per_day(checker, start, end, activity, limit)
+                per_day_ms = (time.perf_counter() - started) * 1000
+
+                checker = AuspiciousDateChecker(LunarEngine())
+                checker.engine.lunar_calc.load_ephemeris()
+                started = time.perf_counter()
+                result = await checker.find_good_dates(
+                    start.isoformat(), end.isoformat(), activity, limit=limit
+                )
+                range_ms = (time.perf_counter() - started) * 1000
+
+                print(
+                    f"{activity:>8} limit {limit:4d} {label:>9}: "
+                    f"{result['found_dates']:4d} dates   "
+                    f"per-day {per_day_ms:9.1f} ms   range {range_ms:7.2f} ms   "
+                    f"speedup {per_day_ms / range_ms:7.1f}x"
+                )
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
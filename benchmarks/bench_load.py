@@ -0,0 +1,431 @@
+#!/usr/bin/env python3
+"""
+Load generator driving many concurrent MCP sessions against the server.
+
+Opens ``--sessions`` MCP client sessions, either over stdio (one server
+process per session, as desktop clients run it) or over streamable HTTP
+(one server, started here or given with ``--url``), and sends tool calls
+drawn from a weighted tool mix with random dates. With ``--rate`` calls
+arrive as an open-loop Poisson process spread over the sessions, and
+latency runs from the scheduled arrival, so time spent queued behind a
+blocked event loop counts. Without it every session sends its next call as
+soon as the previous one returns.
+
+Every ``--interval`` seconds it prints the throughput, p50/p99 latency,
+error rate and server RSS (summed over the server processes, Linux only),
+then a per-tool summary at the end. ``--json`` also writes the timeline and
+summary to a file.
+
+Usage:
+    python benchmarks/bench_load.py [--transport stdio|http] [--sessions 8]
+        [--rate 200] [--seconds 30] [--mix get_moon_phase=3,find_good_dates=1]
+        [--url http://127.0.0.1:8000/mcp] [--server-args="--workers 4"]
+        [--json results.json]
+"""
+
+import argparse
+import asyncio
+import contextlib
+import json
+import os
+import random
+import shlex
+import subprocess
+import sys
+import time
+import urllib.request
+from collections.abc import Callable
+from dataclasses import dataclass, field
+from datetime import date, timedelta
+from pathlib import Path
+from typing import Any
+
+from mcp import ClientSession
+from mcp.client.stdio import StdioServerParameters, stdio_client
+from mcp.client.streamable_http import streamablehttp_client
+
+SERVER_COMMAND = [sys.executable, "-m", "lunar_mcp_server.server"]
+
+Arguments = Callable[[random.Random, date], dict[str, Any]]
+
+
+def _iso(day: date, offset: int = 0) -> str:
+    return (day + timedelta(days=offset)).isoformat()
+
+
+# Tool -> arguments for a random day
+TOOL_ARGUMENTS: dict[str, Arguments] = {
+    "check_auspicious_date": lambda rng, day: {
+        "date": _iso(day),
+        "activity": rng.choice(["wedding", "business_opening", "travel", "moving"]),
+    },
+    "find_good_dates": lambda rng, day: {
+        "start_date": _iso(day),
+        "end_date": _iso(day, 30),
+        "activity": "wedding",
+    },
+    "get_daily_fortune": lambda rng, day: {"date": _iso(day)},
+    "check_zodiac_compatibility": lambda rng, day: {
+        "date1": _iso(day),
+        "date2": _iso(day, -rng.randrange(3650)),
+    },
+    "get_lunar_festivals": lambda rng, day: {"date": _iso(day)},
+    "get_next_festival": lambda rng, day: {"date": _iso(day)},
+    "get_festival_details": lambda rng, day: {
+        "festival_name": rng.choice(
+            ["Lantern Festival", "Mid-Autumn Festival", "Dragon Boat Festival"]
+        )
+    },
+    "get_annual_festivals": lambda rng, day: {"year": day.year},
+    "get_moon_phase": lambda rng, day: {"date": _iso(day)},
+    "get_moon_calendar": lambda rng, day: {"month": day.month, "year": day.year},
+    "get_moon_influence": lambda rng, day: {"date": _iso(day), "activity": "planting"},
+    "predict_moon_phases": lambda rng, day: {
+        "start_date": _iso(day),
+        "end_date": _iso(day, 365),
+    },
+    "solar_to_lunar": lambda rng, day: {"solar_date": _iso(day)},
+    "lunar_to_solar": lambda rng, day: {
+        "lunar_date": f"{day.year}-{day.month:02d}-{min(day.day, 29):02d}"
+    },
+    "solar_to_lunar_range": lambda rng, day: {
+        "start_date": _iso(day),
+        "end_date": _iso(day, 364),
+    },
+    "lunar_to_solar_range": lambda rng, day: {
+        "start_lunar_date": f"{day.year}-1-1",
+        "end_lunar_date": f"{day.year}-12-29",
+    },
+    "get_zodiac_info": lambda rng, day: {"date": _iso(day)},
+    "batch_check_dates": lambda rng, day: {
+        "dates": [_iso(day, 7 * i) for i in range(30)],
+        "activity": "wedding",
+    },
+    "compare_dates": lambda rng, day: {
+        "dates": [_iso(day, i) for i in range(5)],
+        "activity": "travel",
+    },
+    "get_lucky_hours": lambda rng, day: {"date": _iso(day), "activity": "travel"},
+}
+
+DEFAULT_MIX = (
+    "get_moon_phase=20,solar_to_lunar=20,check_auspicious_date=20,"
+    "get_daily_fortune=15,get_lunar_festivals=10,get_lucky_hours=5,"
+    "find_good_dates=5,batch_check_dates=3,predict_moon_phases=2"
+)
+
+
+def parse_mix(text: str) -> dict[str, float]:
+    """Parse ``tool=weight,...`` into weights."""
+    mix = {}
+    for item in text.split(","):
+        name, _, weight = item.partition("=")
+        name = name.strip()
+        if name not in TOOL_ARGUMENTS:
+            raise SystemExit(f"Unknown tool in mix: {name}")
+        mix[name] = float(weight or 1)
+    return mix
+
+
+@dataclass
+class Sample:
+    """One completed call."""
+
+    tool: str
+    finished: float
+    latency: float
+    error: bool
+
+
+@dataclass
+class Recorder:
+    """Completed calls, reported per interval and in total."""
+
+    started: float = field(default_factory=time.perf_counter)
+    samples: list[Sample] = field(default_factory=list)
+    reported: int = 0
+    timeline: list[dict[str, Any]] = field(default_factory=list)
+
+    def record(self, tool: str, latency: float, error: bool) -> None:
+        """Record one call."""
+        self.samples.append(Sample(tool, time.perf_counter(), latency, error))
+
+    def report(self, rss_kb: int | None) -> None:
+        """Print and keep the stats of the calls since the last report."""
+        now = time.perf_counter()
+        window = self.samples[self.reported :]
+        elapsed = now - (self.timeline[-1]["_at"] if self.timeline else self.started)
+        self.reported = len(self.samples)
+        stats = summarize(window)
+        point = {
+            "_at": now,
+            "time_s": round(now - self.started, 1),
+            "calls_per_s": round(len(window) / elapsed, 1) if elapsed else 0.0,
+            **stats,
+            "rss_mib": None if rss_kb is None else round(rss_kb / 1024, 1),
+        }
+        self.timeline.append(point)
+        print(
+            f"{point['time_s']:6.1f} {point['calls_per_s']:9.1f} "
+            f"{_fmt(stats['p50_ms'])} {_fmt(stats['p99_ms'])} "
+            f"{stats['error_rate']:7.1%} "
+            f"{'-' if rss_kb is None else format(rss_kb / 1024, '.0f'):>8}",
+            flush=True,
+        )
+
+
+def _fmt(value: float | None) -> str:
+    return f"{'-':>9}" if value is None else f"{value:9.2f}"
+
+
+def percentile(sorted_values: list[float], q: float) -> float:
+    """Nearest-rank percentile of sorted values."""
+    index = max(0, min(len(sorted_values) - 1, round(q * len(sorted_values)) - 1))
+    return sorted_values[index]
+
+
+def summarize(samples: list[Sample]) -> dict[str, Any]:
+    """Count, error rate and latency percentiles (ms) of samples."""
+    latencies = sorted(sample.latency * 1000 for sample in samples)
+    errors = sum(sample.error for sample in samples)
+    return {
+        "calls": len(samples),
+        "error_rate": errors / len(samples) if samples else 0.0,
+        "p50_ms": round(percentile(latencies, 0.5), 3) if latencies else None,
+        "p99_ms": round(percentile(latencies, 0.99), 3) if latencies else None,
+        "max_ms": round(latencies[-1], 3) if latencies else None,
+    }
+
+
+def server_pids(root: int) -> list[int]:
+    """A process and all its descendants (Linux only)."""
+    pids = [root]
+    for pid in pids:
+        with contextlib.suppress(OSError):
+            for task in Path(f"/proc/{pid}/task").iterdir():
+                pids.extend(
+                    int(child) for child in (task / "children").read_text().split()
+                )
+    return pids
+
+
+def rss_kb(pids: list[int]) -> int | None:
+    """Total resident memory of processes in KiB, or None if unavailable."""
+    total = 0
+    found = False
+    for pid in pids:
+        with contextlib.suppress(OSError):
+            for line in Path(f"/proc/{pid}/status").read_text().splitlines():
+                if line.startswith("VmRSS:"):
+                    total += int(line.split()[1])
+                    found = True
+    return total if found else None
+
+
+def is_error(result: Any) -> bool:
+    """Whether a tool result reports an error."""
+    if result.isError or not result.content:
+        return True
+    text = result.content[0].text
+    # Error results are objects whose first key is "error"
+    return text.lstrip("{ \n").startswith('"error"')
+
+
+def start_http_server(port: int, extra: list[str]) -> subprocess.Popen[bytes]:
+    """Start an HTTP server and wait until it answers."""
+    process = subprocess.Popen(
+        [*SERVER_COMMAND, "--transport", "http", "--port", str(port), *extra],
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+    )
+    deadline = time.monotonic() + 60
+    while time.monotonic() < deadline and process.poll() is None:
+        try:
+            urllib.request.urlopen(f"http://127.0.0.1:{port}/healthz", timeout=1)
+            return process
+        except OSError:
+            time.sleep(0.2)
+    process.kill()
+    raise SystemExit(f"Server on port {port} did not start")
+
+
+async def open_sessions(
+    args: argparse.Namespace, stack: contextlib.AsyncExitStack
+) -> list[ClientSession]:
+    """Open and initialize the client sessions."""
+    sessions = []
+    devnull = stack.enter_context(open(os.devnull, "w"))
+    for _ in range(args.sessions):
+        if args.transport == "stdio":
+            params = StdioServerParameters(
+                command=SERVER_COMMAND[0],
+                args=[*SERVER_COMMAND[1:], *shlex.split(args.server_args)],
+                env=dict(os.environ),
+            )
+            read, write = await stack.enter_async_context(
+                stdio_client(params, errlog=devnull)
+            )
+        else:
+            read, write, _ = await stack.enter_async_context(
+                streamablehttp_client(args.url, timeout=args.timeout)
+            )
+        session = await stack.enter_async_context(ClientSession(read, write))
+        await session.initialize()
+        sessions.append(session)
+    return sessions
+
+
+async def run_load(args: argparse.Namespace, pids: Callable[[], list[int]]) -> Recorder:
+    """Drive the sessions for the configured time."""
+    mix = parse_mix(args.mix)
+    tools = list(mix)
+    weights = list(mix.values())
+    rng = random.Random(args.seed)
+    first_day = date(args.years[0], 1, 1)
+    days = (date(args.years[1], 12, 31) - first_day).days
+    timeout = timedelta(seconds=args.timeout)
+
+    async with contextlib.AsyncExitStack() as stack:
+        sessions = await open_sessions(args, stack)
+        print(f"{len(sessions)} {args.transport} sessions open", flush=True)
+        print(
+            f"{'time':>6} {'calls/s':>9} {'p50 ms':>9} {'p99 ms':>9} {'errors':>7} {'RSS MiB':>8}"
+        )
+        recorder = Recorder()
+        deadline = recorder.started + args.seconds
+        in_flight: set[asyncio.Task[None]] = set()
+
+        async def call(session: ClientSession, scheduled: float) -> None:
+            tool = rng.choices(tools, weights)[0]
+            arguments = TOOL_ARGUMENTS[tool](
+                rng, first_day + timedelta(days=rng.randrange(days))
+            )
+            try:
+                result = await session.call_tool(tool, arguments, timeout)
+                error = is_error(result)
+            except Exception:
+                error = True
+            recorder.record(tool, time.perf_counter() - scheduled, error)
+
+        async def closed_loop(session: ClientSession) -> None:
+            while time.perf_counter() < deadline:
+                await call(session, time.perf_counter())
+
+        async def open_loop() -> None:
+            scheduled = time.perf_counter()
+            index = 0
+            while True:
+                scheduled += rng.expovariate(args.rate)
+                if scheduled >= deadline:
+                    break
+                await asyncio.sleep(max(0.0, scheduled - time.perf_counter()))
+                task = asyncio.create_task(
+                    call(sessions[index % len(sessions)], scheduled)
+                )
+                in_flight.add(task)
+                task.add_done_callback(in_flight.discard)
+                index += 1
+            if in_flight:
+                await asyncio.wait(in_flight)
+
+        async def reporter() -> None:
+            while True:
+                await asyncio.sleep(args.interval)
+                recorder.report(rss_kb(pids()))
+
+        report_task = asyncio.create_task(reporter())
+        if args.rate > 0:
+            await open_loop()
+        else:
+            await asyncio.gather(*(closed_loop(session) for session in sessions))
+        report_task.cancel()
+        recorder.report(rss_kb(pids()))
+    return recorder
+
+
+def print_summary(recorder: Recorder) -> dict[str, Any]:
+    """Print the totals and per-tool stats, returning them."""
+    seconds = recorder.timeline[-1]["_at"] - recorder.started
+    total = summarize(recorder.samples)
+    by_tool = {
+        tool: summarize([s for s in recorder.samples if s.tool == tool])
+        for tool in sorted({sample.tool for sample in recorder.samples})
+    }
+    print(
+        f"\n{total['calls']} calls, {total['calls'] / seconds:.1f} calls/s, "
+        f"p50 {total['p50_ms']} ms, p99 {total['p99_ms']} ms, "
+        f"errors {total['error_rate']:.1%}"
+    )
+    print(
+        f"{'tool':>28} {'calls':>7} {'p50 ms':>9} {'p99 ms':>9} {'max ms':>9} {'errors':>7}"
+    )
+    for tool, stats in by_tool.items():
+        print(
+            f"{tool:>28} {stats['calls']:7d} {_fmt(stats['p50_ms'])} "
+            f"{_fmt(stats['p99_ms'])} {_fmt(stats['max_ms'])} {stats['error_rate']:7.1%}"
+        )
+    return {"total": total, "tools": by_tool}
+
+
+def main() -> None:
+    """Run the load test and print a summary."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--transport", choices=["stdio", "http"], default="http")
+    parser.add_argument("--sessions", type=int, default=8)
+    parser.add_argument(
+        "--rate", type=float, default=0, help="calls/s arriving (0: closed loop)"
+    )
+    parser.add_argument("--seconds", type=float, default=30)
+    parser.add_argument("--interval", type=float, default=5)
+    parser.add_argument("--mix", default=DEFAULT_MIX, help="tool=weight,...")
+    parser.add_argument("--years", type=int, nargs=2, default=[2020, 2030])
+    parser.add_argument("--timeout", type=float, default=60)
+    parser.add_argument("--seed", type=int, default=1)
+    parser.add_argument("--url", help="HTTP server to test instead of starting one")
+    parser.add_argument("--port", type=int, default=8870)
+    parser.add_argument(
+        "--server-args", default="", help="extra arguments for started servers"
+    )
+    parser.add_argument("--json", type=Path, help="write the results to this file")
+    args = parser.parse_args()
+
+    server = None
+    if args.transport == "http" and args.url is None:
+        server = start_http_server(args.port, shlex.split(args.server_args))
+        args.url = f"http://127.0.0.1:{args.port}/mcp"
+
+    def pids() -> list[int]:
+        if server is not None:
+            return server_pids(server.pid)
+        if args.transport == "stdio":
+            # The stdio servers are children of this process
+            return server_pids(os.getpid())[1:]
+        return []
+
+    try:
+        recorder = asyncio.run(run_load(args, pids))
+    finally:
+        if server is not None:
+            server.terminate()
+            server.wait(timeout=30)
+
+    summary = print_summary(recorder)
+    if args.json:
+        timeline = [
+            {key: value for key, value in point.items() if key != "_at"}
+            for point in recorder.timeline
+        ]
+        args.json.write_text(
+            json.dumps(
+                {
+                    "settings": vars(args) | {"json": str(args.json)},
+                    "timeline": timeline,
+                    **summary,
+                },
+                indent=2,
+            )
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,78 @@
+#!/usr/bin/env python3
+"""
+Benchmark the packaged lunar month table against zhdate.
+
+Converts every solar day in the table range in both directions, checks that
+both implementations agree and reports per-conversion timings.
+
+Usage:
+    python benchmarks/bench_lunar_table.py
+"""
+
+import time
+from datetime import date, datetime, timedelta
+
+from zhdate import ZhDate
+
+from lunar_mcp_server.lunar_table import LunarMonthTable
+
+LAST_ZHDATE_DAY = date(2100, 12, 31)
+
+
+def main() -> None:
+    """Run the benchmark and print a summary."""
+    started = time.perf_counter()
+    table = LunarMonthTable.from_resource()
+    load_ms = (time.perf_counter() - started) * 1000
+
+    days = [
+        table.min_date + timedelta(days=offset)
+        for offset in range((LAST_ZHDATE_DAY - table.min_date).days + 1)
+    ]
+    datetimes = [datetime.combine(day, datetime.min.time()) for day in days]
+
+    started = time.perf_counter()
+    zh_results = [ZhDate.from_datetime(dt) for dt in datetimes]
+    zh_solar_s = time.perf_counter() - started
+
+    started = time.perf_counter()
+    table_results = [table.solar_to_lunar(day) for day in days]
+    table_solar_s = time.perf_counter() - started
+
+    started = time.perf_counter()
+    for zh in zh_results:
+        ZhDate(zh.lunar_year, zh.lunar_month, zh.lunar_day, zh.leap_month).to_datetime()
+    zh_lunar_s = time.perf_counter() - started
+
+    started = time.perf_counter()
+    for lunar in table_results:
+        table.lunar_to_solar(*lunar)
+    table_lunar_s = time.perf_counter() - started
+
+    mismatches = sum(
+        1
+        for zh, lunar in zip(zh_results, table_results, strict=True)
+        if lunar is None
+        or (zh.lunar_year, zh.lunar_month, zh.lunar_day, zh.leap_month) != tuple(lunar)
+    )
+
+    count = len(days)
+    print(f"Table load: {load_ms:.2f} ms ({table.month_count} months)")
+    print(f"Days compared: {count}, mismatches: {mismatches}")
+    print(
+        f"solar->lunar  zhdate {zh_solar_s / count * 1e6:8.2f} us/call   "
+        f"table {table_solar_s / count * 1e6:6.2f} us/call   "
+        f"speedup {zh_solar_s / table_solar_s:5.1f}x"
+    )
+    print(
+        f"lunar->solar  zhdate {zh_lunar_s / count * 1e6:8.2f} us/call   "
+        f"table {table_lunar_s / count * 1e6:6.2f} us/call   "
+        f"speedup {zh_lunar_s / table_lunar_s:5.1f}x"
+    )
+
+    if mismatches:
+        raise SystemExit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,79 @@
+#!/usr/bin/env python3
+"""
+Benchmark per-day moon phase evaluation against the vectorized phase series
+and the exact phase event finder.
+
+Usage:
+    python benchmarks/bench_moon_phases.py
+"""
+
+import asyncio
+import time
+from datetime import date, timedelta
+
+from lunar_mcp_server.lunar_calculations import LunarCalculator
+
+RANGES = {
+    "month": (date(2024, 1, 1), date(2024, 1, 31)),
+    "year": (date(2024, 1, 1), date(2024, 12, 31)),
+    "10 years": (date(2020, 1, 1), date(2029, 12, 31)),
+}
+
+
+async def per_day(calc: LunarCalculator, start: date, end: date) -> int:
+    """Evaluate a range one get_moon_phase call at a time."""
+    count = 0
+    current = start
+    while current <= end:
+        await calc.get_moon_phase(current.strftime("%Y-%m-%d"))
+        current += timedelta(days=1)
+        count += 1
+    return count
+
+
+async def main() -> None:
+    """Run the benchmark and print a summary."""
+    calc = LunarCalculator()
+    calc.get_phase_series(date(2024, 1, 1), date(2024, 1, 1))  # warm up
+
+    for label, (start, end) in RANGES.items():
+        started = time.perf_counter()
+        await per_day(calc, start, end)
+        per_day_ms = (time.perf_counter() - started) * 1000
+
+        started = time.perf_counter()
+        calc.get_phase_series(start, end)
+        series_ms = (time.perf_counter() - started) * 1000
+
+        print(
+            f"{label:>9}: per-day {per_day_ms:9.1f} ms   "
+            f"series {series_ms:7.2f} ms   speedup {per_day_ms / series_ms:6.1f}x"
+        )
+
+    for label, (start, end) in RANGES.items():
+        fresh = LunarCalculator()
+        fresh.get_phase_series(start, start)
+        started = time.perf_counter()
+        events = fresh.get_phase_events(start, end)
+        cold_ms = (time.perf_counter() - started) * 1000
+        started = time.perf_counter()
+        fresh.get_phase_events(start, end)
+        warm_ms = (time.perf_counter() - started) * 1000
+        print(
+            f"{label:>9}: {len(events):4d} phase events   "
+            f"cold {cold_ms:8.2f} ms   cached {warm_ms:6.3f} ms"
+        )
+
+    for label, coro in {
+        "get_moon_calendar (1 month)": calc.get_moon_calendar(1, 2024),
+        "predict_moon_phases (1 year)": calc.predict_moon_phases(
+            "2024-01-01", "2024-12-31"
+        ),
+    }.items():
+        started = time.perf_counter()
+        await coro
+        print(f"{label}: {(time.perf_counter() - started) * 1000:.2f} ms")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,159 @@
+#!/usr/bin/env python3
+"""
+Benchmark memory and throughput of pre-fork workers against separate
+server processes.
+
+For each worker count N the benchmark starts N independent single-process
+HTTP servers (each on its own port), then one supervisor with N forked
+workers, and measures tools/call throughput with client processes sending
+stateless MCP requests. After the load it reports the resident (RSS) and proportional
+(PSS, shared pages split between the processes sharing them) memory of each
+setup, Linux only.
+
+Usage:
+    python benchmarks/bench_prefork.py [--workers 1 2 4] [--seconds 5]
+"""
+
+import argparse
+import json
+import multiprocessing
+import os
+import signal
+import subprocess
+import sys
+import time
+import urllib.request
+from pathlib import Path
+
+BASE_PORT = 8850
+
+HEADERS = {
+    "Accept": "application/json, text/event-stream",
+    "Content-Type": "application/json",
+}
+
+CALL = {
+    "jsonrpc": "2.0",
+    "id": 1,
+    "method": "tools/call",
+    "params": {"name": "get_daily_fortune", "arguments": {"date": "2024-03-03"}},
+}
+
+
+def start(port: int, workers: int) -> subprocess.Popen[bytes]:
+    """Start a stateless HTTP server and wait until it answers."""
+    process = subprocess.Popen(
+        [
+            sys.executable,
+            "-m",
+            "lunar_mcp_server.server",
+            "--transport",
+            "http",
+            "--stateless",
+            "--port",
+            str(port),
+            "--workers",
+            str(workers),
+        ],
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+        # The result cache would turn the benchmark into a cache benchmark
+        env={**os.environ, "LUNAR_MCP_RESULT_CACHE_TTL": "0"},
+    )
+    deadline = time.monotonic() + 60
+    while time.monotonic() < deadline and process.poll() is None:
+        try:
+            urllib.request.urlopen(f"http://127.0.0.1:{port}/healthz", timeout=1)
+            return process
+        except OSError:
+            time.sleep(0.2)
+    process.kill()
+    raise RuntimeError(f"Server on port {port} did not start")
+
+
+def stop(process: subprocess.Popen[bytes]) -> None:
+    """Stop a server and its workers."""
+    process.send_signal(signal.SIGTERM)
+    process.wait(timeout=30)
+
+
+def memory_kb(pids: list[int]) -> tuple[int, int]:
+    """Total RSS and PSS of processes, in KiB."""
+    rss = pss = 0
+    for pid in pids:
+        for line in Path(f"/proc/{pid}/smaps_rollup").read_text().splitlines():
+            name, _, value = line.partition(":")
+            if name == "Rss":
+                rss += int(value.split()[0])
+            elif name == "Pss":
+                pss += int(value.split()[0])
+    return rss, pss
+
+
+def children(pid: int) -> list[int]:
+    """Child process ids of a process."""
+    text = Path(f"/proc/{pid}/task/{pid}/children").read_text()
+    return [int(child) for child in text.split()]
+
+
+def client(args: tuple[int, float]) -> int:
+    """Send tools/call requests until the deadline, returning the count."""
+    port, deadline = args
+    body = json.dumps(CALL).encode()
+    calls = 0
+    while time.time() < deadline:
+        request = urllib.request.Request(
+            f"http://127.0.0.1:{port}/mcp", data=body, headers=HEADERS
+        )
+        with urllib.request.urlopen(request) as response:
+            response.read()
+        calls += 1
+    return calls
+
+
+def load(ports: list[int], clients: int, seconds: float) -> float:
+    """Spread client processes over servers, returning calls per second."""
+    deadline = time.time() + seconds
+    with multiprocessing.Pool(clients) as pool:
+        work = [(ports[i % len(ports)], deadline) for i in range(clients)]
+        calls = sum(pool.map(client, work))
+    return calls / seconds
+
+
+def main() -> None:
+    """Run the benchmark and print a summary."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--workers", type=int, nargs="+", default=[1, 2, 4])
+    parser.add_argument("--seconds", type=float, default=5)
+    parser.add_argument("--clients", type=int, default=8)
+    args = parser.parse_args()
+
+    print(f"{os.cpu_count()} CPUs")
+    for workers in args.workers:
+        ports = [BASE_PORT + 1 + i for i in range(workers)]
+        separate = [start(port, 1) for port in ports]
+        throughput = load(ports, args.clients, args.seconds)
+        rss, pss = memory_kb([process.pid for process in separate])
+        for process in separate:
+            stop(process)
+        print(
+            f"{workers} separate processes: RSS {rss / 1024:4.0f} MiB, "
+            f"PSS {pss / 1024:4.0f} MiB, {throughput:.0f} calls/s"
+        )
+
+        supervisor = start(BASE_PORT, workers)
+        throughput = load([BASE_PORT], args.clients, args.seconds)
+        # A single worker is served by the main process, without forking
+        pids = children(supervisor.pid) if workers > 1 else [supervisor.pid]
+        rss, pss = memory_kb(sorted({supervisor.pid, *pids}))
+        worker_pss = memory_kb(pids)[1] / len(pids)
+        stop(supervisor)
+        print(
+            f"{workers} pre-fork workers:    RSS {rss / 1024:4.0f} MiB, "
+            f"PSS {pss / 1024:4.0f} MiB, {throughput:.0f} calls/s "
+            f"({worker_pss / 1024:.0f} MiB PSS per worker)"
+        )
+
+
+if __name__ == "__main__":
+    main()
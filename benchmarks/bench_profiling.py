@@ -0,0 +1,76 @@
+#!/usr/bin/env python3
+"""
+Benchmark the overhead of sampled call profiling.
+
+Calls tools through the MCP call_tool handler of servers with profiling
+off and at several sample rates, with the result cache disabled so every
+call is computed, and reports the mean latency per call.
+
+Usage:
+    python benchmarks/bench_profiling.py [--calls 2000] [--rates 0 0.01 1]
+"""
+
+import argparse
+import asyncio
+import tempfile
+import time
+from typing import Any
+
+from mcp.types import CallToolRequest, CallToolRequestParams
+
+from lunar_mcp_server.config import Settings
+from lunar_mcp_server.engine import LunarEngine
+from lunar_mcp_server.server import LunarMCPServer
+
+CALLS = [
+    ("solar_to_lunar", {"solar_date": "2024-02-10"}),
+    ("check_auspicious_date", {"date": "2024-01-15", "activity": "wedding"}),
+]
+
+
+async def mean_latency_ms(
+    rate: float, name: str, arguments: dict[str, Any], calls: int, directory: str
+) -> tuple[float, int]:
+    """Mean latency of sequential calls and the number profiled."""
+    settings = Settings(
+        result_cache_ttl=0, profile_sample_rate=rate, profile_dir=directory
+    )
+    server = LunarMCPServer(LunarEngine(settings))
+    handler = server.server.request_handlers[CallToolRequest]
+    request = CallToolRequest(
+        method="tools/call",
+        params=CallToolRequestParams(name=name, arguments=arguments),
+    )
+    # Warm the ephemeris and caches outside the measurement
+    for _ in range(10):
+        await handler(request)
+    started = time.perf_counter()
+    for _ in range(calls):
+        await handler(request)
+    elapsed_ms = (time.perf_counter() - started) * 1000
+    server.worker_pool.shutdown()
+    profiled = server.profiler.profiled if server.profiler else 0
+    return elapsed_ms / calls, profiled
+
+
+async def main() -> None:
+    """Run the benchmark and print a summary."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--calls", type=int, default=2000)
+    parser.add_argument("--rates", type=float, nargs="+", default=[0, 0.01, 1])
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as directory:
+        for name, arguments in CALLS:
+            for rate in args.rates:
+                latency, profiled = await mean_latency_ms(
+                    rate, name, arguments, args.calls, directory
+                )
+                print(
+                    f"{name:>22} rate={rate:<5g}: {latency:7.3f} ms/call, "
+                    f"{profiled} profiled"
+                )
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,85 @@
+#!/usr/bin/env python3
+"""
+Benchmark a repetitive tool call mix with and without the result cache.
+
+Calls are drawn from a skewed distribution over a few hundred distinct
+dates and tools, as agents asking about today, upcoming weekends and a
+handful of festivals would, and go through the MCP call_tool handler.
+
+Usage:
+    python benchmarks/bench_result_cache.py [--calls 3000] [--seed 1]
+"""
+
+import argparse
+import asyncio
+import random
+import time
+from datetime import date, timedelta
+from typing import Any
+
+from mcp.types import CallToolRequest, CallToolRequestParams
+
+from lunar_mcp_server.config import Settings
+from lunar_mcp_server.engine import LunarEngine
+from lunar_mcp_server.server import LunarMCPServer
+
+
+def workload(calls: int, seed: int) -> list[tuple[str, dict[str, Any]]]:
+    """Draw tool calls with a few popular dates and many rare ones."""
+    rng = random.Random(seed)
+    start = date(2024, 1, 1)
+    result = []
+    for _ in range(calls):
+        day = (start + timedelta(days=int(rng.paretovariate(1.2)) % 365)).isoformat()
+        result.append(
+            rng.choice(
+                [
+                    ("check_auspicious_date", {"date": day, "activity": "wedding"}),
+                    ("get_daily_fortune", {"date": day}),
+                    ("get_moon_phase", {"date": day}),
+                    ("get_lucky_hours", {"date": day, "activity": "travel"}),
+                    ("get_lunar_festivals", {"date": day}),
+                    ("get_zodiac_info", {"date": day}),
+                    ("get_annual_festivals", {"year": 2024}),
+                    ("get_moon_calendar", {"month": int(day[5:7]), "year": 2024}),
+                ]
+            )
+        )
+    return result
+
+
+async def run(ttl: int, calls: list[tuple[str, dict[str, Any]]]) -> LunarMCPServer:
+    """Run the calls against a fresh server, printing the mean latency."""
+    server = LunarMCPServer(LunarEngine(Settings(result_cache_ttl=ttl)))
+    server.lunar_calc.load_ephemeris()
+    handler = server.server.request_handlers[CallToolRequest]
+    started = time.perf_counter()
+    for name, arguments in calls:
+        await handler(
+            CallToolRequest(
+                method="tools/call",
+                params=CallToolRequestParams(name=name, arguments=arguments),
+            )
+        )
+    mean_ms = (time.perf_counter() - started) * 1000 / len(calls)
+    server.worker_pool.shutdown()
+    print(f"result_cache_ttl={ttl:>4}: {mean_ms:.3f} ms per call")
+    return server
+
+
+async def main() -> None:
+    """Run the benchmark and print a summary."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--calls", type=int, default=3000)
+    parser.add_argument("--seed", type=int, default=1)
+    args = parser.parse_args()
+
+    calls = workload(args.calls, args.seed)
+    await run(0, calls)
+    server = await run(3600, calls)
+    if server.result_cache is not None:
+        print(server.result_cache.stats())
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
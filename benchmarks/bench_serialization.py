@@ -0,0 +1,87 @@
+#!/usr/bin/env python3
+"""
+Benchmark serialization of large tool results.
+
+Reports the encoded size and the encoding time of each result with the
+previous encoder (``json.dumps(indent=2)``) and with each serializer from
+``lunar_mcp_server.serialization``.
+
+Usage:
+    python benchmarks/bench_serialization.py [--rounds 50]
+"""
+
+import argparse
+import asyncio
+import json
+import time
+from datetime import date, timedelta
+from typing import Any
+
+from lunar_mcp_server.serialization import Serializer, get_serializer, orjson
+from lunar_mcp_server.server import LunarMCPServer
+
+CALLS: list[tuple[str, dict[str, Any]]] = [
+    ("get_annual_festivals", {"year": 2024}),
+    ("get_moon_calendar", {"month": 3, "year": 2024}),
+    ("predict_moon_phases", {"start_date": "2024-01-01", "end_date": "2024-12-31"}),
+    (
+        "find_good_dates",
+        {
+            "start_date": "2024-01-01",
+            "end_date": "2024-12-31",
+            "activity": "wedding",
+            "limit": 100,
+        },
+    ),
+    (
+        "batch_check_dates",
+        {
+            "dates": [
+                (date(2024, 1, 1) + timedelta(days=offset)).isoformat()
+                for offset in range(0, 500, 2)
+            ],
+            "activity": "wedding",
+        },
+    ),
+]
+
+
+def previous(result: Any) -> str:
+    """The encoder used before serializers were configurable."""
+    return json.dumps(result, indent=2)
+
+
+def time_serializer(serialize: Serializer, result: Any, rounds: int) -> float:
+    """Mean time in ms to encode a result."""
+    started = time.perf_counter()
+    for _ in range(rounds):
+        serialize(result)
+    return (time.perf_counter() - started) * 1000 / rounds
+
+
+async def main() -> None:
+    """Run the benchmark and print a summary."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--rounds", type=int, default=50)
+    args = parser.parse_args()
+
+    serializers: dict[str, Serializer] = {
+        "json indent=2 (previous)": previous,
+        "json compact": get_serializer("json"),
+    }
+    if orjson is not None:
+        serializers["orjson compact (default)"] = get_serializer("orjson")
+        serializers["orjson pretty"] = get_serializer("orjson", pretty=True)
+
+    server = LunarMCPServer()
+    for name, arguments in CALLS:
+        result = await server.tools[name].handler(**arguments)
+        print(name)
+        for label, serialize in serializers.items():
+            size = len(serialize(result).encode())
+            mean_ms = time_serializer(serialize, result, args.rounds)
+            print(f"  {label:>26}: {size:9,d} bytes {mean_ms:8.3f} ms")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
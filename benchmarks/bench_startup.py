@@ -0,0 +1,186 @@
+#!/usr/bin/env python3
+"""
+Benchmark server construction time and memory.
+
+Each mode runs in a fresh interpreter so imports, ephemeris loading and RSS
+are measured from a cold start:
+
+- ``separate``: the previous wiring, where the server, the auspicious date
+  checker and the festival manager each built their own LunarCalculator and
+  CalendarConverter (two ephemeris loads, three converters)
+- ``shared``: ``LunarMCPServer()`` with one shared LunarEngine
+
+It then starts the stdio server the way an MCP client does and measures
+the time from launching the process to the answer of the first
+``tools/list`` request.
+
+With ``--budget-ms`` it also imports the package under ``-X importtime``
+once per run and exits non-zero if the fastest run exceeds the budget,
+listing the slowest modules.
+
+Usage:
+    python benchmarks/bench_startup.py [--runs 5] [--budget-ms 150]
+"""
+
+import argparse
+import json
+import os
+import re
+import statistics
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+PROBE = """
+import json, resource, time
+started = time.perf_counter()
+import lunar_mcp_server.server as server_module
+imported = time.perf_counter()
+if {mode!r} == "separate":
+    from lunar_mcp_server.calendar_conversions import CalendarConverter
+    from lunar_mcp_server.lunar_calculations import LunarCalculator
+    objects = [LunarCalculator(), CalendarConverter()]  # server
+    objects += [LunarCalculator(), CalendarConverter()]  # auspicious checker
+    objects += [CalendarConverter()]  # festival manager
+else:
+    objects = [server_module.LunarMCPServer()]
+built = time.perf_counter()
+with open("/proc/self/statm") as statm:
+    rss_pages = int(statm.read().split()[1])
+print(json.dumps({{
+    "import_ms": (imported - started) * 1000,
+    "construct_ms": (built - imported) * 1000,
+    "rss_mb": rss_pages * resource.getpagesize() / 2**20,
+    "max_rss_mb": resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024,
+}}))
+"""
+
+
+def run_mode(mode: str, runs: int) -> dict[str, float]:
+    """Run one mode several times and return median measurements."""
+    samples = []
+    for _ in range(runs):
+        output = subprocess.run(
+            [sys.executable, "-c", PROBE.format(mode=mode)],
+            check=True,
+            capture_output=True,
+            text=True,
+        ).stdout
+        samples.append(json.loads(output.strip().splitlines()[-1]))
+    return {key: statistics.median(s[key] for s in samples) for key in samples[0]}
+
+
+HANDSHAKE = [
+    {
+        "jsonrpc": "2.0",
+        "id": 1,
+        "method": "initialize",
+        "params": {
+            "protocolVersion": "2025-06-18",
+            "capabilities": {},
+            "clientInfo": {"name": "bench", "version": "1"},
+        },
+    },
+    {"jsonrpc": "2.0", "method": "notifications/initialized"},
+    {"jsonrpc": "2.0", "id": 2, "method": "tools/list"},
+]
+
+
+def first_tools_list_ms() -> float:
+    """Time from starting the stdio server to its first tools/list answer."""
+    started = time.perf_counter()
+    process = subprocess.Popen(
+        [sys.executable, "-m", "lunar_mcp_server.server"],
+        stdin=subprocess.PIPE,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.DEVNULL,
+        text=True,
+    )
+    assert process.stdin is not None and process.stdout is not None
+    process.stdin.write("".join(json.dumps(message) + "\n" for message in HANDSHAKE))
+    process.stdin.flush()
+    for line in process.stdout:
+        if json.loads(line).get("id") == 2:
+            break
+    elapsed = (time.perf_counter() - started) * 1000
+    process.stdin.close()
+    process.wait(timeout=10)
+    return elapsed
+
+
+IMPORT_TIME = re.compile(r"import time:\s+(\d+) \|\s+(\d+) \| ( *)(\S+)")
+
+SRC = Path(__file__).resolve().parent.parent / "src"
+
+
+def package_import_time() -> tuple[float, list[tuple[float, str]]]:
+    """Import the package after the MCP SDK under ``-X importtime``.
+
+    Returns the package's cumulative import time in ms and its ten slowest
+    modules by self time.
+    """
+    env = dict(os.environ)
+    env["PYTHONPATH"] = os.pathsep.join(filter(None, [str(SRC), env.get("PYTHONPATH")]))
+    stderr = subprocess.run(
+        [
+            sys.executable,
+            "-X",
+            "importtime",
+            "-c",
+            "import mcp.server, mcp.types, pydantic; import lunar_mcp_server.server",
+        ],
+        capture_output=True,
+        text=True,
+        env=env,
+        check=True,
+    ).stderr
+    times = [
+        (name, int(own), int(cumulative), len(indent) // 2)
+        for own, cumulative, indent, name in IMPORT_TIME.findall(stderr)
+    ]
+    # importtime lists a module after its imports, so everything after the
+    # last module imported beforehand belongs to the package
+    start = max(
+        index
+        for index, (name, _, _, depth) in enumerate(times)
+        if depth == 0 and not name.startswith("lunar_mcp_server")
+    )
+    package = times[start + 1 :]
+    total_us = sum(cumulative for _, _, cumulative, depth in package if depth == 0)
+    slowest = sorted(package, key=lambda entry: entry[1], reverse=True)[:10]
+    return total_us / 1000, [(own / 1000, name) for name, own, _, _ in slowest]
+
+
+def main() -> None:
+    """Run the benchmark and print a summary."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument(
+        "--budget-ms",
+        type=float,
+        help="fail if importing the package takes longer than this",
+    )
+    args = parser.parse_args()
+
+    results = {mode: run_mode(mode, args.runs) for mode in ("separate", "shared")}
+    print(f"{'mode':>9} {'import ms':>10} {'build ms':>9} {'rss MB':>8} {'max MB':>8}")
+    for mode, result in results.items():
+        print(
+            f"{mode:>9} {result['import_ms']:10.1f} {result['construct_ms']:9.1f} "
+            f"{result['rss_mb']:8.1f} {result['max_rss_mb']:8.1f}"
+        )
+    first_list = statistics.median(first_tools_list_ms() for _ in range(args.runs))
+    print(f"first tools/list over stdio: {first_list:.0f} ms")
+
+    if args.budget_ms is not None:
+        import_ms, slowest = min(package_import_time() for _ in range(args.runs))
+        print(f"package import: {import_ms:.0f} ms (budget {args.budget_ms:.0f} ms)")
+        if import_ms > args.budget_ms:
+            for own_ms, name in slowest:
+                print(f"{own_ms:8.1f} ms {name}")
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
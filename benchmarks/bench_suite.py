@@ -0,0 +1,358 @@
+#!/usr/bin/env python3
+"""
+Benchmark suite covering every tool and the core kernels, with baselines.
+
+Each case times one tool call through the MCP call_tool handler (argument
+validation, the worker pool and result encoding included, result cache
+off) for a representative input: a single date, a month, a year or a
+multi-year range, or a batch of 30 or 300 dates. Paged cases fetch every
+page of a long range conversion. Kernel cases time the
+calculations underneath the tools directly. Every case runs on a warm
+server (ephemeris loaded, caches filled by a first call), calibrated so one
+sample lasts at least ``--min-time`` seconds, and reports the median and
+minimum per-call time of ``--repeat`` samples.
+
+``--save`` writes the results as a JSON baseline. ``--compare`` checks them
+against a baseline and exits with status 1 when a case's fastest sample is
+slower than the baseline's by more than the threshold: ``--threshold`` by
+default, or the per-case value in the baseline's ``thresholds`` map (kept
+when the baseline is saved again). The fastest sample is the one least
+disturbed by other load; slowdowns below ``--min-delta-ms`` are ignored as
+noise. Baselines are machine specific, so compare against one recorded on
+the same quiet hardware, and raise the threshold on shared machines.
+
+Usage:
+    python benchmarks/bench_suite.py [--filter find_good_dates] [--repeat 5]
+    python benchmarks/bench_suite.py --save benchmarks/baseline.json
+    python benchmarks/bench_suite.py --compare benchmarks/baseline.json [--threshold 0.25]
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import platform
+import statistics
+import sys
+import time
+from collections.abc import Awaitable, Callable
+from datetime import date, datetime, timedelta
+from pathlib import Path
+from typing import Any
+
+from mcp.types import CallToolRequest, CallToolRequestParams
+
+from lunar_mcp_server.config import Settings
+from lunar_mcp_server.engine import LunarEngine
+from lunar_mcp_server.server import LunarMCPServer
+from lunar_mcp_server.tools import TOOLS
+
+BASELINE_VERSION = 1
+
+
+def dates(count: int, start: date = date(2024, 1, 1), step: int = 3) -> list[str]:
+    """Spread ``count`` dates from ``start``, ``step`` days apart."""
+    return [(start + timedelta(days=i * step)).isoformat() for i in range(count)]
+
+
+# Case name -> (tool, arguments)
+TOOL_CASES: dict[str, tuple[str, dict[str, Any]]] = {
+    "check_auspicious_date/date": (
+        "check_auspicious_date",
+        {"date": "2024-01-15", "activity": "wedding"},
+    ),
+    "find_good_dates/month": (
+        "find_good_dates",
+        {"start_date": "2024-03-01", "end_date": "2024-03-31", "activity": "wedding"},
+    ),
+    "find_good_dates/year": (
+        "find_good_dates",
+        {"start_date": "2024-01-01", "end_date": "2024-12-31", "activity": "wedding"},
+    ),
+    "find_good_dates/10_years": (
+        "find_good_dates",
+        {
+            "start_date": "2020-01-01",
+            "end_date": "2029-12-31",
+            "activity": "business_opening",
+            "limit": 20,
+        },
+    ),
+    "get_daily_fortune/date": ("get_daily_fortune", {"date": "2024-03-03"}),
+    "check_zodiac_compatibility/pair": (
+        "check_zodiac_compatibility",
+        {"date1": "1988-03-01", "date2": "1990-07-15"},
+    ),
+    "get_lunar_festivals/date": ("get_lunar_festivals", {"date": "2024-02-10"}),
+    "get_next_festival/date": ("get_next_festival", {"date": "2024-03-01"}),
+    "get_festival_details/name": (
+        "get_festival_details",
+        {"festival_name": "Mid-Autumn Festival"},
+    ),
+    "get_annual_festivals/year": ("get_annual_festivals", {"year": 2024}),
+    "get_moon_phase/date": ("get_moon_phase", {"date": "2024-03-25"}),
+    "get_moon_calendar/month": ("get_moon_calendar", {"month": 3, "year": 2024}),
+    "get_moon_influence/date": (
+        "get_moon_influence",
+        {"date": "2024-03-25", "activity": "planting"},
+    ),
+    "predict_moon_phases/month": (
+        "predict_moon_phases",
+        {"start_date": "2024-03-01", "end_date": "2024-03-31"},
+    ),
+    "predict_moon_phases/year": (
+        "predict_moon_phases",
+        {"start_date": "2024-01-01", "end_date": "2024-12-31"},
+    ),
+    "predict_moon_phases/5_years": (
+        "predict_moon_phases",
+        {"start_date": "2020-01-01", "end_date": "2024-12-31"},
+    ),
+    "solar_to_lunar/date": ("solar_to_lunar", {"solar_date": "2024-02-10"}),
+    "lunar_to_solar/date": ("lunar_to_solar", {"lunar_date": "2024-01-01"}),
+    "solar_to_lunar_range/year": (
+        "solar_to_lunar_range",
+        {"start_date": "2024-01-01", "end_date": "2024-12-31"},
+    ),
+    "solar_to_lunar_range/300_dates": (
+        "solar_to_lunar_range",
+        {"dates": dates(300)},
+    ),
+    "lunar_to_solar_range/year": (
+        "lunar_to_solar_range",
+        {"start_lunar_date": "2024-1-1", "end_lunar_date": "2024-12-29"},
+    ),
+    "get_zodiac_info/date": ("get_zodiac_info", {"date": "2024-02-10"}),
+    "batch_check_dates/30_dates": (
+        "batch_check_dates",
+        {"dates": dates(30), "activity": "wedding"},
+    ),
+    "batch_check_dates/300_dates": (
+        "batch_check_dates",
+        {"dates": dates(300), "activity": "wedding"},
+    ),
+    "compare_dates/10_dates": (
+        "compare_dates",
+        {"dates": dates(10, step=7), "activity": "travel"},
+    ),
+    "get_lucky_hours/date": (
+        "get_lucky_hours",
+        {"date": "2024-03-03", "activity": "travel"},
+    ),
+}
+
+
+def kernel_cases(
+    server: LunarMCPServer,
+) -> dict[str, Callable[[], Awaitable[Any]]]:
+    """Case name -> call of a kernel underneath the tools."""
+    checker = server.auspicious_checker
+    day = datetime(2024, 1, 15)
+
+    async def chinese_calendar_info() -> Any:
+        return checker._get_chinese_calendar_info(day)
+
+    async def lunar_table_lookup() -> Any:
+        return server.engine.lunar_table.solar_to_lunar(day.date())
+
+    async def lunar_table_span() -> Any:
+        start = day.toordinal()
+        return list(server.engine.lunar_table.span(start, start + 3653))
+
+    async def moon_phase_series() -> Any:
+        return server.lunar_calc.get_phases_on(
+            [day.date() + timedelta(days=i) for i in range(365)]
+        )
+
+    return {
+        "kernel/_get_chinese_calendar_info": chinese_calendar_info,
+        "kernel/get_moon_phase": lambda: server.lunar_calc.get_moon_phase("2024-03-25"),
+        "kernel/solar_to_lunar": lambda: server.calendar_converter.solar_to_lunar(
+            "2024-02-10"
+        ),
+        "kernel/lunar_table.solar_to_lunar": lunar_table_lookup,
+        "kernel/lunar_table.span_10_years": lunar_table_span,
+        "kernel/get_phases_on_365_days": moon_phase_series,
+    }
+
+
+def paged_cases(server: LunarMCPServer) -> dict[str, Callable[[], Awaitable[Any]]]:
+    """Case name -> call paging through a range tool until its last page."""
+    handler = server.server.request_handlers[CallToolRequest]
+
+    async def solar_to_lunar_ten_years() -> Any:
+        offset: int | None = 0
+        while offset is not None:
+            request = CallToolRequest(
+                method="tools/call",
+                params=CallToolRequestParams(
+                    name="solar_to_lunar_range",
+                    arguments={
+                        "start_date": "2020-01-01",
+                        "end_date": "2029-12-31",
+                        "offset": offset,
+                    },
+                ),
+            )
+            result = await handler(request)
+            offset = json.loads(result.root.content[0].text)["next_offset"]
+        return result
+
+    return {"solar_to_lunar_range/10_years_paged": solar_to_lunar_ten_years}
+
+
+def build_cases(server: LunarMCPServer) -> dict[str, Callable[[], Awaitable[Any]]]:
+    """All cases, checking every tool has at least one."""
+    missing = {tool.name for tool in TOOLS} - {tool for tool, _ in TOOL_CASES.values()}
+    if missing:
+        raise SystemExit(f"No benchmark case for: {', '.join(sorted(missing))}")
+    handler = server.server.request_handlers[CallToolRequest]
+    cases: dict[str, Callable[[], Awaitable[Any]]] = {}
+    for case, (tool, arguments) in TOOL_CASES.items():
+        request = CallToolRequest(
+            method="tools/call",
+            params=CallToolRequestParams(name=tool, arguments=arguments),
+        )
+
+        async def call(request: CallToolRequest = request, case: str = case) -> Any:
+            result = await handler(request)
+            if result.root.isError or '"error"' in result.root.content[0].text:
+                raise RuntimeError(f"{case} failed: {result.root.content[0].text}")
+            return result
+
+        cases[case] = call
+    cases.update(paged_cases(server))
+    cases.update(kernel_cases(server))
+    return cases
+
+
+async def measure(
+    call: Callable[[], Awaitable[Any]], repeat: int, min_time: float
+) -> dict[str, Any]:
+    """Time a warm call, returning per-call median and minimum in ms."""
+    # The first call fills the caches the case depends on
+    await call()
+    loops = 1
+    while True:
+        started = time.perf_counter()
+        for _ in range(loops):
+            await call()
+        elapsed = time.perf_counter() - started
+        if elapsed >= min_time:
+            break
+        loops *= 2 if elapsed * 4 >= min_time else 10
+    samples = [elapsed / loops]
+    for _ in range(repeat - 1):
+        started = time.perf_counter()
+        for _ in range(loops):
+            await call()
+        samples.append((time.perf_counter() - started) / loops)
+    return {
+        "median_ms": round(statistics.median(samples) * 1000, 4),
+        "min_ms": round(min(samples) * 1000, 4),
+        "loops": loops,
+        "repeat": repeat,
+    }
+
+
+def compare(
+    results: dict[str, dict[str, Any]],
+    baseline: dict[str, Any],
+    threshold: float,
+    min_delta_ms: float,
+) -> list[str]:
+    """Print each case against the baseline, returning the regressed cases."""
+    thresholds = baseline.get("thresholds", {})
+    regressions = []
+    for case, result in results.items():
+        base = baseline["results"].get(case)
+        if base is None:
+            print(f"{case:<40} {result['min_ms']:10.4f} ms  (new)")
+            continue
+        limit = thresholds.get(case, threshold)
+        change = result["min_ms"] / base["min_ms"] - 1
+        regressed = change > limit and result["min_ms"] - base["min_ms"] > min_delta_ms
+        print(
+            f"{case:<40} {result['min_ms']:10.4f} ms  "
+            f"baseline {base['min_ms']:10.4f} ms  {change:+7.1%}"
+            f"{'  REGRESSION (limit ' + format(limit, '+.0%') + ')' if regressed else ''}"
+        )
+        if regressed:
+            regressions.append(case)
+    return regressions
+
+
+def machine() -> dict[str, Any]:
+    """Description of the machine the results were recorded on."""
+    return {
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "processor": platform.processor() or platform.machine(),
+        "cpus": os.cpu_count(),
+    }
+
+
+async def main() -> int:
+    """Run the suite, returning the exit status."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--filter", help="only run cases containing this text")
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--min-time", type=float, default=0.05)
+    parser.add_argument("--save", type=Path, help="write the results as a baseline")
+    parser.add_argument("--compare", type=Path, help="baseline to check against")
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=0.25,
+        help="allowed relative slowdown of the fastest sample (default 0.25)",
+    )
+    parser.add_argument(
+        "--min-delta-ms",
+        type=float,
+        default=0.01,
+        help="slowdowns below this many ms never fail (default 0.01)",
+    )
+    args = parser.parse_args()
+
+    server = LunarMCPServer(LunarEngine(Settings(result_cache_ttl=0)))
+    server.lunar_calc.load_ephemeris()
+    cases = build_cases(server)
+    if args.filter:
+        cases = {case: call for case, call in cases.items() if args.filter in case}
+
+    results = {}
+    for case, call in cases.items():
+        results[case] = await measure(call, args.repeat, args.min_time)
+        if not args.compare:
+            result = results[case]
+            print(
+                f"{case:<40} {result['median_ms']:10.4f} ms  "
+                f"(min {result['min_ms']:.4f} ms, {result['loops']} loops)"
+            )
+    server.worker_pool.shutdown()
+
+    status = 0
+    if args.compare:
+        baseline = json.loads(args.compare.read_text())
+        regressions = compare(results, baseline, args.threshold, args.min_delta_ms)
+        if regressions:
+            print(f"{len(regressions)} cases regressed: {', '.join(regressions)}")
+            status = 1
+    if args.save:
+        thresholds = {}
+        if args.save.exists():
+            thresholds = json.loads(args.save.read_text()).get("thresholds", {})
+        baseline = {
+            "version": BASELINE_VERSION,
+            "created": datetime.now().isoformat(timespec="seconds"),
+            "machine": machine(),
+            "thresholds": thresholds,
+            "results": results,
+        }
+        args.save.write_text(json.dumps(baseline, indent=2) + "\n")
+        print(f"Saved {len(results)} cases to {args.save}")
+    return status
+
+
+if __name__ == "__main__":
+    sys.exit(asyncio.run(main()))
@@ -0,0 +1,131 @@
+#!/usr/bin/env python3
+"""
+Benchmark the latency of cheap tools while heavy tools run concurrently.
+
+Heavy clients repeatedly call batch_check_dates on fresh random dates (so
+the day facts must be computed) while a light client calls solar_to_lunar
+and check_zodiac_compatibility on a fixed schedule. Calls go through the MCP call_tool
+handler, once with blocking calculations run inline on the event loop and
+once on the worker pool.
+
+Usage:
+    python benchmarks/bench_tool_latency.py [--seconds 5] [--heavy 4] [--workers 2]
+"""
+
+import argparse
+import asyncio
+import dataclasses
+import random
+import statistics
+import time
+from datetime import date, timedelta
+from typing import Any
+
+from mcp.types import CallToolRequest, CallToolRequestParams
+
+from lunar_mcp_server.config import Settings
+from lunar_mcp_server.engine import LunarEngine
+from lunar_mcp_server.server import LunarMCPServer
+
+LIGHT_CALLS = [
+    ("solar_to_lunar", {"solar_date": "2024-02-10"}),
+    ("check_zodiac_compatibility", {"date1": "1988-03-01", "date2": "1990-07-15"}),
+]
+
+
+async def call_tool(
+    server: LunarMCPServer, name: str, arguments: dict[str, Any]
+) -> None:
+    """Call a tool through the MCP request handler."""
+    handler = server.server.request_handlers[CallToolRequest]
+    await handler(
+        CallToolRequest(
+            method="tools/call",
+            params=CallToolRequestParams(name=name, arguments=arguments),
+        )
+    )
+
+
+async def heavy_client(
+    server: LunarMCPServer, seed: int, deadline: float, dates: int
+) -> int:
+    """Check batches of random dates until the deadline."""
+    rng = random.Random(seed)
+    calls = 0
+    while time.perf_counter() < deadline:
+        batch = [
+            (date(1950, 1, 1) + timedelta(days=rng.randrange(36500))).isoformat()
+            for _ in range(dates)
+        ]
+        await call_tool(
+            server, "batch_check_dates", {"dates": batch, "activity": "wedding"}
+        )
+        calls += 1
+        # Let other requests in between calls, as separate sessions would
+        await asyncio.sleep(0)
+    return calls
+
+
+async def light_client(
+    server: LunarMCPServer, deadline: float, interval: float
+) -> list[float]:
+    """Call cheap tools on a fixed schedule until the deadline.
+
+    Latency runs from the scheduled start, so time spent waiting for a
+    blocked event loop counts.
+    """
+    latencies = []
+    scheduled = time.perf_counter()
+    calls = 0
+    while scheduled < deadline:
+        await asyncio.sleep(max(0.0, scheduled - time.perf_counter()))
+        name, arguments = LIGHT_CALLS[calls % len(LIGHT_CALLS)]
+        await call_tool(server, name, arguments)
+        latencies.append((time.perf_counter() - scheduled) * 1000)
+        calls += 1
+        scheduled += interval
+    return latencies
+
+
+async def run(workers: int, args: argparse.Namespace) -> None:
+    """Run one configuration and print its latency percentiles."""
+    settings = dataclasses.replace(Settings.from_env(), worker_threads=workers)
+    server = LunarMCPServer(LunarEngine(settings))
+    server.lunar_calc.load_ephemeris()
+
+    deadline = time.perf_counter() + args.seconds
+    heavy = [
+        heavy_client(server, seed, deadline, args.dates) for seed in range(args.heavy)
+    ]
+    latencies, *heavy_calls = await asyncio.gather(
+        light_client(server, deadline, args.interval / 1000), *heavy
+    )
+    server.worker_pool.shutdown()
+
+    quantiles = statistics.quantiles(latencies, n=100)
+    label = f"{workers} worker threads" if workers else "inline"
+    print(
+        f"{label:>17}: light p50 {quantiles[49]:7.2f} ms  p99 {quantiles[98]:7.2f} ms"
+        f"  max {max(latencies):7.2f} ms  ({len(latencies)} light calls,"
+        f" {sum(heavy_calls)} heavy calls, pool {server.worker_pool.stats()})"
+    )
+
+
+async def main() -> None:
+    """Run the benchmark and print a summary."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--seconds", type=float, default=5.0)
+    parser.add_argument("--heavy", type=int, default=4)
+    parser.add_argument("--dates", type=int, default=300)
+    parser.add_argument("--workers", type=int, default=2)
+    parser.add_argument(
+        "--interval", type=float, default=5.0, help="ms between light calls"
+    )
+    args = parser.parse_args()
+
+    for workers in (0, args.workers):
+        await run(workers, args)
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -164,9 +164,7 @@ class LunarCalendarDemo:
 
         print("\nMajor festivals:")
         for festival in result.get('major_festivals', [])[:5]:  # Show first 5
-            est_date = festival.get('estimated_date', {})
-            date_str = f"{est_date.get('year', 'N/A')}-{est_date.get('month', 1):02d}-{est_date.get('day', 1):02d}"
-            print(f"  • {festival['name']} - {date_str}")
+            print(f"  • {festival['name']} - {festival['date']}")
 
     async def demo_moon_phases(self):
         """Demo: Moon phase analysis and influence."""
@@ -346,9 +344,7 @@ class LunarCalendarDemo:
         print(f"Islamic festivals in {result['year']}:")
         for festival in result.get('festivals', [])[:5]:
             print(f"  • {festival['name']}")
-            if festival.get('estimated_date'):
-                est_date = festival['estimated_date']
-                print(f"    Estimated: {est_date.get('year')}-{est_date.get('month', 1):02d}-{est_date.get('day', 1):02d}")
+            print(f"    Date: {festival['date']}")
 
     async def run_all_demos(self):
         """Run all demonstration functions."""
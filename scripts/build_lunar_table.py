@@ -0,0 +1,95 @@
+#!/usr/bin/env python3
+"""
+Build the packaged Chinese lunar month table from zhdate.
+
+Walks every solar day zhdate can convert (lunar years 1900-2100), records where
+each lunar month starts and writes a compact per-year summary to
+``src/lunar_mcp_server/data/lunar_months.json``.
+
+Usage:
+    python scripts/build_lunar_table.py
+"""
+
+import json
+from datetime import date, datetime, timedelta
+from pathlib import Path
+
+from zhdate import ZhDate
+
+FIRST_YEAR = 1900
+LAST_YEAR = 2100
+OUTPUT = (
+    Path(__file__).resolve().parent.parent
+    / "src"
+    / "lunar_mcp_server"
+    / "data"
+    / "lunar_months.json"
+)
+
+
+def collect_months() -> list[tuple[date, int, int, bool]]:
+    """Return (start, lunar_year, lunar_month, is_leap) for every lunar month."""
+    months: list[tuple[date, int, int, bool]] = []
+    current = ZhDate(FIRST_YEAR, 1, 1).to_datetime()
+    end = ZhDate(LAST_YEAR, 12, 1).to_datetime()
+
+    while current <= end:
+        lunar = ZhDate.from_datetime(current)
+        if lunar.lunar_day == 1:
+            months.append(
+                (current.date(), lunar.lunar_year, lunar.lunar_month, lunar.leap_month)
+            )
+        current += timedelta(days=1)
+
+    # zhdate cannot convert solar dates past 2100-12-31, so close the final
+    # month from its lunar side instead
+    _, year, month, is_leap = months[-1]
+    last_day = 30 if ZhDate.validate(year, month, 30, is_leap) else 29
+    month_end = ZhDate(year, month, last_day, is_leap).to_datetime().date()
+    months.append((month_end + timedelta(days=1), LAST_YEAR + 1, 1, False))
+    return months
+
+
+def build_table() -> dict[str, object]:
+    """Summarise month starts into (leap_month, length bitmask) per lunar year."""
+    months = collect_months()
+    years: list[list[int]] = []
+
+    for year in range(FIRST_YEAR, LAST_YEAR + 1):
+        leap_month = 0
+        length_bits = 0
+        year_months = [
+            (index, start, month, is_leap)
+            for index, (start, lunar_year, month, is_leap) in enumerate(months[:-1])
+            if lunar_year == year
+        ]
+        for position, (index, start, month, is_leap) in enumerate(year_months):
+            length = (months[index + 1][0] - start).days
+            if length not in (29, 30):
+                raise ValueError(f"Unexpected month length {length} in {year}")
+            if length == 30:
+                length_bits |= 1 << position
+            if is_leap:
+                leap_month = month
+        years.append([leap_month, length_bits])
+
+    return {
+        "source": "zhdate",
+        "first_year": FIRST_YEAR,
+        "first_new_year": months[0][0].isoformat(),
+        "years": years,
+    }
+
+
+def main() -> None:
+    """Write the table to the package data directory."""
+    started = datetime.now()
+    table = build_table()
+    OUTPUT.parent.mkdir(parents=True, exist_ok=True)
+    OUTPUT.write_text(json.dumps(table, separators=(",", ":")) + "\n", encoding="utf-8")
+    elapsed = (datetime.now() - started).total_seconds()
+    print(f"Wrote {len(table['years'])} lunar years to {OUTPUT} in {elapsed:.1f}s")
+
+
+if __name__ == "__main__":
+    main()
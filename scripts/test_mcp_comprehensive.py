@@ -210,6 +210,8 @@ class MCPTester:
                 ("predict_moon_phases", {"start_date": "2024-01-01", "end_date": "2024-01-31"}, "Predict moon phases in range"),
                 ("solar_to_lunar", {"solar_date": "2024-01-01", "culture": "chinese"}, "Convert solar to lunar date"),
                 ("lunar_to_solar", {"lunar_date": "2024-01-01", "culture": "chinese"}, "Convert lunar to solar date"),
+                ("solar_to_lunar_range", {"start_date": "2024-01-01", "end_date": "2024-12-31"}, "Convert solar date range to lunar"),
+                ("lunar_to_solar_range", {"start_lunar_date": "2024-1-1", "end_lunar_date": "2024-12-29"}, "Convert lunar date range to solar"),
                 ("get_zodiac_info", {"date": "1990-01-01", "culture": "chinese"}, "Get zodiac information"),
             ]
 
@@ -167,11 +167,13 @@ echo -e "  ${BLUE}Moon/Lunar summary: ${GREEN}$MOON_PASS${NC}/$MOON_TOTAL passed
 # Test Calendar Conversion tools
 echo -e "\n${YELLOW}Testing Calendar Conversion tools:${NC}"
 CONVERSION_PASS=0
-CONVERSION_TOTAL=3
+CONVERSION_TOTAL=5
 
 test_single_tool "solar_to_lunar" '{"solar_date":"2024-01-01","culture":"chinese"}' "Convert solar to lunar" && CONVERSION_PASS=$((CONVERSION_PASS + 1))
 test_single_tool "lunar_to_solar" '{"lunar_date":"2024-01-01","culture":"chinese"}' "Convert lunar to solar" && CONVERSION_PASS=$((CONVERSION_PASS + 1))
 test_single_tool "get_zodiac_info" '{"date":"1990-01-01","culture":"chinese"}' "Get zodiac info" && CONVERSION_PASS=$((CONVERSION_PASS + 1))
+test_single_tool "solar_to_lunar_range" '{"start_date":"2024-01-01","end_date":"2024-12-31"}' "Convert solar range to lunar" && CONVERSION_PASS=$((CONVERSION_PASS + 1))
+test_single_tool "lunar_to_solar_range" '{"start_lunar_date":"2024-1-1","end_lunar_date":"2024-12-29"}' "Convert lunar range to solar" && CONVERSION_PASS=$((CONVERSION_PASS + 1))
 
 echo -e "  ${BLUE}Calendar Conversion summary: ${GREEN}$CONVERSION_PASS${NC}/$CONVERSION_TOTAL passed${NC}"
 
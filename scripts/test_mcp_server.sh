@@ -1,7 +1,7 @@
 #!/bin/bash
 #
 # MCP Server Test Script (FIFO-based)
-# Tests all 18 MCP tools using FIFO pipes for STDIO communication
+# Tests all 20 MCP tools using FIFO pipes for STDIO communication
 #
 # NOTE: For more comprehensive testing with better error handling,
 # consider using test_mcp_final.sh instead. This script uses FIFOs
@@ -231,6 +231,12 @@ test_tool "compare_dates" '{"dates":["2024-01-01","2024-01-15"],"activity":"wedd
 # Test 18: Get lucky hours
 test_tool "get_lucky_hours" '{"date":"2024-01-01","activity":"signing_contract","culture":"chinese"}' "Get lucky hours for the day"
 
+# Test 19: Solar range to lunar conversion
+test_tool "solar_to_lunar_range" '{"start_date":"2024-01-01","end_date":"2024-12-31"}' "Convert a solar date range to lunar dates"
+
+# Test 20: Lunar range to solar conversion
+test_tool "lunar_to_solar_range" '{"start_lunar_date":"2024-1-1","end_lunar_date":"2024-12-29"}' "Convert a lunar date range to solar dates"
+
 # Test list tools capability
 echo -e "${BLUE}Testing list tools capability...${NC}"
 TEST_COUNT=$((TEST_COUNT + 1))
@@ -245,11 +251,11 @@ if [ -n "$list_response" ] && echo "$list_response" | grep -q '"tools"'; then
     tool_count=$(echo "$list_response" | grep -o '"name":' | wc -l)
     echo "  Found $tool_count tools"
 
-    # Verify we have all 18 tools
-    if [ "$tool_count" -eq 18 ]; then
-        echo -e "  ${GREEN}✅ All 18 tools are present${NC}"
+    # Verify we have all 20 tools
+    if [ "$tool_count" -eq 20 ]; then
+        echo -e "  ${GREEN}✅ All 20 tools are present${NC}"
     else
-        echo -e "  ${YELLOW}⚠️  Expected 18 tools, but found $tool_count${NC}"
+        echo -e "  ${YELLOW}⚠️  Expected 20 tools, but found $tool_count${NC}"
     fi
 else
     echo -e "${RED}  ❌ FAIL: List tools failed${NC}"
@@ -257,6 +263,6 @@ else
 fi
 
 echo -e "${BLUE}All tests completed!${NC}"
-echo -e "${BLUE}Tested 18 MCP tools + list tools capability${NC}"
+echo -e "${BLUE}Tested 20 MCP tools + list tools capability${NC}"
 
 # Cleanup will be called by the trap
\ No newline at end of file
@@ -2,97 +2,100 @@
 Traditional auspicious date checking and fortune calculation.
 """
 
-from datetime import datetime, timedelta
+import heapq
+from collections.abc import Iterable
+from datetime import date, datetime, timedelta
 from typing import Any
 
-from .calendar_conversions import CalendarConverter
-from .lunar_calculations import LunarCalculator
+from .day_facts import (
+    CYCLE_DAYS,
+    CYCLE_EPOCH,
+    EARTHLY_BRANCHES,
+    FIVE_ELEMENTS,
+    HEAVENLY_STEMS,
+    LUNAR_MANSIONS,
+    ZODIAC_ANIMALS,
+    day_cycle,
+)
+from .engine import LunarEngine, get_engine
+from .projection import Projection
+
+# Elements of the day earning a bonus for an activity
+ELEMENT_BONUS = {
+    "wedding": ["Fire", "Earth"],
+    "business_opening": ["Metal", "Water"],
+    "construction": ["Earth", "Metal"],
+}
+
+# Zodiac animals of the day favoring an activity
+FAVORABLE_ANIMALS = {
+    "wedding": ["Dragon", "Rooster", "Rabbit"],
+    "business_opening": ["Dragon", "Tiger", "Horse"],
+    "travel": ["Horse", "Monkey", "Rooster"],
+    "moving": ["Dragon", "Snake", "Pig"],
+    "medical": ["Rabbit", "Ox", "Dog"],
+}
+
+# Result keys of ``check_date``, selectable through its ``fields`` argument
+CHECK_DATE_FIELDS = (
+    "date",
+    "lunar_date",
+    "auspicious_level",
+    "score",
+    "good_for",
+    "avoid",
+    "lucky_hours",
+    "zodiac_day",
+    "five_elements",
+    "lunar_mansion",
+    "moon_phase",
+    "moon_influence",
+    "recommendations",
+    "calculation_factors",
+    "explanation",
+    "reasoning",
+    "better_alternatives",
+)
+
+# Result keys of ``get_daily_fortune``
+DAILY_FORTUNE_FIELDS = (
+    "date",
+    "culture",
+    "fortune_level",
+    "fortune_score",
+    "description",
+    "zodiac_day",
+    "five_element",
+    "lunar_mansion",
+    "moon_phase",
+    "lucky_colors",
+    "lucky_numbers",
+    "lucky_directions",
+    "advice",
+)
 
 
 class AuspiciousDateChecker:
     """Checker for auspicious dates based on traditional calendars."""
 
-    def __init__(self) -> None:
+    def __init__(self, engine: LunarEngine | None = None) -> None:
         """Initialize the auspicious date checker."""
-        self.lunar_calc = LunarCalculator()
-        self.calendar_converter = CalendarConverter()
+        self.engine = engine or get_engine()
+        self.lunar_calc = self.engine.lunar_calc
+        self.calendar_converter = self.engine.calendar_converter
+        # Keyed by activity, or None for activities no scoring rule names
+        self._score_cycles: dict[str | None, list[int]] = {}
         self._load_traditional_data()
 
     def _load_traditional_data(self) -> None:
         """Load traditional auspicious date rules and data."""
         # Traditional Chinese Tong Shu (almanac) data
         self.chinese_rules = {
-            "heavenly_stems": [
-                "甲",
-                "乙",
-                "丙",
-                "丁",
-                "戊",
-                "己",
-                "庚",
-                "辛",
-                "壬",
-                "癸",
-            ],
-            "earthly_branches": [
-                "子",
-                "丑",
-                "寅",
-                "卯",
-                "辰",
-                "巳",
-                "午",
-                "未",
-                "申",
-                "酉",
-                "戌",
-                "亥",
-            ],
-            "zodiac_animals": [
-                "Rat",
-                "Ox",
-                "Tiger",
-                "Rabbit",
-                "Dragon",
-                "Snake",
-                "Horse",
-                "Goat",
-                "Monkey",
-                "Rooster",
-                "Dog",
-                "Pig",
-            ],
-            "five_elements": ["Wood", "Fire", "Earth", "Metal", "Water"],
-            "lunar_mansions": [
-                "角",
-                "亢",
-                "氐",
-                "房",
-                "心",
-                "尾",
-                "箕",  # Eastern Azure Dragon
-                "斗",
-                "牛",
-                "女",
-                "虛",
-                "危",
-                "室",
-                "壁",  # Northern Black Tortoise
-                "奎",
-                "婁",
-                "胃",
-                "昴",
-                "畢",
-                "觜",
-                "參",  # Western White Tiger
-                "井",
-                "鬼",
-                "柳",
-                "星",
-                "張",
-                "翼",
-                "軫",  # Southern Vermilion Bird
-            ],
+            "heavenly_stems": HEAVENLY_STEMS,
+            "earthly_branches": EARTHLY_BRANCHES,
+            "zodiac_animals": ZODIAC_ANIMALS,
+            "five_elements": FIVE_ELEMENTS,
+            "lunar_mansions": LUNAR_MANSIONS,
         }
 
         # Activity recommendations by lunar mansion
@@ -112,6 +115,17 @@ class AuspiciousDateChecker:
             "箕": {"good": ["demolition", "cleaning"], "bad": ["wedding", "opening"]},
         }
 
+        # Activities named by a scoring rule; all others score alike
+        self._scored_activities = frozenset(
+            [
+                activity
+                for rules in self.mansion_activities.values()
+                for activity in rules["good"] + rules["bad"]
+            ]
+            + list(ELEMENT_BONUS)
+            + list(FAVORABLE_ANIMALS)
+        )
+
         # Lucky hours by zodiac animal
         self.zodiac_hours = {
             "Rat": ["23:00-01:00"],
@@ -164,35 +178,19 @@ class AuspiciousDateChecker:
 
     def _get_chinese_calendar_info(self, date_obj: datetime) -> dict[str, Any]:
         """Get Chinese calendar information for a date."""
-        # Calculate days since a known reference date
-        reference_date = datetime(1900, 1, 31)  # Reference Chinese New Year
-        days_diff = (date_obj - reference_date).days
-
-        # Calculate sexagenary cycle (60-day cycle)
-        stem_index = days_diff % 10
-        branch_index = days_diff % 12
-
-        # Calculate lunar mansion (simplified)
-        mansion_index = days_diff % 28
-
-        # Calculate five elements for the day
-        element_index = stem_index % 5
+        cycle = day_cycle(date_obj.toordinal())
 
         # Calculate zodiac year animal
-        year_diff = date_obj.year - 1900
-        zodiac_year_index = year_diff % 12
-
-        # Calculate zodiac day animal
-        zodiac_day_index = days_diff % 12
+        zodiac_year_index = (date_obj.year - 1900) % 12
 
         return {
-            "heavenly_stem": self.chinese_rules["heavenly_stems"][stem_index],
-            "earthly_branch": self.chinese_rules["earthly_branches"][branch_index],
-            "lunar_mansion": self.chinese_rules["lunar_mansions"][mansion_index],
-            "five_element": self.chinese_rules["five_elements"][element_index],
-            "zodiac_year": self.chinese_rules["zodiac_animals"][zodiac_year_index],
-            "zodiac_day": self.chinese_rules["zodiac_animals"][zodiac_day_index],
-            "sexagenary_day": days_diff % 60,
+            "heavenly_stem": cycle.stem,
+            "earthly_branch": cycle.branch,
+            "lunar_mansion": cycle.mansion,
+            "five_element": cycle.element,
+            "zodiac_year": ZODIAC_ANIMALS[zodiac_year_index],
+            "zodiac_day": cycle.zodiac_day,
+            "sexagenary_day": cycle.sexagenary_day,
         }
 
     def _calculate_auspiciousness(
@@ -200,10 +198,29 @@ class AuspiciousDateChecker:
     ) -> dict[str, Any]:
         """Calculate auspiciousness level for a date and activity."""
         chinese_info = self._get_chinese_calendar_info(date_obj)
-        lunar_mansion = chinese_info["lunar_mansion"]
-        five_element = chinese_info["five_element"]
-        zodiac_day = chinese_info["zodiac_day"]
+        base_score, element_bonus, zodiac_bonus = self._score_factors(
+            chinese_info["lunar_mansion"],
+            chinese_info["five_element"],
+            chinese_info["zodiac_day"],
+            activity,
+        )
+        final_score = min(10, base_score + element_bonus + zodiac_bonus)
 
+        return {
+            "score": final_score,
+            "level": self._score_level(final_score),
+            "chinese_info": chinese_info,
+            "factors": {
+                "lunar_mansion_effect": base_score,
+                "five_element_bonus": element_bonus,
+                "zodiac_bonus": zodiac_bonus,
+            },
+        }
+
+    def _score_factors(
+        self, lunar_mansion: str, five_element: str, zodiac_day: str, activity: str
+    ) -> tuple[int, int, int]:
+        """Score a day's mansion, element and zodiac animal for an activity."""
         # Base auspiciousness from lunar mansion
         mansion_data = self.mansion_activities.get(
             lunar_mansion, {"good": [], "bad": []}
@@ -218,50 +235,55 @@ class AuspiciousDateChecker:
 
         # Adjust based on five elements
         element_bonus = 0
-        if activity == "wedding" and five_element in ["Fire", "Earth"]:
-            element_bonus = 2
-        elif activity == "business_opening" and five_element in ["Metal", "Water"]:
-            element_bonus = 2
-        elif activity == "construction" and five_element in ["Earth", "Metal"]:
+        if five_element in ELEMENT_BONUS.get(activity, []):
             element_bonus = 2
 
         # Adjust based on zodiac animal
         zodiac_bonus = 0
-        favorable_animals = {
-            "wedding": ["Dragon", "Rooster", "Rabbit"],
-            "business_opening": ["Dragon", "Tiger", "Horse"],
-            "travel": ["Horse", "Monkey", "Rooster"],
-            "moving": ["Dragon", "Snake", "Pig"],
-            "medical": ["Rabbit", "Ox", "Dog"],
-        }
-
-        if zodiac_day in favorable_animals.get(activity, []):
+        if zodiac_day in FAVORABLE_ANIMALS.get(activity, []):
             zodiac_bonus = 1
 
-        final_score = min(10, base_score + element_bonus + zodiac_bonus)
-
-        # Convert score to level
-        if final_score >= 9:
-            level = "very_good"
-        elif final_score >= 7:
-            level = "good"
-        elif final_score >= 5:
-            level = "neutral"
-        elif final_score >= 3:
-            level = "poor"
+        return base_score, element_bonus, zodiac_bonus
+
+    def _score_level(self, score: int) -> str:
+        """Convert a score to an auspiciousness level."""
+        if score >= 9:
+            return "very_good"
+        elif score >= 7:
+            return "good"
+        elif score >= 5:
+            return "neutral"
+        elif score >= 3:
+            return "poor"
         else:
-            level = "very_poor"
-
-        return {
-            "score": final_score,
-            "level": level,
-            "chinese_info": chinese_info,
-            "factors": {
-                "lunar_mansion_effect": base_score,
-                "five_element_bonus": element_bonus,
-                "zodiac_bonus": zodiac_bonus,
-            },
-        }
+            return "very_poor"
+
+    def _score_cycle(self, activity: str) -> list[int]:
+        """Get the scores of one full day cycle for an activity.
+
+        Scores depend only on the mansion, element and zodiac animal of a
+        day, so they repeat every ``CYCLE_DAYS`` days from ``CYCLE_EPOCH``.
+        Activities no rule names share one cycle, so the cache stays bounded.
+        """
+        key = activity if activity in self._scored_activities else None
+        cycle = self._score_cycles.get(key)
+        if cycle is None:
+            cycle = [
+                min(
+                    10,
+                    sum(
+                        self._score_factors(
+                            LUNAR_MANSIONS[offset % 28],
+                            FIVE_ELEMENTS[offset % 10 % 5],
+                            ZODIAC_ANIMALS[offset % 12],
+                            activity,
+                        )
+                    ),
+                )
+                for offset in range(CYCLE_DAYS)
+            ]
+            self._score_cycles[key] = cycle
+        return cycle
 
     async def check_date(
         self,
@@ -269,13 +291,23 @@ class AuspiciousDateChecker:
         activity: str,
         culture: str = "chinese",
         find_alternatives: bool = True,
+        fields: Iterable[str] | None = None,
     ) -> dict[str, Any]:
-        """Check if a date is auspicious for an activity."""
+        """Check if a date is auspicious for an activity.
+
+        ``fields`` limits the result to the named keys (``CHECK_DATE_FIELDS``);
+        the sections behind other keys are not computed.
+        """
         try:
+            projection = Projection(fields, CHECK_DATE_FIELDS, always=("date",))
             date_obj = datetime.strptime(date_str, "%Y-%m-%d")
 
             # Get moon phase information
-            moon_data = await self.lunar_calc.get_moon_phase(date_str)
+            moon_data = None
+            if projection.wants(
+                "moon_phase", "moon_influence", "explanation", "reasoning"
+            ):
+                moon_data = self._describe_moon(date_obj)
 
             # Calculate auspiciousness
             if culture == "chinese":
@@ -312,71 +344,112 @@ class AuspiciousDateChecker:
                 good_activities = ["routine activities", "daily tasks"]
                 avoid_activities = ["high-risk activities"]
 
-            # Convert lunar date using calendar converter when possible
-            lunar_date = "Unknown"
-            try:
-                lunar_info = await self.calendar_converter.solar_to_lunar(
-                    date_str, culture
-                )
-            except Exception:
-                lunar_info = {"error": "conversion failed"}
-
-            if isinstance(lunar_info, dict) and "error" not in lunar_info:
-                if culture == "chinese":
-                    lunar_year = lunar_info.get("lunar_year")
-                    lunar_month = lunar_info.get("lunar_month")
-                    lunar_day = lunar_info.get("lunar_day")
-                    lunar_date = lunar_info.get("lunar_date_string") or "-".join(
-                        str(part)
-                        for part in (lunar_year, lunar_month, lunar_day)
-                        if part is not None
-                    )
-
-            if not lunar_date or lunar_date == "Unknown":
-                lunar_day = moon_data.get("lunar_day")
-                lunar_date = (
-                    f"{date_obj.year}-{lunar_day}"
-                    if lunar_day is not None
-                    else date_str
+            lunar_date = None
+            if projection.wants("lunar_date"):
+                lunar_date = await self._lunar_date_string(
+                    date_obj, date_str, culture, moon_data
                 )
 
             # Generate detailed explanation
-            explanation = self._generate_explanation(
-                auspiciousness, chinese_info, moon_data, activity
-            )
+            explanation = None
+            if moon_data is not None and projection.wants("explanation", "reasoning"):
+                explanation = self._generate_explanation(
+                    auspiciousness, chinese_info, moon_data, activity
+                )
 
             # Find alternative dates if score is low (and alternatives are requested)
             alternatives = []
-            if find_alternatives and auspiciousness["score"] < 7:
+            if (
+                find_alternatives
+                and auspiciousness["score"] < 7
+                and projection.wants("better_alternatives")
+            ):
                 alternatives = await self._find_alternative_dates(
                     date_obj, activity, culture
                 )
 
-            return {
-                "date": date_str,
-                "lunar_date": lunar_date,
-                "auspicious_level": auspiciousness["level"],
-                "score": auspiciousness["score"],
-                "good_for": good_activities,
-                "avoid": avoid_activities,
-                "lucky_hours": lucky_hours,
-                "zodiac_day": zodiac_day,
-                "five_elements": chinese_info.get("five_element", "Unknown"),
-                "lunar_mansion": chinese_info.get("lunar_mansion", "Unknown"),
-                "moon_phase": moon_data.get("phase_name", "Unknown"),
-                "moon_influence": moon_data.get("influence", {}),
-                "recommendations": self._generate_recommendations(
-                    auspiciousness, activity
-                ),
-                "calculation_factors": auspiciousness.get("factors", {}),
-                "explanation": explanation["summary"],
-                "reasoning": explanation["reasoning"],
-                "better_alternatives": alternatives if alternatives else None,
-            }
+            return projection.apply(
+                {
+                    "date": date_str,
+                    "lunar_date": lunar_date,
+                    "auspicious_level": auspiciousness["level"],
+                    "score": auspiciousness["score"],
+                    "good_for": good_activities,
+                    "avoid": avoid_activities,
+                    "lucky_hours": lucky_hours,
+                    "zodiac_day": zodiac_day,
+                    "five_elements": chinese_info.get("five_element", "Unknown"),
+                    "lunar_mansion": chinese_info.get("lunar_mansion", "Unknown"),
+                    "moon_phase": (moon_data or {}).get("phase_name", "Unknown"),
+                    "moon_influence": (moon_data or {}).get("influence", {}),
+                    "recommendations": (
+                        self._generate_recommendations(auspiciousness, activity)
+                        if projection.wants("recommendations")
+                        else None
+                    ),
+                    "calculation_factors": auspiciousness.get("factors", {}),
+                    "explanation": explanation["summary"] if explanation else None,
+                    "reasoning": explanation["reasoning"] if explanation else None,
+                    "better_alternatives": alternatives if alternatives else None,
+                }
+            )
 
         except Exception as e:
             return {"error": f"Failed to check auspicious date: {str(e)}"}
 
+    def _describe_moon(self, date_obj: datetime) -> dict[str, Any]:
+        """Describe the moon phase of a date from its cached facts."""
+        facts = self.engine.day_facts(date_obj.date())
+        return self.lunar_calc.describe_moon_phase(
+            date_obj, facts.illumination, facts.phase_angle
+        )
+
+    async def _lunar_date_string(
+        self,
+        date_obj: datetime,
+        date_str: str,
+        culture: str,
+        moon_data: dict[str, Any] | None = None,
+    ) -> str:
+        """Format the lunar date of a date for ``check_date``.
+
+        Uses the lunar month table, then the calendar converter, and as a last
+        resort the lunar day of the moon phase.
+        """
+        lunar = (
+            self.engine.lunar_table.from_ordinal(date_obj.toordinal())
+            if culture == "chinese"
+            else None
+        )
+        if lunar is not None:
+            return f"{lunar.year}-{lunar.month}-{lunar.day}"
+
+        lunar_date = "Unknown"
+        try:
+            lunar_info = await self.calendar_converter.solar_to_lunar(date_str, culture)
+        except Exception:
+            lunar_info = {"error": "conversion failed"}
+
+        if isinstance(lunar_info, dict) and "error" not in lunar_info:
+            if culture == "chinese":
+                lunar_year = lunar_info.get("lunar_year")
+                lunar_month = lunar_info.get("lunar_month")
+                lunar_day = lunar_info.get("lunar_day")
+                lunar_date = lunar_info.get("lunar_date_string") or "-".join(
+                    str(part)
+                    for part in (lunar_year, lunar_month, lunar_day)
+                    if part is not None
+                )
+
+        if not lunar_date or lunar_date == "Unknown":
+            if moon_data is None:
+                moon_data = self._describe_moon(date_obj)
+            lunar_day = moon_data.get("lunar_day")
+            lunar_date = (
+                f"{date_obj.year}-{lunar_day}" if lunar_day is not None else date_str
+            )
+        return lunar_date
+
     def _generate_recommendations(
         self, auspiciousness: dict[str, Any], activity: str
     ) -> str:
@@ -494,69 +567,118 @@ class AuspiciousDateChecker:
             },
         }
 
+    async def check_dates(
+        self, date_strs: list[str], activity: str, culture: str = "chinese"
+    ) -> dict[str, dict[str, Any]]:
+        """Check many dates, returning each distinct date's ``check_date`` result.
+
+        Dates are checked in chronological order. Before each chunk, the facts
+        for its dates and for the alternative windows of its poor dates are
+        built in one vectorized pass, sized to stay in the day facts cache.
+        """
+        results: dict[str, dict[str, Any]] = {}
+        parsed: dict[str, date] = {}
+        for date_str in dict.fromkeys(date_strs):
+            try:
+                parsed[date_str] = datetime.strptime(date_str, "%Y-%m-%d").date()
+            except ValueError:
+                # check_date reports the invalid date
+                results[date_str] = await self.check_date(date_str, activity, culture)
+
+        window = self.engine.settings.alternative_window_days
+        cycle = self._score_cycle(activity) if culture == "chinese" else None
+        budget = max(1, self.engine.day_facts_cache.maxsize // 2)
+        chunk: list[str] = []
+        needed: set[int] = set()
+        for date_str in sorted(parsed, key=parsed.__getitem__):
+            ordinal = parsed[date_str].toordinal()
+            day_needs = {ordinal}
+            if cycle is not None and cycle[(ordinal - CYCLE_EPOCH) % CYCLE_DAYS] < 7:
+                day_needs.update(range(ordinal - window, ordinal + window + 1))
+            if chunk and len(needed | day_needs) > budget:
+                await self._check_chunk(chunk, needed, activity, culture, results)
+                chunk, needed = [], set()
+            chunk.append(date_str)
+            needed |= day_needs
+        if chunk:
+            await self._check_chunk(chunk, needed, activity, culture, results)
+
+        return results
+
+    async def _check_chunk(
+        self,
+        date_strs: list[str],
+        ordinals: set[int],
+        activity: str,
+        culture: str,
+        results: dict[str, dict[str, Any]],
+    ) -> None:
+        """Build the facts a chunk of dates needs, then check each date."""
+        self.engine.day_facts_many([date.fromordinal(o) for o in sorted(ordinals)])
+        for date_str in date_strs:
+            results[date_str] = await self.check_date(date_str, activity, culture)
+
     async def _find_alternative_dates(
         self,
         reference_date: datetime,
         activity: str,
         culture: str,
-        days_to_check: int = 14,
+        days_to_check: int | None = None,
+        count: int | None = None,
     ) -> list[dict[str, Any]]:
-        """Find better alternative dates near the reference date."""
-        alternatives = []
-
-        # Check dates within 2 weeks before and after
-        for offset in range(1, days_to_check + 1):
-            for direction in [1, -1]:  # Forward and backward
-                check_date = reference_date + timedelta(days=offset * direction)
-                date_str = check_date.strftime("%Y-%m-%d")
-
-                try:
-                    # Prevent recursive alternative searches
-                    result = await self.check_date(
-                        date_str, activity, culture, find_alternatives=False
-                    )
-
-                    # Only include dates with score >= 7
-                    if result.get("score", 0) >= 7:
-                        # Generate reason for being better
-                        reason_parts = []
-                        if result.get("zodiac_day"):
-                            reason_parts.append(f"{result['zodiac_day']} day")
-                        if result.get("five_elements"):
-                            reason_parts.append(f"{result['five_elements']} element")
-                        if result.get("moon_phase"):
-                            reason_parts.append(f"{result['moon_phase']}")
-
-                        reason = (
-                            ", ".join(reason_parts)
-                            if reason_parts
-                            else "favorable traditional factors"
-                        )
-
-                        alternatives.append(
-                            {
-                                "date": date_str,
-                                "score": result.get("score", 0),
-                                "level": result.get("auspicious_level", "unknown"),
-                                "reason": reason,
-                                "days_away": offset * direction,
-                            }
-                        )
-
-                except Exception:
-                    continue
-
-                # Stop after finding 3 good alternatives
-                if len(alternatives) >= 3:
-                    break
-
-            if len(alternatives) >= 3:
+        """Find better alternative dates near the reference date.
+
+        Neighbors are scored from the precomputed score cycle, nearest first
+        (later before earlier), and the first ``count`` good ones are kept.
+        """
+        settings = self.engine.settings
+        if days_to_check is None:
+            days_to_check = settings.alternative_window_days
+        if count is None:
+            count = settings.alternative_count
+
+        # Only the Chinese tradition scores above neutral
+        if culture != "chinese" or count <= 0:
+            return []
+
+        cycle = self._score_cycle(activity)
+        reference = reference_date.date()
+        offset = reference.toordinal() - CYCLE_EPOCH
+
+        candidates: list[tuple[int, int]] = []
+        for distance in range(1, days_to_check + 1):
+            for days_away in (distance, -distance):  # Forward and backward
+                score = cycle[(offset + days_away) % CYCLE_DAYS]
+                # Only include dates with score >= 7
+                if score >= 7:
+                    candidates.append((score, days_away))
+            if len(candidates) >= count:
                 break
 
-        # Sort by score (highest first)
-        alternatives.sort(key=lambda x: x["score"], reverse=True)
-
-        return alternatives[:3]  # Return top 3
+        # Both directions of the last distance may have qualified; the best
+        # scores come first, nearest first among equal scores
+        candidates = sorted(candidates[:count], key=lambda c: c[0], reverse=True)
+        # Facts for the whole window are built together, so consecutive
+        # requests for nearby dates find their neighbors cached
+        window = self.engine.day_facts_range(
+            reference - timedelta(days=days_to_check),
+            reference + timedelta(days=days_to_check),
+        )
+        neighbors = [window[days_to_check + days_away] for _, days_away in candidates]
+
+        return [
+            {
+                "date": facts.date.strftime("%Y-%m-%d"),
+                "score": score,
+                "level": self._score_level(score),
+                "reason": (
+                    f"{facts.zodiac_day} day, {facts.element} element, "
+                    f"{facts.phase_name}"
+                ),
+                "days_away": days_away,
+            }
+            for (score, days_away), facts in zip(candidates, neighbors, strict=True)
+        ]
 
     async def find_good_dates(
         self,
@@ -566,41 +688,65 @@ class AuspiciousDateChecker:
         culture: str = "chinese",
         limit: int = 10,
     ) -> dict[str, Any]:
-        """Find good dates for an activity within a date range."""
+        """Find the best dates for an activity within a date range.
+
+        Every day in the range is scored from the precomputed score cycle and
+        the ``limit`` best good days are kept in a heap, earlier dates winning
+        ties. The scan stops once ``limit`` days with the highest attainable
+        score have been found.
+        """
         try:
-            start_date = datetime.strptime(start_date_str, "%Y-%m-%d")
-            end_date = datetime.strptime(end_date_str, "%Y-%m-%d")
+            start_date = datetime.strptime(start_date_str, "%Y-%m-%d").date()
+            end_date = datetime.strptime(end_date_str, "%Y-%m-%d").date()
+
+            # Only the Chinese tradition scores above neutral
+            best: list[tuple[int, int]] = []
+            if culture == "chinese" and limit > 0:
+                cycle = self._score_cycle(activity)
+                best_possible = max(cycle)
+                offset = start_date.toordinal() - CYCLE_EPOCH
+                for day in range((end_date - start_date).days + 1):
+                    score = cycle[(offset + day) % CYCLE_DAYS]
+                    if score < 7:
+                        continue
+                    # Min-heap on (score, -day): the root is the worst kept date
+                    if len(best) < limit:
+                        heapq.heappush(best, (score, -day))
+                    elif (score, -day) > best[0]:
+                        heapq.heapreplace(best, (score, -day))
+                    if len(best) == limit and best[0][0] == best_possible:
+                        break
+
+            # Day facts (and moon phases) are only needed for the winners
+            ranked = sorted(best, reverse=True)
+            winners = self.engine.day_facts_many(
+                [
+                    start_date + timedelta(days=-negative_day)
+                    for _, negative_day in ranked
+                ]
+            )
 
             good_dates: list[dict[str, Any]] = []
-            current_date = start_date
-
-            while current_date <= end_date and len(good_dates) < limit:
-                date_str = current_date.strftime("%Y-%m-%d")
-                check_result = await self.check_date(date_str, activity, culture)
-
-                if check_result.get("auspicious_level") in ["very_good", "good"]:
-                    good_dates.append(
-                        {
-                            "date": date_str,
-                            "level": check_result["auspicious_level"],
-                            "score": check_result.get("score", 0),
-                            "zodiac_day": check_result.get("zodiac_day"),
-                            "lucky_hours": check_result.get("lucky_hours", []),
-                            "moon_phase": check_result.get("moon_phase"),
-                        }
-                    )
-
-                current_date += timedelta(days=1)
-
-            # Sort by score (highest first)
-            good_dates.sort(key=lambda x: x["score"], reverse=True)
+            for (score, _), facts in zip(ranked, winners, strict=True):
+                good_dates.append(
+                    {
+                        "date": facts.date.strftime("%Y-%m-%d"),
+                        "level": self._score_level(score),
+                        "score": score,
+                        "zodiac_day": facts.zodiac_day,
+                        "lucky_hours": self.zodiac_hours.get(
+                            facts.zodiac_day, ["09:00-11:00", "13:00-15:00"]
+                        ),
+                        "moon_phase": facts.phase_name,
+                    }
+                )
 
             return {
                 "activity": activity,
                 "culture": culture,
                 "search_period": f"{start_date_str} to {end_date_str}",
                 "found_dates": len(good_dates),
-                "good_dates": good_dates[:limit],
+                "good_dates": good_dates,
                 "best_date": good_dates[0] if good_dates else None,
             }
 
@@ -608,106 +754,136 @@ class AuspiciousDateChecker:
             return {"error": f"Failed to find good dates: {str(e)}"}
 
     async def get_daily_fortune(
-        self, date_str: str, culture: str = "chinese"
+        self,
+        date_str: str,
+        culture: str = "chinese",
+        fields: Iterable[str] | None = None,
     ) -> dict[str, Any]:
-        """Get daily fortune and luck information."""
+        """Get daily fortune and luck information.
+
+        ``fields`` limits the result to the named keys (``DAILY_FORTUNE_FIELDS``);
+        the moon phase is only looked up when a field depending on it is
+        requested.
+        """
         try:
+            projection = Projection(fields, DAILY_FORTUNE_FIELDS, always=("date",))
             date_obj = datetime.strptime(date_str, "%Y-%m-%d")
 
             # Get Chinese calendar info
             chinese_info = self._get_chinese_calendar_info(date_obj)
-
-            # Get moon phase info
-            moon_data = await self.lunar_calc.get_moon_phase(date_str)
-
-            # Calculate overall fortune
-            fortune_score = 5  # Base score
-
-            # Adjust based on lunar mansion
-            lunar_mansion = chinese_info["lunar_mansion"]
-            if lunar_mansion in [
-                "角",
-                "房",
-                "心",
-                "井",
-            ]:  # Generally auspicious mansions
-                fortune_score += 2
-            elif lunar_mansion in [
-                "尾",
-                "箕",
-                "危",
-                "室",
-            ]:  # Generally inauspicious mansions
-                fortune_score -= 2
-
-            # Adjust based on five elements
             five_element = chinese_info["five_element"]
-            element_fortune = {
-                "Wood": 1,  # Growth and vitality
-                "Fire": 2,  # Energy and passion
-                "Earth": 0,  # Stability (neutral)
-                "Metal": -1,  # Cutting, separation
-                "Water": 1,  # Flow and adaptability
-            }
-            fortune_score += element_fortune.get(five_element, 0)
-
-            # Adjust based on moon phase
-            moon_phase = moon_data.get("phase_name", "")
-            if moon_phase in ["Full Moon", "Waxing Gibbous"]:
-                fortune_score += 1
-            elif moon_phase in ["New Moon", "Waning Crescent"]:
-                fortune_score -= 1
-
-            fortune_score = max(1, min(10, fortune_score))
-
-            # Generate fortune level
-            if fortune_score >= 8:
-                fortune_level = "excellent"
-                fortune_description = "A very auspicious day with excellent fortune. Great opportunities await."
-            elif fortune_score >= 6:
-                fortune_level = "good"
-                fortune_description = (
-                    "A favorable day with good fortune. Positive developments likely."
-                )
-            elif fortune_score >= 4:
-                fortune_level = "average"
-                fortune_description = (
-                    "A balanced day with average fortune. Steady progress expected."
-                )
-            elif fortune_score >= 2:
-                fortune_level = "challenging"
-                fortune_description = (
-                    "A challenging day requiring extra care. Proceed with caution."
-                )
-            else:
-                fortune_level = "difficult"
-                fortune_description = (
-                    "A difficult day with obstacles. Best to wait for better times."
+
+            # The fortune depends on the moon phase, looked up only when needed
+            moon_phase = fortune_level = fortune_description = None
+            fortune_score = None
+            if projection.wants(
+                "fortune_level", "fortune_score", "description", "moon_phase", "advice"
+            ):
+                moon_phase = self.engine.day_facts(date_obj.date()).phase_name
+                fortune_score, fortune_level, fortune_description = self._daily_fortune(
+                    chinese_info, moon_phase
                 )
 
-            return {
-                "date": date_str,
-                "culture": culture,
-                "fortune_level": fortune_level,
-                "fortune_score": fortune_score,
-                "description": fortune_description,
-                "zodiac_day": chinese_info["zodiac_day"],
-                "five_element": five_element,
-                "lunar_mansion": lunar_mansion,
-                "moon_phase": moon_phase,
-                "lucky_colors": self._get_lucky_colors(five_element),
-                "lucky_numbers": self._get_lucky_numbers(
-                    chinese_info["sexagenary_day"]
-                ),
-                "lucky_directions": self._get_lucky_directions(
-                    chinese_info["earthly_branch"]
-                ),
-                "advice": self._get_daily_advice(fortune_level, five_element),
-            }
+            return projection.apply(
+                {
+                    "date": date_str,
+                    "culture": culture,
+                    "fortune_level": fortune_level,
+                    "fortune_score": fortune_score,
+                    "description": fortune_description,
+                    "zodiac_day": chinese_info["zodiac_day"],
+                    "five_element": five_element,
+                    "lunar_mansion": chinese_info["lunar_mansion"],
+                    "moon_phase": moon_phase,
+                    "lucky_colors": self._get_lucky_colors(five_element),
+                    "lucky_numbers": self._get_lucky_numbers(
+                        chinese_info["sexagenary_day"]
+                    ),
+                    "lucky_directions": self._get_lucky_directions(
+                        chinese_info["earthly_branch"]
+                    ),
+                    "advice": (
+                        self._get_daily_advice(fortune_level, five_element)
+                        if fortune_level is not None
+                        else None
+                    ),
+                }
+            )
 
         except Exception as e:
             return {"error": f"Failed to get daily fortune: {str(e)}"}
 
+    def _daily_fortune(
+        self, chinese_info: dict[str, Any], moon_phase: str
+    ) -> tuple[int, str, str]:
+        """Score a day's fortune, returning the score, level and description."""
+        lunar_mansion = chinese_info["lunar_mansion"]
+        five_element = chinese_info["five_element"]
+
+        # Calculate overall fortune
+        fortune_score = 5  # Base score
+
+        # Adjust based on lunar mansion
+        if lunar_mansion in [
+            "角",
+            "房",
+            "心",
+            "井",
+        ]:  # Generally auspicious mansions
+            fortune_score += 2
+        elif lunar_mansion in [
+            "尾",
+            "箕",
+            "危",
+            "室",
+        ]:  # Generally inauspicious mansions
+            fortune_score -= 2
+
+        # Adjust based on five elements
+        element_fortune = {
+            "Wood": 1,  # Growth and vitality
+            "Fire": 2,  # Energy and passion
+            "Earth": 0,  # Stability (neutral)
+            "Metal": -1,  # Cutting, separation
+            "Water": 1,  # Flow and adaptability
+        }
+        fortune_score += element_fortune.get(five_element, 0)
+
+        # Adjust based on moon phase
+        if moon_phase in ["Full Moon", "Waxing Gibbous"]:
+            fortune_score += 1
+        elif moon_phase in ["New Moon", "Waning Crescent"]:
+            fortune_score -= 1
+
+        fortune_score = max(1, min(10, fortune_score))
+
+        # Generate fortune level
+        if fortune_score >= 8:
+            fortune_level = "excellent"
+            fortune_description = "A very auspicious day with excellent fortune. Great opportunities await."
+        elif fortune_score >= 6:
+            fortune_level = "good"
+            fortune_description = (
+                "A favorable day with good fortune. Positive developments likely."
+            )
+        elif fortune_score >= 4:
+            fortune_level = "average"
+            fortune_description = (
+                "A balanced day with average fortune. Steady progress expected."
+            )
+        elif fortune_score >= 2:
+            fortune_level = "challenging"
+            fortune_description = (
+                "A challenging day requiring extra care. Proceed with caution."
+            )
+        else:
+            fortune_level = "difficult"
+            fortune_description = (
+                "A difficult day with obstacles. Best to wait for better times."
+            )
+
+        return fortune_score, fortune_level, fortune_description
+
     def _get_lucky_colors(self, element: str) -> list[str]:
         """Get lucky colors based on five elements."""
         color_map = {
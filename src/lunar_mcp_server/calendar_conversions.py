@@ -2,9 +2,13 @@
 Calendar conversion utilities for Chinese lunar calendar system.
 """
 
+from collections.abc import Iterable
 from datetime import date, datetime
 from typing import Any
 
+from .lunar_table import ChineseLunarDate, LunarMonthTable, get_lunar_table
+from .projection import Projection
+
 try:
     from lunardate import LunarDate
 
@@ -19,19 +23,24 @@ try:
 except ImportError:
     ZHDATE_AVAILABLE = False
 
-try:
-    import chinese_calendar  # noqa: F401
-
-    CHINESE_CALENDAR_AVAILABLE = True
-except ImportError:
-    CHINESE_CALENDAR_AVAILABLE = False
+# Result keys of ``get_zodiac_info``, selectable through its ``fields`` argument
+ZODIAC_INFO_FIELDS = (
+    "date",
+    "culture",
+    "year_zodiac",
+    "daily_zodiac",
+    "hourly_zodiac",
+    "lunar_info",
+    "compatibility",
+)
 
 
 class CalendarConverter:
     """Converter between different calendar systems."""
 
-    def __init__(self) -> None:
+    def __init__(self, lunar_table: LunarMonthTable | None = None) -> None:
         """Initialize the calendar converter."""
+        self.lunar_table = lunar_table or get_lunar_table()
         self.zodiac_animals = [
             "Rat",
             "Ox",
@@ -139,6 +148,22 @@ class CalendarConverter:
         }
         return result
 
+    def _lunar_table_result(
+        self, solar_date: date, lunar: ChineseLunarDate
+    ) -> dict[str, Any]:
+        """Build a conversion result from a lunar month table lookup."""
+        return {
+            "solar_date": solar_date.strftime("%Y-%m-%d"),
+            "culture": "chinese",
+            "lunar_year": lunar.year,
+            "lunar_month": lunar.month,
+            "lunar_day": lunar.day,
+            "is_leap_month": lunar.is_leap_month,
+            "zodiac_info": self._calculate_chinese_zodiac_year(lunar.year),
+            "lunar_date_string": f"{lunar.year}-{lunar.month}-{lunar.day}",
+            "calculation_method": "lunar_table",
+        }
+
     async def solar_to_lunar(
         self, solar_date_str: str, culture: str = "chinese"
     ) -> dict[str, Any]:
@@ -158,7 +183,12 @@ class CalendarConverter:
                 "culture": "chinese",
             }
 
-            # Try using specialized libraries first
+            # Precomputed month table covers 1900-2100
+            lunar = self.lunar_table.solar_to_lunar(solar_date)
+            if lunar is not None:
+                return self._lunar_table_result(solar_date, lunar)
+
+            # Try using specialized libraries outside the table range
             if ZHDATE_AVAILABLE:
                 try:
                     zh_date = ZhDate.from_datetime(
@@ -241,7 +271,23 @@ class CalendarConverter:
                 "lunar_day": lunar_day,
             }
 
-            # Try using specialized libraries
+            # Precomputed month table covers 1900-2100
+            table_date = self.lunar_table.lunar_to_solar(
+                lunar_year, lunar_month, lunar_day
+            )
+            if table_date is not None:
+                result.update(
+                    {
+                        "solar_date": table_date.strftime("%Y-%m-%d"),
+                        "solar_year": table_date.year,
+                        "solar_month": table_date.month,
+                        "solar_day": table_date.day,
+                        "calculation_method": "lunar_table",
+                    }
+                )
+                return result
+
+            # Try using specialized libraries outside the table range
             if ZHDATE_AVAILABLE:
                 try:
                     zh_date = ZhDate(lunar_year, lunar_month, lunar_day)
@@ -298,24 +344,240 @@ class CalendarConverter:
         except Exception as e:
             return {"error": f"Failed to convert Chinese lunar to solar date: {str(e)}"}
 
+    def _range_entry(self, ordinal: int, lunar: ChineseLunarDate) -> dict[str, Any]:
+        """Build one conversion of a range or list result."""
+        return {
+            "solar_date": date.fromordinal(ordinal).isoformat(),
+            "lunar_year": lunar.year,
+            "lunar_month": lunar.month,
+            "lunar_day": lunar.day,
+            "is_leap_month": lunar.is_leap_month,
+            "lunar_date_string": f"{lunar.year}-{lunar.month}-{lunar.day}",
+        }
+
+    def _span_entries(self, start: int, stop: int) -> list[dict[str, Any]]:
+        """Convert the solar ordinals in ``[start, stop)`` in one table walk."""
+        return [
+            self._range_entry(ordinal, lunar)
+            for ordinal, lunar in enumerate(self.lunar_table.span(start, stop), start)
+        ]
+
+    def _page(
+        self,
+        entries: list[dict[str, Any]],
+        total: int,
+        offset: int,
+        request: dict[str, Any],
+    ) -> dict[str, Any]:
+        """Wrap one page of conversions with paging and zodiac details."""
+        end = offset + len(entries)
+        years = sorted(
+            {entry["lunar_year"] for entry in entries if "error" not in entry}
+        )
+        return {
+            **request,
+            "culture": "chinese",
+            "total": total,
+            "offset": offset,
+            "count": len(entries),
+            "next_offset": end if end < total else None,
+            "results": entries,
+            # Zodiac of each lunar year on the page, shared by its dates
+            "zodiac": {
+                str(year): self._calculate_chinese_zodiac_year(year) for year in years
+            },
+        }
+
+    def _paged_span(
+        self, start: int, end: int, offset: int, limit: int, request: dict[str, Any]
+    ) -> dict[str, Any]:
+        """Convert one page of the solar ordinals from ``start`` to ``end``."""
+        if end < start:
+            return {"error": "The end of the range is before its start"}
+        first = start + offset
+        stop = min(end + 1, first + limit)
+        entries = self._span_entries(first, stop) if first < stop else []
+        return self._page(entries, end - start + 1, offset, request)
+
+    def _solar_list_entry(self, solar_date_str: str) -> dict[str, Any]:
+        """Convert one date of a solar date list."""
+        try:
+            solar_date = datetime.strptime(solar_date_str, "%Y-%m-%d").date()
+        except ValueError:
+            return {
+                "solar_date": solar_date_str,
+                "error": "Invalid date format. Use YYYY-MM-DD",
+            }
+        lunar = self.lunar_table.solar_to_lunar(solar_date)
+        if lunar is None:
+            return {"solar_date": solar_date_str, "error": self._table_span_error()}
+        return self._range_entry(solar_date.toordinal(), lunar)
+
+    def _lunar_list_entry(self, lunar_date_str: str) -> dict[str, Any]:
+        """Convert one date of a lunar date list."""
+        ordinal = self._lunar_ordinal(lunar_date_str)
+        lunar = self.lunar_table.from_ordinal(ordinal) if ordinal is not None else None
+        if ordinal is None or lunar is None:
+            return {
+                "lunar_date": lunar_date_str,
+                "error": "Invalid lunar date or outside the lunar month table",
+            }
+        return {"lunar_date": lunar_date_str, **self._range_entry(ordinal, lunar)}
+
+    def _lunar_ordinal(self, lunar_date_str: str) -> int | None:
+        """Solar ordinal of a non-leap lunar YYYY-MM-DD date in the table."""
+        parts = lunar_date_str.split("-")
+        if len(parts) != 3 or not all(part.isdigit() for part in parts):
+            return None
+        year, month, day = map(int, parts)
+        return self.lunar_table.to_ordinal(year, month, day)
+
+    def _table_span_error(self) -> str:
+        """Error for solar dates outside the lunar month table."""
+        return (
+            f"Date outside the lunar month table "
+            f"({self.lunar_table.min_date} to {self.lunar_table.max_date})"
+        )
+
+    async def solar_to_lunar_range(
+        self,
+        start_date: str | None = None,
+        end_date: str | None = None,
+        dates: list[str] | None = None,
+        offset: int = 0,
+        limit: int = 1000,
+        culture: str = "chinese",
+    ) -> dict[str, Any]:
+        """Convert a span or list of solar dates to lunar dates, a page at a time.
+
+        Either every day from ``start_date`` to ``end_date`` or each of
+        ``dates`` is converted, returning ``limit`` conversions from
+        ``offset``. Conversions come from the lunar month table, so dates
+        outside it are rejected (lists report them per date).
+        """
+        try:
+            if dates is not None:
+                if start_date is not None or end_date is not None:
+                    return {
+                        "error": "Pass either dates or start_date and end_date, "
+                        "not both"
+                    }
+                entries = [
+                    self._solar_list_entry(solar_date)
+                    for solar_date in dates[offset : offset + limit]
+                ]
+                return self._page(entries, len(dates), offset, {})
+
+            if start_date is None or end_date is None:
+                return {"error": "Pass either dates or start_date and end_date"}
+            start = datetime.strptime(start_date, "%Y-%m-%d").date()
+            end = datetime.strptime(end_date, "%Y-%m-%d").date()
+            if not self.lunar_table.covers(start) or not self.lunar_table.covers(end):
+                return {"error": self._table_span_error()}
+            return self._paged_span(
+                start.toordinal(),
+                end.toordinal(),
+                offset,
+                limit,
+                {"start_date": start_date, "end_date": end_date},
+            )
+
+        except Exception as e:
+            return {"error": f"Failed to convert solar to lunar dates: {str(e)}"}
+
+    async def lunar_to_solar_range(
+        self,
+        start_lunar_date: str | None = None,
+        end_lunar_date: str | None = None,
+        lunar_dates: list[str] | None = None,
+        offset: int = 0,
+        limit: int = 1000,
+        culture: str = "chinese",
+    ) -> dict[str, Any]:
+        """Convert a span or list of lunar dates to solar dates, a page at a time.
+
+        Lunar dates are non-leap YYYY-MM-DD dates inside the lunar month
+        table; leap months between the two ends of a range are included.
+        """
+        try:
+            if lunar_dates is not None:
+                if start_lunar_date is not None or end_lunar_date is not None:
+                    return {
+                        "error": "Pass either lunar_dates or start_lunar_date and "
+                        "end_lunar_date, not both"
+                    }
+                entries = [
+                    self._lunar_list_entry(lunar_date)
+                    for lunar_date in lunar_dates[offset : offset + limit]
+                ]
+                return self._page(entries, len(lunar_dates), offset, {})
+
+            if start_lunar_date is None or end_lunar_date is None:
+                return {
+                    "error": "Pass either lunar_dates or start_lunar_date and "
+                    "end_lunar_date"
+                }
+            start = self._lunar_ordinal(start_lunar_date)
+            end = self._lunar_ordinal(end_lunar_date)
+            if start is None or end is None:
+                return {
+                    "error": "Invalid lunar date or outside the lunar month table. "
+                    "Use YYYY-MM-DD"
+                }
+            return self._paged_span(
+                start,
+                end,
+                offset,
+                limit,
+                {
+                    "start_lunar_date": start_lunar_date,
+                    "end_lunar_date": end_lunar_date,
+                },
+            )
+
+        except Exception as e:
+            return {"error": f"Failed to convert lunar to solar dates: {str(e)}"}
+
     async def get_zodiac_info(
-        self, date_str: str, culture: str = "chinese"
+        self,
+        date_str: str,
+        culture: str = "chinese",
+        lunar: ChineseLunarDate | None = None,
+        fields: Iterable[str] | None = None,
     ) -> dict[str, Any]:
-        """Get Chinese zodiac information for a date."""
+        """Get Chinese zodiac information for a date.
+
+        ``lunar`` is the already known lunar date, if any; otherwise the
+        date is converted here, unless ``fields`` (``ZODIAC_INFO_FIELDS``)
+        leaves out ``lunar_info``.
+        """
         try:
+            projection = Projection(fields, ZODIAC_INFO_FIELDS, always=("date",))
             target_date = datetime.strptime(date_str, "%Y-%m-%d").date()
-            return await self._get_chinese_zodiac_info(target_date)
+            return await self._get_chinese_zodiac_info(target_date, lunar, projection)
 
         except Exception as e:
             return {"error": f"Failed to get zodiac info: {str(e)}"}
 
-    async def _get_chinese_zodiac_info(self, target_date: date) -> dict[str, Any]:
+    async def _get_chinese_zodiac_info(
+        self,
+        target_date: date,
+        lunar: ChineseLunarDate | None = None,
+        projection: Projection | None = None,
+    ) -> dict[str, Any]:
         """Get Chinese zodiac information."""
         try:
+            projection = projection or Projection(None, ZODIAC_INFO_FIELDS)
+
             # Get lunar conversion for more accurate zodiac calculation
-            lunar_info = await self.solar_to_lunar(
-                target_date.strftime("%Y-%m-%d"), "chinese"
-            )
+            lunar_info = None
+            if projection.wants("lunar_info"):
+                if lunar is not None:
+                    lunar_info = self._lunar_table_result(target_date, lunar)
+                else:
+                    lunar_info = await self.solar_to_lunar(
+                        target_date.strftime("%Y-%m-%d"), "chinese"
+                    )
 
             year_zodiac = self._calculate_chinese_zodiac_year(target_date.year)
 
@@ -397,28 +659,32 @@ class CalendarConverter:
             daily_animal = self.zodiac_animals[daily_zodiac_index]
             hourly_animal = self.zodiac_animals[hourly_zodiac_index]
 
-            return {
-                "date": target_date.strftime("%Y-%m-%d"),
-                "culture": "chinese",
-                "year_zodiac": year_zodiac,
-                "daily_zodiac": {
-                    "animal": daily_animal,
-                    "traits": zodiac_traits.get(daily_animal, {}),
-                    "influence": f"Today is a {daily_animal} day, bringing {zodiac_traits.get(daily_animal, {}).get('personality', 'special')} energy",
-                },
-                "hourly_zodiac": {
-                    "animal": hourly_animal,
-                    "hour_range": f"{(hourly_zodiac_index * 2 - 1) % 24:02d}:00-{(hourly_zodiac_index * 2 + 1) % 24:02d}:00",
-                    "influence": f"Current hours favor {hourly_animal} characteristics",
-                },
-                "lunar_info": lunar_info,
-                "compatibility": {
-                    "best_matches": self._get_zodiac_compatibility(year_animal)["best"],
-                    "challenging_matches": self._get_zodiac_compatibility(year_animal)[
-                        "challenging"
-                    ],
-                },
-            }
+            return projection.apply(
+                {
+                    "date": target_date.strftime("%Y-%m-%d"),
+                    "culture": "chinese",
+                    "year_zodiac": year_zodiac,
+                    "daily_zodiac": {
+                        "animal": daily_animal,
+                        "traits": zodiac_traits.get(daily_animal, {}),
+                        "influence": f"Today is a {daily_animal} day, bringing {zodiac_traits.get(daily_animal, {}).get('personality', 'special')} energy",
+                    },
+                    "hourly_zodiac": {
+                        "animal": hourly_animal,
+                        "hour_range": f"{(hourly_zodiac_index * 2 - 1) % 24:02d}:00-{(hourly_zodiac_index * 2 + 1) % 24:02d}:00",
+                        "influence": f"Current hours favor {hourly_animal} characteristics",
+                    },
+                    "lunar_info": lunar_info,
+                    "compatibility": {
+                        "best_matches": self._get_zodiac_compatibility(year_animal)[
+                            "best"
+                        ],
+                        "challenging_matches": self._get_zodiac_compatibility(
+                            year_animal
+                        )["challenging"],
+                    },
+                }
+            )
 
         except Exception as e:
             return {"error": f"Failed to get Chinese zodiac info: {str(e)}"}
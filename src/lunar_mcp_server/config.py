@@ -0,0 +1,135 @@
+"""
+Runtime configuration for the Lunar MCP server.
+
+Settings are read from ``LUNAR_MCP_*`` environment variables so they can be
+set in MCP client configuration without command line changes.
+"""
+
+import os
+from collections.abc import Mapping
+from dataclasses import dataclass
+
+ENV_PREFIX = "LUNAR_MCP_"
+
+
+def _env_str(environ: Mapping[str, str], name: str) -> str | None:
+    """Read a non-empty string setting."""
+    value = environ.get(ENV_PREFIX + name, "").strip()
+    return value or None
+
+
+def _env_int(environ: Mapping[str, str], name: str, default: int) -> int:
+    """Read an integer setting."""
+    value = _env_str(environ, name)
+    return default if value is None else int(value)
+
+
+def _env_float(environ: Mapping[str, str], name: str, default: float) -> float:
+    """Read a float setting."""
+    value = _env_str(environ, name)
+    return default if value is None else float(value)
+
+
+def _env_bool(environ: Mapping[str, str], name: str, default: bool) -> bool:
+    """Read a boolean setting (1/true/yes/on)."""
+    value = _env_str(environ, name)
+    if value is None:
+        return default
+    return value.lower() in ("1", "true", "yes", "on")
+
+
+@dataclass(frozen=True)
+class Settings:
+    """Server settings."""
+
+    # Directory containing de421.bsp; searched before the bundled locations
+    ephemeris_dir: str | None = None
+    # Allow skyfield to download the ephemeris when no local copy exists
+    ephemeris_download: bool = False
+    # Load the ephemeris in the background as soon as the server starts
+    preload_ephemeris: bool = False
+    # Number of dates kept in the per-date facts cache
+    day_facts_cache_size: int = 4096
+    # Days searched on each side of a poor date for better alternatives
+    alternative_window_days: int = 14
+    # Number of alternative dates suggested for a poor date
+    alternative_count: int = 3
+    # Maximum number of dates accepted by batch_check_dates
+    batch_max_dates: int = 1000
+    # Threads running blocking tool calculations (0 runs them on the event loop)
+    worker_threads: int = 2
+    # JSON encoder for tool results: "auto" (orjson when installed), "orjson"
+    # or "json"
+    json_backend: str = "auto"
+    # Indent tool results instead of encoding them compactly
+    json_pretty: bool = False
+    # Transport used by the console script: "stdio" or "http"
+    transport: str = "stdio"
+    # Address and endpoint path of the streamable HTTP transport
+    http_host: str = "127.0.0.1"
+    http_port: int = 8000
+    http_path: str = "/mcp"
+    # Serve HTTP requests without session state, e.g. behind a load balancer
+    # that does not pin clients to one process
+    http_stateless: bool = False
+    # HTTP worker processes forked from one warmed supervisor (1 serves in
+    # the main process)
+    workers: int = 1
+    # Open HTTP connections allowed before new ones get 503 (0 for no limit)
+    http_max_connections: int = 1000
+    # Tool calls evaluated at once across all sessions (0 for no limit)
+    max_concurrent_calls: int = 64
+    # Let identical concurrent tool calls share one computation
+    coalesce_calls: bool = True
+    # Seconds tool results are cached for (0 disables the result cache)
+    result_cache_ttl: int = 3600
+    # Bounds of the result cache, in results and in encoded bytes
+    result_cache_max_entries: int = 1024
+    result_cache_max_bytes: int = 32 * 1024 * 1024
+    # Local port serving Prometheus metrics at /metrics (0 disables it); with
+    # pre-fork workers, worker N listens on metrics_port + N
+    metrics_port: int = 0
+    metrics_host: str = "127.0.0.1"
+    # Fraction of computed tool calls profiled with cProfile (0 disables
+    # profiling), the directory the profiles are written to (a
+    # lunar-mcp-profiles directory under the system temp dir by default),
+    # and whether tracemalloc also records their allocations
+    profile_sample_rate: float = 0.0
+    profile_dir: str | None = None
+    profile_memory: bool = False
+
+    @classmethod
+    def from_env(cls, environ: Mapping[str, str] | None = None) -> "Settings":
+        """Build settings from environment variables."""
+        env = os.environ if environ is None else environ
+        return cls(
+            ephemeris_dir=_env_str(env, "EPHEMERIS_DIR"),
+            ephemeris_download=_env_bool(env, "EPHEMERIS_DOWNLOAD", False),
+            preload_ephemeris=_env_bool(env, "PRELOAD_EPHEMERIS", False),
+            day_facts_cache_size=_env_int(env, "DAY_FACTS_CACHE_SIZE", 4096),
+            alternative_window_days=_env_int(env, "ALTERNATIVE_WINDOW_DAYS", 14),
+            alternative_count=_env_int(env, "ALTERNATIVE_COUNT", 3),
+            batch_max_dates=_env_int(env, "BATCH_MAX_DATES", 1000),
+            worker_threads=_env_int(env, "WORKER_THREADS", 2),
+            json_backend=_env_str(env, "JSON_BACKEND") or "auto",
+            json_pretty=_env_bool(env, "JSON_PRETTY", False),
+            transport=_env_str(env, "TRANSPORT") or "stdio",
+            http_host=_env_str(env, "HTTP_HOST") or "127.0.0.1",
+            http_port=_env_int(env, "HTTP_PORT", 8000),
+            http_path=_env_str(env, "HTTP_PATH") or "/mcp",
+            http_stateless=_env_bool(env, "HTTP_STATELESS", False),
+            workers=_env_int(env, "WORKERS", 1),
+            http_max_connections=_env_int(env, "HTTP_MAX_CONNECTIONS", 1000),
+            max_concurrent_calls=_env_int(env, "MAX_CONCURRENT_CALLS", 64),
+            coalesce_calls=_env_bool(env, "COALESCE_CALLS", True),
+            result_cache_ttl=_env_int(env, "RESULT_CACHE_TTL", 3600),
+            result_cache_max_entries=_env_int(env, "RESULT_CACHE_MAX_ENTRIES", 1024),
+            result_cache_max_bytes=_env_int(
+                env, "RESULT_CACHE_MAX_BYTES", 32 * 1024 * 1024
+            ),
+            metrics_port=_env_int(env, "METRICS_PORT", 0),
+            metrics_host=_env_str(env, "METRICS_HOST") or "127.0.0.1",
+            profile_sample_rate=_env_float(env, "PROFILE_SAMPLE_RATE", 0.0),
+            profile_dir=_env_str(env, "PROFILE_DIR"),
+            profile_memory=_env_bool(env, "PROFILE_MEMORY", False),
+        )
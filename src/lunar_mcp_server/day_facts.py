@@ -0,0 +1,176 @@
+"""
+Per-date facts shared by all tools.
+
+A ``DayFacts`` record holds everything the tools derive from a single solar
+date: the sexagenary day, lunar mansion and element, the Chinese lunar date
+and the moon phase. Records are built once per date and kept in a bounded
+LRU keyed by the date ordinal, safe to share between worker threads.
+"""
+
+from datetime import date
+from typing import NamedTuple
+
+from .lru import LRUCache
+from .lunar_table import ChineseLunarDate
+
+HEAVENLY_STEMS = ["甲", "乙", "丙", "丁", "戊", "己", "庚", "辛", "壬", "癸"]
+
+EARTHLY_BRANCHES = [
+    "子",
+    "丑",
+    "寅",
+    "卯",
+    "辰",
+    "巳",
+    "午",
+    "未",
+    "申",
+    "酉",
+    "戌",
+    "亥",
+]
+
+ZODIAC_ANIMALS = [
+    "Rat",
+    "Ox",
+    "Tiger",
+    "Rabbit",
+    "Dragon",
+    "Snake",
+    "Horse",
+    "Goat",
+    "Monkey",
+    "Rooster",
+    "Dog",
+    "Pig",
+]
+
+FIVE_ELEMENTS = ["Wood", "Fire", "Earth", "Metal", "Water"]
+
+LUNAR_MANSIONS = [
+    "角",
+    "亢",
+    "氐",
+    "房",
+    "心",
+    "尾",
+    "箕",  # Eastern Azure Dragon
+    "斗",
+    "牛",
+    "女",
+    "虛",
+    "危",
+    "室",
+    "壁",  # Northern Black Tortoise
+    "奎",
+    "婁",
+    "胃",
+    "昴",
+    "畢",
+    "觜",
+    "參",  # Western White Tiger
+    "井",
+    "鬼",
+    "柳",
+    "星",
+    "張",
+    "翼",
+    "軫",  # Southern Vermilion Bird
+]
+
+# Day cycles are counted from the Chinese New Year of 1900
+CYCLE_EPOCH = date(1900, 1, 31).toordinal()
+
+# The stem, branch and mansion cycles repeat together every lcm(10, 12, 28) days
+CYCLE_DAYS = 420
+
+DEFAULT_MAXSIZE = 4096
+
+
+class DayCycle(NamedTuple):
+    """Sexagenary, mansion and element cycle position of one solar date."""
+
+    stem: str
+    branch: str
+    mansion: str
+    element: str
+    zodiac_day: str
+    sexagenary_day: int
+
+
+def day_cycle(ordinal: int) -> DayCycle:
+    """Compute the cycle position of a date ordinal (no ephemeris needed)."""
+    days = ordinal - CYCLE_EPOCH
+    stem_index = days % 10
+    return DayCycle(
+        stem=HEAVENLY_STEMS[stem_index],
+        branch=EARTHLY_BRANCHES[days % 12],
+        mansion=LUNAR_MANSIONS[days % 28],
+        element=FIVE_ELEMENTS[stem_index % 5],
+        zodiac_day=ZODIAC_ANIMALS[days % 12],
+        sexagenary_day=days % 60,
+    )
+
+
+class DayFacts(NamedTuple):
+    """Calendar, cycle and moon phase facts for one solar date."""
+
+    ordinal: int
+    stem: str
+    branch: str
+    mansion: str
+    element: str
+    zodiac_day: str
+    sexagenary_day: int
+    # Lunar date fields are None outside the lunar month table
+    lunar_year: int | None
+    lunar_month: int | None
+    lunar_day: int | None
+    is_leap_month: bool
+    phase_angle: float
+    illumination: float
+    phase_name: str
+
+    @property
+    def date(self) -> date:
+        """Solar date of the record."""
+        return date.fromordinal(self.ordinal)
+
+    @property
+    def lunar_date(self) -> ChineseLunarDate | None:
+        """Chinese lunar date, or None outside the lunar month table."""
+        if self.lunar_year is None or self.lunar_month is None or not self.lunar_day:
+            return None
+        return ChineseLunarDate(
+            self.lunar_year, self.lunar_month, self.lunar_day, self.is_leap_month
+        )
+
+
+def build_day_facts(
+    ordinal: int,
+    lunar: ChineseLunarDate | None,
+    illumination: float,
+    phase_angle: float,
+    phase_name: str,
+) -> DayFacts:
+    """Build the facts for one date from its lunar date and moon phase."""
+    cycle = day_cycle(ordinal)
+    return DayFacts(
+        ordinal,
+        *cycle,
+        lunar_year=lunar.year if lunar else None,
+        lunar_month=lunar.month if lunar else None,
+        lunar_day=lunar.day if lunar else None,
+        is_leap_month=lunar.is_leap_month if lunar else False,
+        phase_angle=phase_angle,
+        illumination=illumination,
+        phase_name=phase_name,
+    )
+
+
+class DayFactsCache(LRUCache[int, DayFacts]):
+    """Bounded LRU of ``DayFacts`` keyed by date ordinal."""
+
+    def __init__(self, maxsize: int = DEFAULT_MAXSIZE) -> None:
+        """Initialize an empty cache."""
+        super().__init__(maxsize)
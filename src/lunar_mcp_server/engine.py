@@ -0,0 +1,78 @@
+"""
+Shared calculation engine for the lunar calendar subsystems.
+"""
+
+from datetime import date, timedelta
+from functools import lru_cache
+
+from .calendar_conversions import CalendarConverter
+from .config import Settings
+from .day_facts import DayFacts, DayFactsCache, build_day_facts
+from .lunar_calculations import LunarCalculator
+from .lunar_table import LunarMonthTable, get_lunar_table
+
+
+class LunarEngine:
+    """Owner of the ephemeris, conversion tables and caches shared by all tools.
+
+    One engine is created per process and injected into every subsystem, so
+    the ephemeris is loaded once and cached results are visible to all tools.
+    """
+
+    def __init__(
+        self,
+        settings: Settings | None = None,
+        lunar_table: LunarMonthTable | None = None,
+    ) -> None:
+        """Initialize the engine."""
+        self.settings = settings or Settings.from_env()
+        self.lunar_table = lunar_table or get_lunar_table()
+        self.lunar_calc = LunarCalculator(
+            ephemeris_dir=self.settings.ephemeris_dir,
+            ephemeris_download=self.settings.ephemeris_download,
+        )
+        self.calendar_converter = CalendarConverter(self.lunar_table)
+        self.day_facts_cache = DayFactsCache(self.settings.day_facts_cache_size)
+
+    def day_facts(self, day: date) -> DayFacts:
+        """Get the facts for one date."""
+        return self.day_facts_range(day, day)[0]
+
+    def day_facts_range(self, start: date, end: date) -> list[DayFacts]:
+        """Get the facts for every date from start to end (inclusive)."""
+        if end < start:
+            raise ValueError("End date must not be before start date")
+        return self.day_facts_many(
+            [start + timedelta(days=offset) for offset in range((end - start).days + 1)]
+        )
+
+    def day_facts_many(self, days: list[date]) -> list[DayFacts]:
+        """Get the facts for each of the given dates.
+
+        Dates missing from the cache are built together, with one vectorized
+        moon phase evaluation for all of them.
+        """
+        records = [self.day_facts_cache.get(day.toordinal()) for day in days]
+        missing = [index for index, facts in enumerate(records) if facts is None]
+        if missing:
+            missing_days = [days[index] for index in missing]
+            illumination, phase_angles = self.lunar_calc.get_phases_on(missing_days)
+            names = self.lunar_calc.phase_names(illumination, phase_angles)
+            for position, index in enumerate(missing):
+                ordinal = days[index].toordinal()
+                facts = build_day_facts(
+                    ordinal,
+                    self.lunar_table.from_ordinal(ordinal),
+                    illumination[position],
+                    phase_angles[position],
+                    names[position],
+                )
+                self.day_facts_cache.put(facts.ordinal, facts)
+                records[index] = facts
+        return [facts for facts in records if facts is not None]
+
+
+@lru_cache(maxsize=1)
+def get_engine() -> LunarEngine:
+    """Get the process-wide engine, creating it on first use."""
+    return LunarEngine()
@@ -2,18 +2,58 @@
 Festival database and management for lunar calendar systems.
 """
 
-from datetime import datetime, timedelta
-from typing import Any
-
-from .calendar_conversions import CalendarConverter
+from bisect import bisect_left, bisect_right
+from collections.abc import Iterable, Mapping
+from datetime import date, datetime
+from typing import Any, NamedTuple
+
+from .engine import LunarEngine, get_engine
+from .lru import LRUCache
+from .projection import Projection
+
+# Result keys of ``get_festival_details``, selectable through its ``fields``
+# argument
+FESTIVAL_DETAILS_FIELDS = (
+    "festival_id",
+    "name",
+    "culture",
+    "significance",
+    "duration",
+    "traditions",
+    "foods",
+    "lucky_activities",
+    "taboos",
+    "regional_names",
+    "next_occurrence",
+    "preparation_guide",
+    "cultural_context",
+)
+
+
+# Solar years of festival dates kept by each FestivalManager
+FESTIVAL_YEARS_CACHED = 64
+
+
+class FestivalYear(NamedTuple):
+    """The Chinese festivals of one solar year, by date ordinal."""
+
+    # Sorted ordinals of the dates with festivals
+    ordinals: tuple[int, ...]
+    # Festival ids falling on each of those dates
+    festivals: Mapping[int, tuple[str, ...]]
 
 
 class FestivalManager:
     """Manager for lunar festivals across different cultures."""
 
-    def __init__(self) -> None:
+    def __init__(self, engine: LunarEngine | None = None) -> None:
         """Initialize the festival manager."""
-        self.calendar_converter = CalendarConverter()
+        self.engine = engine or get_engine()
+        self.calendar_converter = self.engine.calendar_converter
+        # Festival dates per solar year, shared by every culture
+        self.festival_years: LRUCache[int, FestivalYear] = LRUCache(
+            FESTIVAL_YEARS_CACHED
+        )
         self._load_festival_data()
 
     def _load_festival_data(self) -> None:
@@ -152,63 +192,103 @@ class FestivalManager:
             },
         }
 
+    async def _get_festival_year(self, year: int) -> FestivalYear:
+        """Get the Chinese festivals falling in a solar year, by date ordinal.
+
+        Lunar festivals are placed with the lunar month table (festivals are
+        not repeated in leap months). Years outside the table fall back to
+        converting each day. Years are kept in a bounded LRU.
+        """
+        cached = self.festival_years.get(year)
+        if cached is not None:
+            return cached
+
+        index: dict[int, list[str]] = {}
+        first = date(year, 1, 1)
+        last = date(year, 12, 31)
+        table = self.engine.lunar_table
+        in_table = table.covers(first) and table.covers(last)
+
+        # Lunar festivals first, then solar ones, as listed for a date
+        lunar_festivals = self._festival_dates("lunar_date")
+        if in_table:
+            for lunar_year in (year - 1, year):
+                for festival_id, lunar_month, lunar_day in lunar_festivals:
+                    solar = table.lunar_to_solar(lunar_year, lunar_month, lunar_day)
+                    if solar is not None and first <= solar <= last:
+                        index.setdefault(solar.toordinal(), []).append(festival_id)
+        else:
+            for ordinal in range(first.toordinal(), last.toordinal() + 1):
+                lunar_info = await self.calendar_converter.solar_to_lunar(
+                    date.fromordinal(ordinal).strftime("%Y-%m-%d")
+                )
+                for festival_id, lunar_month, lunar_day in lunar_festivals:
+                    if (
+                        lunar_info.get("lunar_month") == lunar_month
+                        and lunar_info.get("lunar_day") == lunar_day
+                    ):
+                        index.setdefault(ordinal, []).append(festival_id)
+
+        for festival_id, month, day in self._festival_dates("solar_date"):
+            ordinal = date(year, month, day).toordinal()
+            index.setdefault(ordinal, []).append(festival_id)
+
+        festival_year = FestivalYear(
+            tuple(sorted(index)),
+            {ordinal: tuple(ids) for ordinal, ids in index.items()},
+        )
+        self.festival_years.put(year, festival_year)
+        return festival_year
+
+    def _festival_dates(self, kind: str) -> list[tuple[str, int, int]]:
+        """List (id, month, day) of the Chinese festivals with a lunar or solar date."""
+        dates = []
+        for festival_id, festival_data in self.chinese_festivals.items():
+            if kind in festival_data:
+                month, day = str(festival_data[kind]).split("-")
+                dates.append((festival_id, int(month), int(day)))
+        return dates
+
+    def _festival_entry(self, festival_id: str) -> dict[str, Any]:
+        """Describe a Chinese festival occurring on a date."""
+        festival_data = self.chinese_festivals[festival_id]
+        entry = {
+            "id": festival_id,
+            "name": festival_data["name"],
+            "culture": "chinese",
+            "significance": festival_data["significance"],
+            "traditions": festival_data["traditions"],
+            "foods": festival_data["foods"],
+            "duration": festival_data["duration"],
+            "lucky_activities": festival_data.get("lucky_activities", []),
+        }
+        if "lunar_date" in festival_data:
+            entry["taboos"] = festival_data.get("taboos", [])
+            entry["is_major"] = festival_id in [
+                "spring_festival",
+                "mid_autumn",
+                "dragon_boat",
+            ]
+        else:
+            entry["is_major"] = True
+        return entry
+
     async def get_festivals_for_date(
         self, date_str: str, culture: str = "chinese"
     ) -> dict[str, Any]:
         """Get all festivals occurring on a specific date."""
         try:
-            target_date = datetime.strptime(date_str, "%Y-%m-%d")
+            target_date = datetime.strptime(date_str, "%Y-%m-%d").date()
             festivals_found = []
 
             if culture == "chinese":
-                # Convert to lunar date
-                lunar_info = await self.calendar_converter.solar_to_lunar(
-                    date_str, culture
-                )
-                lunar_month = lunar_info.get("lunar_month", 0)
-                lunar_day = lunar_info.get("lunar_day", 0)
-                lunar_date_str = f"{lunar_month}-{lunar_day}"
-
-                # Check Chinese festivals
-                for festival_id, festival_data in self.chinese_festivals.items():
-                    if festival_data.get("lunar_date") == lunar_date_str:
-                        festivals_found.append(
-                            {
-                                "id": festival_id,
-                                "name": festival_data["name"],
-                                "culture": "chinese",
-                                "significance": festival_data["significance"],
-                                "traditions": festival_data["traditions"],
-                                "foods": festival_data["foods"],
-                                "duration": festival_data["duration"],
-                                "lucky_activities": festival_data.get(
-                                    "lucky_activities", []
-                                ),
-                                "taboos": festival_data.get("taboos", []),
-                                "is_major": festival_id
-                                in ["spring_festival", "mid_autumn", "dragon_boat"],
-                            }
-                        )
-
-                # Check solar-based Chinese festivals
-                month_day = f"{target_date.month:02d}-{target_date.day:02d}"
-                for festival_id, festival_data in self.chinese_festivals.items():
-                    if festival_data.get("solar_date") == month_day:
-                        festivals_found.append(
-                            {
-                                "id": festival_id,
-                                "name": festival_data["name"],
-                                "culture": "chinese",
-                                "significance": festival_data["significance"],
-                                "traditions": festival_data["traditions"],
-                                "foods": festival_data["foods"],
-                                "duration": festival_data["duration"],
-                                "lucky_activities": festival_data.get(
-                                    "lucky_activities", []
-                                ),
-                                "is_major": True,
-                            }
-                        )
+                festival_year = await self._get_festival_year(target_date.year)
+                festivals_found = [
+                    self._festival_entry(festival_id)
+                    for festival_id in festival_year.festivals.get(
+                        target_date.toordinal(), ()
+                    )
+                ]
 
             # Determine if any major festival
             is_major_festival = any(f.get("is_major", False) for f in festivals_found)
@@ -245,27 +325,32 @@ class FestivalManager:
     ) -> dict[str, Any]:
         """Find the next upcoming festival after a given date."""
         try:
-            start_date = datetime.strptime(date_str, "%Y-%m-%d")
+            start_date = datetime.strptime(date_str, "%Y-%m-%d").date()
             search_limit = 365  # Search within next year
 
-            current_date = start_date + timedelta(days=1)  # Start from next day
-            days_searched = 0
-
-            while days_searched < search_limit:
-                check_date_str = current_date.strftime("%Y-%m-%d")
-                festivals_result = await self.get_festivals_for_date(
-                    check_date_str, culture
-                )
-
-                if festivals_result.get("festivals"):
-                    next_festival = festivals_result["festivals"][
-                        0
-                    ]  # Get first festival
-                    days_until = (current_date - start_date).days
-
+            if culture == "chinese":
+                start = start_date.toordinal()
+                last = start + search_limit
+                for year in range(start_date.year, date.fromordinal(last).year + 1):
+                    festival_year = await self._get_festival_year(year)
+                    ordinals = festival_year.ordinals
+                    position = bisect_right(ordinals, start)
+                    if position == len(ordinals):
+                        continue  # Nothing left this year
+
+                    ordinal = ordinals[position]
+                    if ordinal > last:
+                        break
+
+                    next_festival = self._festival_entry(
+                        festival_year.festivals[ordinal][0]
+                    )
+                    days_until = ordinal - start
                     return {
                         "search_date": date_str,
-                        "next_festival_date": check_date_str,
+                        "next_festival_date": date.fromordinal(ordinal).strftime(
+                            "%Y-%m-%d"
+                        ),
                         "days_until": days_until,
                         "festival": next_festival,
                         "culture": culture,
@@ -274,9 +359,6 @@ class FestivalManager:
                         ),
                     }
 
-                current_date += timedelta(days=1)
-                days_searched += 1
-
             return {
                 "search_date": date_str,
                 "culture": culture,
@@ -298,10 +380,20 @@ class FestivalManager:
             return f"Festival is in {days_until} days. Early planning recommended."
 
     async def get_festival_details(
-        self, festival_name: str, culture: str = "chinese"
+        self,
+        festival_name: str,
+        culture: str = "chinese",
+        fields: Iterable[str] | None = None,
     ) -> dict[str, Any]:
-        """Get detailed information about a specific festival."""
+        """Get detailed information about a specific festival.
+
+        ``fields`` limits the result to the named keys (``FESTIVAL_DETAILS_FIELDS``);
+        the next occurrence is only calculated when requested.
+        """
         try:
+            projection = Projection(
+                fields, FESTIVAL_DETAILS_FIELDS, always=("festival_id",)
+            )
             festival_data = None
             festival_id = None
 
@@ -331,25 +423,37 @@ class FestivalManager:
                 }
 
             # Calculate next occurrence
-            next_occurrence = await self._calculate_next_occurrence(
-                festival_id, festival_data, culture
-            )
+            next_occurrence = None
+            if projection.wants("next_occurrence"):
+                next_occurrence = await self._calculate_next_occurrence(
+                    festival_id, festival_data, culture
+                )
 
-            return {
-                "festival_id": festival_id,
-                "name": festival_data["name"],
-                "culture": culture,
-                "significance": festival_data["significance"],
-                "duration": festival_data["duration"],
-                "traditions": festival_data["traditions"],
-                "foods": festival_data["foods"],
-                "lucky_activities": festival_data.get("lucky_activities", []),
-                "taboos": festival_data.get("taboos", []),
-                "regional_names": festival_data.get("regional_names", []),
-                "next_occurrence": next_occurrence,
-                "preparation_guide": self._get_preparation_guide(festival_data),
-                "cultural_context": self._get_cultural_context(festival_id, culture),
-            }
+            return projection.apply(
+                {
+                    "festival_id": festival_id,
+                    "name": festival_data["name"],
+                    "culture": culture,
+                    "significance": festival_data["significance"],
+                    "duration": festival_data["duration"],
+                    "traditions": festival_data["traditions"],
+                    "foods": festival_data["foods"],
+                    "lucky_activities": festival_data.get("lucky_activities", []),
+                    "taboos": festival_data.get("taboos", []),
+                    "regional_names": festival_data.get("regional_names", []),
+                    "next_occurrence": next_occurrence,
+                    "preparation_guide": (
+                        self._get_preparation_guide(festival_data)
+                        if projection.wants("preparation_guide")
+                        else None
+                    ),
+                    "cultural_context": (
+                        self._get_cultural_context(festival_id, culture)
+                        if projection.wants("cultural_context")
+                        else None
+                    ),
+                }
+            )
 
         except Exception as e:
             return {"error": f"Failed to get festival details: {str(e)}"}
@@ -361,25 +465,29 @@ class FestivalManager:
     async def _calculate_next_occurrence(
         self, festival_id: str, festival_data: dict[str, Any], culture: str
     ) -> dict[str, Any]:
-        """Calculate the next occurrence of a festival."""
+        """Calculate the next occurrence of a festival (today included)."""
         try:
-            current_year = datetime.now().year
-
-            # For lunar-based festivals, we need to convert
-            if culture == "chinese" and "lunar_date" in festival_data:
-                # This would require proper lunar calendar calculation
-                # For now, return approximate date
-                return {
-                    "year": current_year,
-                    "approximate_date": "Calculation requires lunar calendar conversion",
-                    "note": "Exact date varies each year based on lunar calendar",
-                }
-
-            else:
+            if culture != "chinese":
                 return {
                     "note": "Next occurrence calculation not available for this festival type"
                 }
 
+            today = date.today()
+            for year in (today.year, today.year + 1):
+                festival_year = await self._get_festival_year(year)
+                ordinals = festival_year.ordinals
+                for ordinal in ordinals[bisect_left(ordinals, today.toordinal()) :]:
+                    if festival_id in festival_year.festivals[ordinal]:
+                        occurrence = date.fromordinal(ordinal)
+                        return {
+                            "year": occurrence.year,
+                            "date": occurrence.strftime("%Y-%m-%d"),
+                            "days_until": ordinal - today.toordinal(),
+                            "exact": self.engine.lunar_table.covers(occurrence),
+                        }
+
+            return {"note": "No occurrence found in the next year"}
+
         except Exception:
             return {"error": "Failed to calculate next occurrence"}
 
@@ -417,84 +525,81 @@ class FestivalManager:
     async def get_annual_festivals(
         self, year: int, culture: str = "chinese"
     ) -> dict[str, Any]:
-        """Get all festivals for a specific year."""
+        """Get all festivals for a specific year, in date order.
+
+        Dates come from the cached festival year; the result is built fresh
+        for each call, so callers may modify it.
+        """
         try:
+            festival_year = await self._get_festival_year(year)
+            major = self._get_major_festivals(culture)
+            # The only distinction between cultures
+            chinese = culture == "chinese"
             annual_festivals = []
             festival_calendar: dict[int, list[dict[str, Any]]] = {}
-            festivals_to_calculate = self.chinese_festivals
 
-            # For demonstration, create a simplified calendar
-            # In a full implementation, you'd calculate exact dates based on lunar/solar calendars
-            for festival_id, festival_data in festivals_to_calculate.items():
-                estimated_date = self._estimate_festival_date(
-                    festival_data, year, culture
-                )
-                if estimated_date:
-                    month = estimated_date.get("month", 1)
-                    if month not in festival_calendar:
-                        festival_calendar[month] = []
+            for ordinal in festival_year.ordinals:
+                occurrence = date.fromordinal(ordinal)
+                for festival_id in festival_year.festivals[ordinal]:
+                    festival_data = self.chinese_festivals[festival_id]
+                    # Other traditions only share the solar-dated festivals
+                    if not chinese and "lunar_date" in festival_data:
+                        continue
 
-                    festival_calendar[month].append(
+                    date_info = self._festival_date_info(festival_data, occurrence)
+                    festival_calendar.setdefault(occurrence.month, []).append(
                         {
                             "id": festival_id,
                             "name": festival_data["name"],
-                            "estimated_date": estimated_date,
+                            **date_info,
                             "duration": festival_data["duration"],
                             "significance": festival_data["significance"],
-                            "is_major": festival_id
-                            in self._get_major_festivals(culture),
+                            "is_major": festival_id in major,
                         }
                     )
-
                     annual_festivals.append(
                         {
                             "id": festival_id,
                             "name": festival_data["name"],
-                            "estimated_date": estimated_date,
+                            **date_info,
                             "culture": culture,
                             "significance": festival_data["significance"],
                         }
                     )
 
-            return {
+            table = self.engine.lunar_table
+            exact = table.covers(date(year, 1, 1)) and table.covers(date(year, 12, 31))
+            result = {
                 "year": year,
                 "culture": culture,
                 "total_festivals": len(annual_festivals),
                 "festivals": annual_festivals,
                 "calendar_view": festival_calendar,
-                "major_festivals": [
-                    f
-                    for f in annual_festivals
-                    if f["id"] in self._get_major_festivals(culture)
-                ],
-                "note": "Dates are estimated. Actual dates may vary based on lunar observations.",
+                "major_festivals": [f for f in annual_festivals if f["id"] in major],
+                "note": (
+                    "Lunar festival dates are exact, from the lunar month table."
+                    if exact
+                    else "Lunar festival dates are approximate outside 1900-2100."
+                ),
             }
+            return result
 
         except Exception as e:
             return {"error": f"Failed to get annual festivals: {str(e)}"}
 
-    def _estimate_festival_date(
-        self, festival_data: dict[str, Any], year: int, culture: str
-    ) -> dict[str, Any] | None:
-        """Estimate festival date for a given year."""
-        if "solar_date" in festival_data:
-            month, day = map(int, festival_data["solar_date"].split("-"))
-            return {"year": year, "month": month, "day": day, "type": "solar"}
-
-        elif "lunar_date" in festival_data and culture == "chinese":
+    def _festival_date_info(
+        self, festival_data: dict[str, Any], occurrence: date
+    ) -> dict[str, Any]:
+        """Describe when a festival falls in a given year."""
+        if "lunar_date" in festival_data:
             lunar_month, lunar_day = map(int, festival_data["lunar_date"].split("-"))
-            # Simplified estimation - in reality, you'd need proper lunar calendar conversion
-            estimated_solar_month = min(12, max(1, lunar_month + 1))
             return {
-                "year": year,
-                "month": estimated_solar_month,
-                "day": min(28, lunar_day + 10),
-                "type": "lunar_estimated",
+                "date": occurrence.strftime("%Y-%m-%d"),
+                "type": "lunar",
                 "lunar_month": lunar_month,
                 "lunar_day": lunar_day,
             }
-
-        return None
+        return {"date": occurrence.strftime("%Y-%m-%d"), "type": "solar"}
 
     def _get_major_festivals(self, culture: str) -> list[str]:
         """Get list of major Chinese festivals."""
@@ -0,0 +1,88 @@
+"""
+Streamable HTTP transport for the Lunar MCP server.
+
+One process serves any number of concurrent MCP sessions. Every session is
+handled by the same ``LunarMCPServer``, so the ephemeris, lunar table and
+caches of its engine are loaded once and shared by all clients.
+"""
+
+import contextlib
+import os
+import socket
+from collections.abc import AsyncIterator
+from typing import TYPE_CHECKING
+
+from mcp.server.streamable_http_manager import StreamableHTTPSessionManager
+from starlette.applications import Starlette
+from starlette.requests import Request
+from starlette.responses import JSONResponse
+from starlette.routing import Route
+from starlette.types import Receive, Scope, Send
+
+if TYPE_CHECKING:
+    from .server import LunarMCPServer
+
+
+class _MCPEndpoint:
+    """ASGI endpoint handing MCP requests to the session manager."""
+
+    def __init__(self, session_manager: StreamableHTTPSessionManager) -> None:
+        self.session_manager = session_manager
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        await self.session_manager.handle_request(scope, receive, send)
+
+
+def create_http_app(server: "LunarMCPServer") -> Starlette:
+    """Build the ASGI app serving a server over streamable HTTP.
+
+    The MCP endpoint is mounted at ``settings.http_path`` and ``/healthz``
+    reports readiness (and the serving process) for load balancer checks.
+    """
+    settings = server.engine.settings
+    session_manager = StreamableHTTPSessionManager(
+        app=server.server, stateless=settings.http_stateless
+    )
+
+    async def health(request: Request) -> JSONResponse:
+        return JSONResponse(
+            {
+                "status": "ok",
+                "ephemeris_ready": server.lunar_calc.ephemeris_ready.is_set(),
+                "pid": os.getpid(),
+            }
+        )
+
+    @contextlib.asynccontextmanager
+    async def lifespan(app: Starlette) -> AsyncIterator[None]:
+        async with session_manager.run():
+            yield
+
+    return Starlette(
+        routes=[
+            Route("/healthz", health, methods=["GET"]),
+            Route(settings.http_path, endpoint=_MCPEndpoint(session_manager)),
+        ],
+        lifespan=lifespan,
+    )
+
+
+async def serve_http(
+    server: "LunarMCPServer", sockets: list[socket.socket] | None = None
+) -> None:
+    """Serve a server over streamable HTTP with uvicorn until shutdown.
+
+    ``sockets`` are already listening sockets to serve (pre-fork workers);
+    otherwise uvicorn binds ``settings.http_host`` and ``settings.http_port``.
+    """
+    import uvicorn
+
+    settings = server.engine.settings
+    config = uvicorn.Config(
+        create_http_app(server),
+        host=settings.http_host,
+        port=settings.http_port,
+        limit_concurrency=settings.http_max_connections or None,
+        log_level="info",
+    )
+    await uvicorn.Server(config).serve(sockets)
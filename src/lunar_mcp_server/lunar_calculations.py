@@ -1,40 +1,208 @@
 """
 Astronomical calculations for lunar calendar operations.
+
+skyfield and numpy are imported when the ephemeris is first loaded, so
+processes that never need a moon phase do not pay for importing them.
 """
 
+import importlib.util
+import logging
 import math
-from datetime import datetime, timedelta
-from typing import Any
+import threading
+import time
+from datetime import UTC, date, datetime, timedelta
+from pathlib import Path
+from typing import Any, NamedTuple
+
+from .lru import LRUCache
+
+SKYFIELD_AVAILABLE = importlib.util.find_spec("skyfield") is not None
+
+
+class PhaseSeries(NamedTuple):
+    """Moon phase values for consecutive days starting at ``start``."""
+
+    start: date
+    illumination: list[float]
+    phase_angle: list[float]
+
+    def dates(self) -> list[date]:
+        """Get the date of every entry in the series."""
+        return [self.start + timedelta(days=i) for i in range(len(self.phase_angle))]
+
+
+logger = logging.getLogger(__name__)
+
+EPHEMERIS_FILE = "de421.bsp"
+
+# Julian date of 00:00 UTC on the day before date ordinal 1 (0001-01-01)
+JD_ORDINAL = 1721424.5
+
+# Observations reach back by the light time (about 8 minutes for the Sun),
+# so the first usable day starts this long after the kernel does
+LIGHT_TIME_MARGIN_DAYS = 1 / 24
+
+MAJOR_PHASES = ["New Moon", "First Quarter", "Full Moon", "Third Quarter"]
+
+# Mean synodic month and a reference new moon for the fallback event finder
+SYNODIC_MONTH_DAYS = 29.530588853
+REFERENCE_NEW_MOON = datetime(2000, 1, 6, 18, 14, tzinfo=UTC)
+
+# Estimated phase instants are within this of the true ones
+ESTIMATE_TOLERANCE = timedelta(days=SYNODIC_MONTH_DAYS / 8)
 
-try:
-    from skyfield.api import load, utc  # noqa: F401
-    from skyfield.searchlib import find_discrete, find_maxima  # noqa: F401
+# Calendar years of phase events kept by each LunarCalculator
+PHASE_EVENT_YEARS_CACHED = 64
 
-    SKYFIELD_AVAILABLE = True
-except ImportError:
-    SKYFIELD_AVAILABLE = False
+# Calendar years a single predict_moon_phases call may span
+MAX_PHASE_RANGE_YEARS = 10
 
-try:
-    import ephem  # noqa: F401
 
-    EPHEM_AVAILABLE = True
-except ImportError:
-    EPHEM_AVAILABLE = False
+class PhaseEvent(NamedTuple):
+    """Instant at which the Moon reaches a major phase."""
+
+    time: datetime
+    phase: int  # index into MAJOR_PHASES
+
+    @property
+    def name(self) -> str:
+        """Get the phase name."""
+        return MAJOR_PHASES[self.phase]
+
+
+def _round_to_second(moment: datetime) -> datetime:
+    """Round a datetime to the nearest whole second."""
+    return (moment + timedelta(microseconds=500_000)).replace(microsecond=0)
+
+
+def _utc_midnight(ordinal: int) -> datetime:
+    """00:00 UTC of a date ordinal."""
+    return datetime.combine(date.fromordinal(ordinal), datetime.min.time(), UTC)
 
 
 class LunarCalculator:
     """Calculator for lunar phases and astronomical data."""
 
-    def __init__(self) -> None:
-        """Initialize the lunar calculator."""
+    def __init__(
+        self, ephemeris_dir: str | None = None, ephemeris_download: bool = False
+    ) -> None:
+        """Initialize the lunar calculator.
+
+        The ephemeris is not touched here; it is loaded on the first
+        astronomical calculation (or by ``warm_up``).
+        """
         self._cache: dict[str, Any] = {}
+        self._phase_events: LRUCache[int, tuple[PhaseEvent, ...]] = LRUCache(
+            PHASE_EVENT_YEARS_CACHED
+        )
+
+        self.ephemeris_dir = ephemeris_dir
+        self.ephemeris_download = ephemeris_download
+        self.ephemeris_source: str | None = None
+        self.ephemeris_ready = threading.Event()
+        self.ephemeris_span = (date.min.toordinal(), date.max.toordinal())
+        self._ephemeris_lock = threading.Lock()
+        self._ephemeris_failed = False
+
+        self.ts: Any = None
+        self.eph: Any = None
+        self.earth: Any = None
+        self.moon: Any = None
+        self.sun: Any = None
+
+    def _find_ephemeris(self) -> Path | None:
+        """Locate a local ephemeris file without touching the network."""
+        directories = []
+        if self.ephemeris_dir:
+            directories.append(Path(self.ephemeris_dir))
+        try:
+            import skyfield_data
+
+            directories.append(Path(skyfield_data.get_skyfield_data_path()))
+        except ImportError:
+            pass
+        # skyfield's default loader keeps its files in the working directory
+        directories.append(Path.cwd())
+
+        for directory in directories:
+            candidate = directory / EPHEMERIS_FILE
+            if candidate.is_file():
+                return candidate
+        return None
+
+    def load_ephemeris(self) -> bool:
+        """Load the ephemeris on first use; return whether it is available.
+
+        Local kernels are opened with ``SpiceKernel``, which memory-maps
+        segments on demand instead of reading the whole file.
+        """
+        if self.ephemeris_ready.is_set():
+            return True
+        if not SKYFIELD_AVAILABLE or self._ephemeris_failed:
+            return False
+
+        with self._ephemeris_lock:
+            if self.ephemeris_ready.is_set():
+                return True
+
+            started = time.perf_counter()
+            path = self._find_ephemeris()
+            try:
+                from skyfield.api import Loader, load
+                from skyfield.jpllib import SpiceKernel
+
+                if path is not None:
+                    eph = SpiceKernel(str(path))
+                    source = str(path)
+                elif self.ephemeris_download:
+                    loader = Loader(self.ephemeris_dir or ".")
+                    eph = loader(EPHEMERIS_FILE)
+                    source = loader.path_to(EPHEMERIS_FILE)
+                else:
+                    logger.warning(
+                        "Ephemeris %s not found; using approximate moon phases. "
+                        "Set LUNAR_MCP_EPHEMERIS_DIR or LUNAR_MCP_EPHEMERIS_DOWNLOAD=1.",
+                        EPHEMERIS_FILE,
+                    )
+                    self._ephemeris_failed = True
+                    return False
+            except Exception as e:
+                logger.warning("Failed to load ephemeris: %s", e)
+                self._ephemeris_failed = True
+                return False
+
+            self.ts = load.timescale(builtin=True)
+            self.eph = eph
+            self.earth = eph["earth"]
+            self.moon = eph["moon"]
+            self.sun = eph["sun"]
+            self.ephemeris_source = source
+            # Dates whose 00:00 UTC falls inside every segment of the kernel
+            self.ephemeris_span = (
+                math.ceil(
+                    max(s.spk_segment.start_jd for s in eph.segments)
+                    + LIGHT_TIME_MARGIN_DAYS
+                    - JD_ORDINAL
+                ),
+                math.floor(
+                    min(s.spk_segment.end_jd for s in eph.segments) - JD_ORDINAL
+                ),
+            )
+            self.ephemeris_ready.set()
+            logger.info(
+                "Ephemeris ready from %s in %.0f ms",
+                source,
+                (time.perf_counter() - started) * 1000,
+            )
+            return True
 
-        if SKYFIELD_AVAILABLE:
-            self.ts = load.timescale()
-            self.eph = load("de421.bsp")
-            self.earth = self.eph["earth"]
-            self.moon = self.eph["moon"]
-            self.sun = self.eph["sun"]
+    def warm_up(self) -> bool:
+        """Load the ephemeris and page in the data used for moon phases."""
+        if not self.load_ephemeris():
+            return False
+        today = date.today()
+        self.get_phase_series(today, today)
+        return True
 
     def _parse_location(self, location: str) -> tuple[float, float]:
         """Parse location string to lat/lon coordinates."""
@@ -67,7 +235,7 @@ class LunarCalculator:
         if illumination < 0.01:
             return "New Moon"
         elif illumination < 0.25:
-            return "Waxing Crescent"
+            return "Waning Crescent" if phase_angle > 180 else "Waxing Crescent"
         elif 0.25 <= illumination < 0.75:
             if phase_angle < 180:
                 return (
@@ -82,10 +250,19 @@ class LunarCalculator:
                     else "Waning Gibbous"
                 )
         elif illumination < 0.99:
-            return "Waning Crescent" if phase_angle > 180 else "Waxing Gibbous"
+            return "Waning Gibbous" if phase_angle > 180 else "Waxing Gibbous"
         else:
             return "Full Moon"
 
+    def phase_names(
+        self, illumination: list[float], phase_angles: list[float]
+    ) -> list[str]:
+        """Name the moon phase for each pair of illumination and phase angle."""
+        return [
+            self._get_moon_phase_name(value, angle)
+            for value, angle in zip(illumination, phase_angles, strict=True)
+        ]
+
     def _calculate_lunar_day(self, target_date: datetime) -> int:
         """Calculate lunar day (1-30) for given date."""
         # Approximate lunar day calculation based on synodic month (29.5 days)
@@ -174,78 +351,234 @@ class LunarCalculator:
 
         return base_influence
 
+    def get_phase_series(self, start: date, end: date) -> PhaseSeries:
+        """Evaluate moon phase for every day from start to end (inclusive).
+
+        The phase angle is the Moon's ecliptic longitude minus the Sun's
+        (0 = new, 90 = first quarter, 180 = full, 270 = third quarter),
+        evaluated at 00:00 UTC. The whole range is computed in one
+        vectorized ephemeris call.
+        """
+        days = (end - start).days + 1
+        if days <= 0:
+            raise ValueError("End date must not be before start date")
+
+        illumination, phase_angles = self._evaluate_phases(start, list(range(days)))
+        return PhaseSeries(start, illumination, phase_angles)
+
+    def get_phases_on(self, days: list[date]) -> tuple[list[float], list[float]]:
+        """Evaluate illumination and phase angle on arbitrary days.
+
+        Like ``get_phase_series``, all days are computed in one vectorized
+        ephemeris call.
+        """
+        if not days:
+            return [], []
+        base = days[0].toordinal()
+        return self._evaluate_phases(days[0], [day.toordinal() - base for day in days])
+
+    def _evaluate_phases(
+        self, base: date, offsets: list[int]
+    ) -> tuple[list[float], list[float]]:
+        """Evaluate illumination and phase angle ``offsets`` days after base.
+
+        Days outside the ephemeris span (or all days, without an ephemeris)
+        use the mean synodic month approximation.
+        """
+        first = base.toordinal()
+        phase_angles = [0.0] * len(offsets)
+        estimated = list(range(len(offsets)))
+
+        if self.load_ephemeris():
+            low, high = self.ephemeris_span
+            inside = [
+                i for i, offset in enumerate(offsets) if low <= first + offset <= high
+            ]
+            if inside:
+                import numpy as np
+
+                t = self.ts.utc(
+                    base.year,
+                    base.month,
+                    base.day + np.array([offsets[i] for i in inside]),
+                )
+                observer = self.earth.at(t)
+                _, moon_lon, _ = observer.observe(self.moon).ecliptic_latlon()
+                _, sun_lon, _ = observer.observe(self.sun).ecliptic_latlon()
+                angles = (moon_lon.degrees - sun_lon.degrees) % 360.0
+                for i, angle in zip(inside, angles.tolist(), strict=True):
+                    phase_angles[i] = angle
+                estimated = [
+                    i
+                    for i, offset in enumerate(offsets)
+                    if not low <= first + offset <= high
+                ]
+
+        # Fallback calculation using the mean synodic month
+        reference = date(2000, 1, 6).toordinal()
+        for i in estimated:
+            phase_angles[i] = ((first + offsets[i] - reference) % 29.5) / 29.5 * 360
+
+        illumination = [
+            (1 - math.cos(math.radians(angle))) / 2 for angle in phase_angles
+        ]
+        return illumination, phase_angles
+
+    def get_phase_events(self, start: date, end: date) -> list[PhaseEvent]:
+        """Get exact major phase instants (UTC) between two dates inclusive."""
+        if end < start:
+            raise ValueError("End date must not be before start date")
+
+        events: list[PhaseEvent] = []
+        for year in range(start.year, end.year + 1):
+            events.extend(
+                event
+                for event in self._get_phase_events_for_year(year)
+                if start <= event.time.date() <= end
+            )
+        return events
+
+    def _get_phase_events_for_year(self, year: int) -> tuple[PhaseEvent, ...]:
+        """Find and cache every major phase instant in a calendar year.
+
+        The part of the year outside the ephemeris span (or the whole year,
+        without an ephemeris) uses the mean synodic month approximation.
+        """
+        cached = self._phase_events.get(year)
+        if cached is not None:
+            return cached
+
+        events: list[PhaseEvent] = []
+        # Part of the year searched in the ephemeris, if any
+        window: tuple[datetime, datetime] | None = None
+        if self.load_ephemeris():
+            low, high = self.ephemeris_span
+            start = max(datetime(year, 1, 1, tzinfo=UTC), _utc_midnight(low))
+            stop = min(datetime(year + 1, 1, 1, tzinfo=UTC), _utc_midnight(high))
+            if start < stop:
+                from skyfield import almanac
+                from skyfield.searchlib import find_discrete
+
+                # Search on a weekly grid and refine only around phase
+                # changes, to the precision the results are reported with
+                times, phases = find_discrete(
+                    self.ts.from_datetime(start),
+                    self.ts.from_datetime(stop),
+                    almanac.moon_phases(self.eph),
+                    epsilon=0.5 / 86400,
+                )
+                events = [
+                    PhaseEvent(_round_to_second(t), int(phase))
+                    for t, phase in zip(times.utc_datetime(), phases, strict=True)
+                ]
+                window = (start, stop)
+
+        if window is None:
+            events = self._estimate_phase_events(year)
+        else:
+            start, stop = window
+            found = list(events)
+            events.extend(
+                event
+                for event in self._estimate_phase_events(year)
+                # Estimates just inside the window stand in for true instants
+                # just outside it, unless the search found that phase nearby
+                if not start + ESTIMATE_TOLERANCE
+                <= event.time
+                < stop - ESTIMATE_TOLERANCE
+                and not any(
+                    other.phase == event.phase
+                    and abs(other.time - event.time) < ESTIMATE_TOLERANCE
+                    for other in found
+                )
+            )
+            events.sort(key=lambda event: event.time)
+
+        result = tuple(events)
+        self._phase_events.put(year, result)
+        return result
+
+    def _estimate_phase_events(self, year: int) -> list[PhaseEvent]:
+        """Approximate major phase instants using the mean synodic month."""
+        quarter = timedelta(days=SYNODIC_MONTH_DAYS / 4)
+        year_start = datetime(year, 1, 1, tzinfo=UTC)
+        year_end = datetime(year + 1, 1, 1, tzinfo=UTC)
+
+        quarters = math.ceil((year_start - REFERENCE_NEW_MOON) / quarter)
+        events = []
+        event_time = REFERENCE_NEW_MOON + quarter * quarters
+        while event_time < year_end:
+            events.append(PhaseEvent(_round_to_second(event_time), quarters % 4))
+            quarters += 1
+            event_time = REFERENCE_NEW_MOON + quarter * quarters
+        return events
+
     async def get_moon_phase(
         self, date_str: str, location: str = "0,0"
     ) -> dict[str, Any]:
         """Get detailed moon phase information for a specific date and location."""
         try:
             target_date = datetime.strptime(date_str, "%Y-%m-%d")
-            lat, lon = self._parse_location(location)
 
             # Use Skyfield if available, otherwise fall back to approximation
-            if SKYFIELD_AVAILABLE:
-                t = self.ts.utc(target_date.year, target_date.month, target_date.day)
-
-                # Calculate moon phase
-                earth_moon = self.earth.at(t).observe(self.moon)
-                earth_sun = self.earth.at(t).observe(self.sun)
-
-                # Phase angle calculation
-                phase_angle = earth_moon.separation_from(earth_sun).degrees
-                illumination = (1 + math.cos(math.radians(phase_angle))) / 2
-
-                # Moon rise/set times (simplified)
-                rise_time = "06:30"  # Placeholder - would need more complex calculation
-                set_time = "18:30"  # Placeholder
-
-            else:
-                # Fallback calculation using simple astronomical formulas
-                days_since_new_moon = (target_date - datetime(2000, 1, 6)).days % 29.5
-                phase_angle = (days_since_new_moon / 29.5) * 360
-                illumination = (1 + math.cos(math.radians(phase_angle))) / 2
-
-                rise_time = "06:30"
-                set_time = "18:30"
-
-            lunar_day = self._calculate_lunar_day(target_date)
-            phase_name = self._get_moon_phase_name(illumination, phase_angle)
-
-            # Get zodiac sign (simplified)
-            zodiac_signs = [
-                "Aries",
-                "Taurus",
-                "Gemini",
-                "Cancer",
-                "Leo",
-                "Virgo",
-                "Libra",
-                "Scorpio",
-                "Sagittarius",
-                "Capricorn",
-                "Aquarius",
-                "Pisces",
-            ]
-            zodiac_index = int((target_date.timetuple().tm_yday + lunar_day) / 30) % 12
-            zodiac_sign = zodiac_signs[zodiac_index]
-
-            influence = self._get_moon_influence_traditional(phase_name, lunar_day)
-
-            return {
-                "date": date_str,
-                "phase_name": phase_name,
-                "illumination": round(illumination, 3),
-                "phase_angle": round(phase_angle, 1),
-                "lunar_day": lunar_day,
-                "rise_time": rise_time,
-                "set_time": set_time,
-                "zodiac_sign": zodiac_sign,
-                "location": f"{lat},{lon}",
-                "influence": influence,
-            }
+            series = self.get_phase_series(target_date.date(), target_date.date())
+            return self.describe_moon_phase(
+                target_date, series.illumination[0], series.phase_angle[0], location
+            )
 
         except Exception as e:
             return {"error": f"Failed to calculate moon phase: {str(e)}"}
 
+    def describe_moon_phase(
+        self,
+        target_date: datetime,
+        illumination: float,
+        phase_angle: float,
+        location: str = "0,0",
+    ) -> dict[str, Any]:
+        """Build the moon phase details for a date from its phase values."""
+        lat, lon = self._parse_location(location)
+
+        # Moon rise/set times (simplified)
+        rise_time = "06:30"  # Placeholder - would need more complex calculation
+        set_time = "18:30"  # Placeholder
+
+        lunar_day = self._calculate_lunar_day(target_date)
+        phase_name = self._get_moon_phase_name(illumination, phase_angle)
+
+        # Get zodiac sign (simplified)
+        zodiac_signs = [
+            "Aries",
+            "Taurus",
+            "Gemini",
+            "Cancer",
+            "Leo",
+            "Virgo",
+            "Libra",
+            "Scorpio",
+            "Sagittarius",
+            "Capricorn",
+            "Aquarius",
+            "Pisces",
+        ]
+        zodiac_index = int((target_date.timetuple().tm_yday + lunar_day) / 30) % 12
+        zodiac_sign = zodiac_signs[zodiac_index]
+
+        influence = self._get_moon_influence_traditional(phase_name, lunar_day)
+
+        return {
+            "date": target_date.strftime("%Y-%m-%d"),
+            "phase_name": phase_name,
+            "illumination": round(illumination, 3),
+            "phase_angle": round(phase_angle, 1),
+            "lunar_day": lunar_day,
+            "rise_time": rise_time,
+            "set_time": set_time,
+            "zodiac_sign": zodiac_sign,
+            "location": f"{lat},{lon}",
+            "influence": influence,
+        }
+
     async def get_moon_calendar(
         self, month: int, year: int, location: str = "0,0"
     ) -> dict[str, Any]:
@@ -254,28 +587,31 @@ class LunarCalculator:
             calendar_data = []
 
             # Generate data for each day of the month
-            start_date = datetime(year, month, 1)
+            start_date = date(year, month, 1)
 
             # Find the last day of the month
             if month == 12:
-                end_date = datetime(year + 1, 1, 1) - timedelta(days=1)
+                end_date = date(year + 1, 1, 1) - timedelta(days=1)
             else:
-                end_date = datetime(year, month + 1, 1) - timedelta(days=1)
+                end_date = date(year, month + 1, 1) - timedelta(days=1)
 
-            current_date = start_date
-            while current_date <= end_date:
-                date_str = current_date.strftime("%Y-%m-%d")
-                moon_data = await self.get_moon_phase(date_str, location)
+            series = self.get_phase_series(start_date, end_date)
+            for current_date, illumination, phase_angle in zip(
+                series.dates(), series.illumination, series.phase_angle, strict=True
+            ):
                 calendar_data.append(
                     {
-                        "date": date_str,
+                        "date": current_date.strftime("%Y-%m-%d"),
                         "day": current_date.day,
-                        "phase_name": moon_data.get("phase_name"),
-                        "illumination": moon_data.get("illumination"),
-                        "lunar_day": moon_data.get("lunar_day"),
+                        "phase_name": self._get_moon_phase_name(
+                            illumination, phase_angle
+                        ),
+                        "illumination": round(illumination, 3),
+                        "lunar_day": self._calculate_lunar_day(
+                            datetime(year, month, current_date.day)
+                        ),
                     }
                 )
-                current_date += timedelta(days=1)
 
             return {
                 "month": month,
@@ -368,34 +704,32 @@ class LunarCalculator:
     ) -> dict[str, Any]:
         """Predict moon phases in a date range."""
         try:
-            start_date = datetime.strptime(start_date_str, "%Y-%m-%d")
-            end_date = datetime.strptime(end_date_str, "%Y-%m-%d")
+            start_date = datetime.strptime(start_date_str, "%Y-%m-%d").date()
+            end_date = datetime.strptime(end_date_str, "%Y-%m-%d").date()
+            years = end_date.year - start_date.year + 1
+            if years > MAX_PHASE_RANGE_YEARS:
+                return {
+                    "error": f"Date range too long: {years} calendar years "
+                    f"(maximum {MAX_PHASE_RANGE_YEARS})",
+                    "max_years": MAX_PHASE_RANGE_YEARS,
+                }
 
             phases = []
-            current_date = start_date
-
-            while current_date <= end_date:
-                date_str = current_date.strftime("%Y-%m-%d")
-                moon_data = await self.get_moon_phase(date_str)
-
-                # Include major phase transitions
-                phase_name = moon_data.get("phase_name")
-                if phase_name in [
-                    "New Moon",
-                    "First Quarter",
-                    "Full Moon",
-                    "Third Quarter",
-                ]:
-                    phases.append(
-                        {
-                            "date": date_str,
-                            "phase": phase_name,
-                            "illumination": moon_data.get("illumination"),
-                            "lunar_day": moon_data.get("lunar_day"),
-                        }
-                    )
-
-                current_date += timedelta(days=1)
+            for event in self.get_phase_events(start_date, end_date):
+                phase_angle = event.phase * 90
+                phases.append(
+                    {
+                        "date": event.time.strftime("%Y-%m-%d"),
+                        "time": event.time.strftime("%Y-%m-%dT%H:%M:%SZ"),
+                        "phase": event.name,
+                        "illumination": round(
+                            (1 - math.cos(math.radians(phase_angle))) / 2, 3
+                        ),
+                        "lunar_day": self._calculate_lunar_day(
+                            event.time.replace(tzinfo=None)
+                        ),
+                    }
+                )
 
             return {
                 "start_date": start_date_str,
@@ -0,0 +1,202 @@
+"""
+Precomputed Chinese lunar month table for fast solar/lunar conversion.
+
+The table covers lunar years 1900-2100 and is shipped as package data
+(``data/lunar_months.json``, generated by ``scripts/build_lunar_table.py``).
+Each lunar month is stored as a start ordinal, a month number and a leap flag,
+so conversions are a bisect in one direction and an index in the other, and
+spans of consecutive days are walked month by month.
+"""
+
+import json
+from array import array
+from bisect import bisect_right
+from collections.abc import Iterator
+from datetime import date
+from functools import lru_cache
+from importlib import resources
+from typing import Any, NamedTuple
+
+TABLE_RESOURCE = "data/lunar_months.json"
+
+
+class ChineseLunarDate(NamedTuple):
+    """A Chinese lunar calendar date."""
+
+    year: int
+    month: int
+    day: int
+    is_leap_month: bool
+
+
+class LunarMonthTable:
+    """Array-backed table of lunar months between two lunar years."""
+
+    def __init__(
+        self, first_year: int, first_new_year: date, years: list[list[int]]
+    ) -> None:
+        """Build month arrays from per-year (leap_month, length bitmask) rows."""
+        self.first_year = first_year
+        self.last_year = first_year + len(years) - 1
+
+        # One entry per month, plus a sentinel start closing the final month
+        self._month_starts = array("l")
+        self._month_numbers = array("b")
+        self._month_leaps = array("b")
+        self._month_years = array("h")
+        # Index of each lunar year's first month, plus a trailing sentinel
+        self._year_offsets = array("l")
+
+        ordinal = first_new_year.toordinal()
+        for offset, (leap_month, length_bits) in enumerate(years):
+            year = first_year + offset
+            self._year_offsets.append(len(self._month_starts))
+            month_count = 13 if leap_month else 12
+            month = 0
+            for position in range(month_count):
+                is_leap = bool(leap_month) and position == leap_month
+                if not is_leap:
+                    month += 1
+                self._month_starts.append(ordinal)
+                self._month_numbers.append(month)
+                self._month_leaps.append(is_leap)
+                self._month_years.append(year)
+                ordinal += 30 if length_bits >> position & 1 else 29
+
+        self._year_offsets.append(len(self._month_starts))
+        self._month_starts.append(ordinal)
+
+        self.min_ordinal = self._month_starts[0]
+        self.max_ordinal = ordinal - 1
+
+    @classmethod
+    def from_resource(cls) -> "LunarMonthTable":
+        """Load the table shipped with the package."""
+        raw = resources.files(__package__).joinpath(TABLE_RESOURCE).read_text("utf-8")
+        data: dict[str, Any] = json.loads(raw)
+        return cls(
+            data["first_year"],
+            date.fromisoformat(data["first_new_year"]),
+            data["years"],
+        )
+
+    @property
+    def min_date(self) -> date:
+        """First solar date covered by the table."""
+        return date.fromordinal(self.min_ordinal)
+
+    @property
+    def max_date(self) -> date:
+        """Last solar date covered by the table."""
+        return date.fromordinal(self.max_ordinal)
+
+    @property
+    def month_count(self) -> int:
+        """Number of lunar months in the table."""
+        return len(self._month_numbers)
+
+    def covers(self, solar_date: date) -> bool:
+        """Check whether a solar date falls inside the table."""
+        return self.min_ordinal <= solar_date.toordinal() <= self.max_ordinal
+
+    def from_ordinal(self, ordinal: int) -> ChineseLunarDate | None:
+        """Convert a solar date ordinal to a lunar date."""
+        if not self.min_ordinal <= ordinal <= self.max_ordinal:
+            return None
+
+        index = bisect_right(self._month_starts, ordinal) - 1
+        return ChineseLunarDate(
+            self._month_years[index],
+            self._month_numbers[index],
+            ordinal - self._month_starts[index] + 1,
+            bool(self._month_leaps[index]),
+        )
+
+    def span(self, start: int, stop: int) -> Iterator[ChineseLunarDate]:
+        """Yield the lunar date of each solar ordinal in ``[start, stop)``.
+
+        Raises ValueError when the span is not inside the table.
+        """
+        if start < self.min_ordinal or stop > self.max_ordinal + 1:
+            raise ValueError("Span outside the lunar month table")
+
+        index = bisect_right(self._month_starts, start) - 1
+        ordinal = start
+        while ordinal < stop:
+            month_start = self._month_starts[index]
+            month_stop = min(self._month_starts[index + 1], stop)
+            year = self._month_years[index]
+            month = self._month_numbers[index]
+            is_leap = bool(self._month_leaps[index])
+            for day in range(ordinal - month_start + 1, month_stop - month_start + 1):
+                yield ChineseLunarDate(year, month, day, is_leap)
+            ordinal = month_stop
+            index += 1
+
+    def solar_to_lunar(self, solar_date: date) -> ChineseLunarDate | None:
+        """Convert a solar date to a lunar date, or None when out of range."""
+        return self.from_ordinal(solar_date.toordinal())
+
+    def month_index(self, year: int, month: int, is_leap: bool = False) -> int | None:
+        """Locate a lunar month in the table."""
+        if not self.first_year <= year <= self.last_year or not 1 <= month <= 12:
+            return None
+
+        index = self._year_offsets[year - self.first_year] + month - 1
+        end = self._year_offsets[year - self.first_year + 1]
+        # Months after a leap month are shifted one slot to the right
+        if index < end and self._month_numbers[index] != month:
+            index += 1
+        if is_leap:
+            index += 1
+        if (
+            index >= end
+            or self._month_numbers[index] != month
+            or bool(self._month_leaps[index]) != is_leap
+        ):
+            return None
+        return index
+
+    def month_length(self, year: int, month: int, is_leap: bool = False) -> int | None:
+        """Get the number of days in a lunar month."""
+        index = self.month_index(year, month, is_leap)
+        if index is None:
+            return None
+        return self._month_starts[index + 1] - self._month_starts[index]
+
+    def leap_month(self, year: int) -> int:
+        """Get the leap month of a lunar year, or 0 when there is none."""
+        if not self.first_year <= year <= self.last_year:
+            return 0
+        start = self._year_offsets[year - self.first_year]
+        end = self._year_offsets[year - self.first_year + 1]
+        for index in range(start, end):
+            if self._month_leaps[index]:
+                return self._month_numbers[index]
+        return 0
+
+    def to_ordinal(
+        self, year: int, month: int, day: int, is_leap: bool = False
+    ) -> int | None:
+        """Convert a lunar date to a solar date ordinal."""
+        index = self.month_index(year, month, is_leap)
+        if index is None:
+            return None
+
+        start = self._month_starts[index]
+        if not 1 <= day <= self._month_starts[index + 1] - start:
+            return None
+        return start + day - 1
+
+    def lunar_to_solar(
+        self, year: int, month: int, day: int, is_leap: bool = False
+    ) -> date | None:
+        """Convert a lunar date to a solar date, or None when invalid."""
+        ordinal = self.to_ordinal(year, month, day, is_leap)
+        return date.fromordinal(ordinal) if ordinal is not None else None
+
+
+@lru_cache(maxsize=1)
+def get_lunar_table() -> LunarMonthTable:
+    """Get the process-wide lunar month table, loading it on first use."""
+    return LunarMonthTable.from_resource()
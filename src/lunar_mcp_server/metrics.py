@@ -0,0 +1,248 @@
+"""
+Per-tool call metrics.
+
+``ToolMetrics`` records the count, errors, latency and response size of
+every tool call in fixed-bucket histograms. It can render them as a JSON
+snapshot with estimated p50/p95/p99 latencies (served as an MCP resource)
+or in the Prometheus text exposition format, together with the counters of
+the server's caches and worker pool. ``start_metrics_server`` serves the
+Prometheus text on a local port without any extra dependency.
+
+Metrics are recorded from the event loop only and are not thread-safe.
+"""
+
+import asyncio
+import math
+from bisect import bisect_left
+from collections.abc import Callable, Iterable, Mapping
+from typing import Any
+
+# Latency buckets: 50 µs doubling up to about 13 s
+LATENCY_BUCKETS = tuple(0.00005 * 2**k for k in range(19))
+
+# Response size buckets: 256 bytes doubling up to 16 MiB
+SIZE_BUCKETS = tuple(256.0 * 2**k for k in range(17))
+
+QUANTILES = (0.5, 0.95, 0.99)
+
+# MCP resource serving the JSON snapshot
+METRICS_URI = "lunar://metrics/tools"
+
+PROMETHEUS_CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+
+class Histogram:
+    """Cumulative-bucket histogram of observed values."""
+
+    def __init__(self, buckets: tuple[float, ...]) -> None:
+        """Initialize with upper bucket bounds (an overflow bucket is added)."""
+        self.buckets = buckets
+        self.counts = [0] * (len(buckets) + 1)
+        self.count = 0
+        self.sum = 0.0
+
+    def observe(self, value: float) -> None:
+        """Record one value."""
+        self.counts[bisect_left(self.buckets, value)] += 1
+        self.count += 1
+        self.sum += value
+
+    def quantile(self, q: float) -> float | None:
+        """Estimate a quantile by interpolating within its bucket.
+
+        Values in the overflow bucket are reported as the largest bound.
+        """
+        if not self.count:
+            return None
+        rank = q * self.count
+        seen = 0
+        for index, count in enumerate(self.counts):
+            if count and seen + count >= rank:
+                if index == len(self.buckets):
+                    return self.buckets[-1]
+                lower = self.buckets[index - 1] if index else 0.0
+                upper = self.buckets[index]
+                return lower + (upper - lower) * (rank - seen) / count
+            seen += count
+        return self.buckets[-1]
+
+    def cumulative(self) -> list[tuple[str, int]]:
+        """Prometheus ``le`` labels with cumulative counts."""
+        result = []
+        total = 0
+        for bound, count in zip((*self.buckets, math.inf), self.counts, strict=True):
+            total += count
+            result.append(("+Inf" if bound == math.inf else f"{bound:g}", total))
+        return result
+
+
+class _ToolStats:
+    """Metrics of one tool."""
+
+    def __init__(self) -> None:
+        self.errors = 0
+        self.latency = Histogram(LATENCY_BUCKETS)
+        self.response_bytes = Histogram(SIZE_BUCKETS)
+
+
+class ToolMetrics:
+    """Call counts, errors, latencies and response sizes per tool.
+
+    ``sources`` maps a component name (``worker_pool``, ``day_facts_cache``,
+    ...) to a function returning its counters, included in every snapshot
+    and rendering.
+    """
+
+    def __init__(
+        self, sources: Mapping[str, Callable[[], dict[str, Any]]] | None = None
+    ) -> None:
+        """Initialize with no calls recorded."""
+        self.sources = dict(sources or {})
+        self._tools: dict[str, _ToolStats] = {}
+
+    def record(
+        self, tool: str, seconds: float, response_bytes: int, error: bool
+    ) -> None:
+        """Record one completed call."""
+        stats = self._tools.get(tool)
+        if stats is None:
+            stats = self._tools[tool] = _ToolStats()
+        stats.latency.observe(seconds)
+        stats.response_bytes.observe(response_bytes)
+        if error:
+            stats.errors += 1
+
+    def snapshot(self) -> dict[str, Any]:
+        """Per-tool metrics and component counters as a JSON-ready dict."""
+        tools = {}
+        for name, stats in sorted(self._tools.items()):
+            latency = stats.latency
+            entry: dict[str, Any] = {
+                "calls": latency.count,
+                "errors": stats.errors,
+                "latency_ms": {
+                    f"p{round(q * 100)}": _ms(latency.quantile(q)) for q in QUANTILES
+                },
+                "mean_latency_ms": _ms(latency.sum / latency.count),
+                "response_bytes": {
+                    "total": int(stats.response_bytes.sum),
+                    "mean": round(stats.response_bytes.sum / latency.count),
+                },
+            }
+            tools[name] = entry
+        return {
+            "tools": tools,
+            **{name: source() for name, source in self.sources.items()},
+        }
+
+    def render_prometheus(self) -> str:
+        """Render all metrics in the Prometheus text exposition format."""
+        lines: list[str] = []
+        _metric(
+            lines,
+            "lunar_mcp_tool_calls_total",
+            "counter",
+            "Tool calls completed.",
+            ((name, stats.latency.count) for name, stats in self._items()),
+        )
+        _metric(
+            lines,
+            "lunar_mcp_tool_errors_total",
+            "counter",
+            "Tool calls returning an error.",
+            ((name, stats.errors) for name, stats in self._items()),
+        )
+        _histogram(
+            lines,
+            "lunar_mcp_tool_latency_seconds",
+            "Tool call latency.",
+            ((name, stats.latency) for name, stats in self._items()),
+        )
+        _histogram(
+            lines,
+            "lunar_mcp_tool_response_bytes",
+            "Encoded size of tool results.",
+            ((name, stats.response_bytes) for name, stats in self._items()),
+        )
+        for source, counters in sorted(
+            (name, source()) for name, source in self.sources.items()
+        ):
+            for key, value in sorted(counters.items()):
+                if isinstance(value, bool) or not isinstance(value, int | float):
+                    continue
+                name = f"lunar_mcp_{source}_{key}"
+                lines.append(f"# TYPE {name} gauge")
+                lines.append(f"{name} {value}")
+        return "\n".join(lines) + "\n"
+
+    def _items(self) -> list[tuple[str, _ToolStats]]:
+        return sorted(self._tools.items())
+
+
+def _ms(seconds: float | None) -> float | None:
+    """Convert seconds to rounded milliseconds."""
+    return None if seconds is None else round(seconds * 1000, 3)
+
+
+def _metric(
+    lines: list[str],
+    name: str,
+    kind: str,
+    help_text: str,
+    values: Iterable[tuple[str, float]],
+) -> None:
+    """Append a per-tool metric family."""
+    lines.append(f"# HELP {name} {help_text}")
+    lines.append(f"# TYPE {name} {kind}")
+    for tool, value in values:
+        lines.append(f'{name}{{tool="{tool}"}} {value}')
+
+
+def _histogram(
+    lines: list[str],
+    name: str,
+    help_text: str,
+    histograms: Iterable[tuple[str, Histogram]],
+) -> None:
+    """Append a per-tool histogram family."""
+    lines.append(f"# HELP {name} {help_text}")
+    lines.append(f"# TYPE {name} histogram")
+    for tool, histogram in histograms:
+        for le, count in histogram.cumulative():
+            lines.append(f'{name}_bucket{{tool="{tool}",le="{le}"}} {count}')
+        lines.append(f'{name}_sum{{tool="{tool}"}} {histogram.sum:g}')
+        lines.append(f'{name}_count{{tool="{tool}"}} {histogram.count}')
+
+
+async def start_metrics_server(
+    render: Callable[[], str], host: str, port: int
+) -> asyncio.Server:
+    """Serve ``render()`` as Prometheus text at ``GET /metrics``."""
+
+    async def handle(
+        reader: asyncio.StreamReader, writer: asyncio.StreamWriter
+    ) -> None:
+        try:
+            request_line = await reader.readline()
+            # Skip the request headers
+            while (await reader.readline()).strip():
+                pass
+            method, _, rest = request_line.decode("latin-1").partition(" ")
+            path = rest.split(" ", 1)[0].split("?", 1)[0]
+            if method == "GET" and path == "/metrics":
+                status, content_type = "200 OK", PROMETHEUS_CONTENT_TYPE
+                body = render().encode()
+            else:
+                status, content_type = "404 Not Found", "text/plain"
+                body = b"Not Found\n"
+            writer.write(
+                f"HTTP/1.1 {status}\r\n"
+                f"Content-Type: {content_type}\r\n"
+                f"Content-Length: {len(body)}\r\n"
+                "Connection: close\r\n\r\n".encode() + body
+            )
+            await writer.drain()
+        finally:
+            writer.close()
+
+    return await asyncio.start_server(handle, host, port)
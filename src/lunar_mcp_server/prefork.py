@@ -0,0 +1,173 @@
+"""
+Pre-fork multi-process mode for the streamable HTTP transport.
+
+A ``Supervisor`` builds one ``LunarMCPServer`` and warms it: the ephemeris
+is mapped, and the score cycles, moon phase events, festival index and day
+facts around today are built. It then freezes the garbage collector, binds
+the listening socket and forks the worker processes, which all accept on
+that socket. Workers inherit the warm engine copy-on-write, so its tables
+are shared between processes instead of being rebuilt by every one.
+``gc.freeze()`` keeps the collector from touching (and so copying) the
+shared objects.
+
+The supervisor restarts workers that exit unexpectedly and forwards
+SIGINT/SIGTERM to them on shutdown. Each worker keeps its own metrics; with
+a metrics port configured, worker N serves them on ``metrics_port + N``.
+Forking needs a POSIX platform.
+"""
+
+import asyncio
+import gc
+import logging
+import os
+import signal
+import socket
+import time
+from datetime import date, timedelta
+from types import FrameType
+from typing import TYPE_CHECKING
+
+from .http_app import serve_http
+
+if TYPE_CHECKING:
+    from .server import LunarMCPServer
+
+logger = logging.getLogger(__name__)
+
+# Days of day facts built ahead of today before forking
+WARM_DAYS_AHEAD = 365
+
+# Workers exiting sooner than this after starting are restarted with a delay
+RESTART_DELAY_SECONDS = 1.0
+
+
+def warm_server(server: "LunarMCPServer") -> None:
+    """Build the shared tables of a server before its workers are forked."""
+    server.lunar_calc.warm_up()
+    checker = server.auspicious_checker
+    activities = {
+        activity
+        for rules in checker.mansion_activities.values()
+        for activity in rules["good"] + rules["bad"]
+    }
+    for activity in sorted(activities):
+        checker._score_cycle(activity)
+
+    today = date.today()
+    for year in (today.year, today.year + 1):
+        server.lunar_calc.get_phase_events(date(year, 1, 1), date(year, 12, 31))
+        asyncio.run(server.festival_manager.get_annual_festivals(year, "chinese"))
+    server.engine.day_facts_range(today, today + timedelta(days=WARM_DAYS_AHEAD))
+
+    # Move everything built so far out of the collector's reach, so
+    # collections in the workers do not write to the shared pages
+    gc.collect()
+    gc.freeze()
+
+
+class Supervisor:
+    """Forks and supervises HTTP worker processes sharing one socket."""
+
+    def __init__(self, server: "LunarMCPServer", workers: int) -> None:
+        """Initialize the supervisor of ``workers`` processes."""
+        if not hasattr(os, "fork"):
+            raise RuntimeError("Pre-fork workers need os.fork (POSIX only)")
+        self.server = server
+        self.workers = workers
+        # Worker pid -> (worker index, start time)
+        self.children: dict[int, tuple[int, float]] = {}
+        self.stopping = False
+        self.socket: socket.socket | None = None
+
+    def bind(self) -> socket.socket:
+        """Open the listening socket shared by the workers."""
+        settings = self.server.engine.settings
+        sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+        sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+        sock.bind((settings.http_host, settings.http_port))
+        sock.listen(2048)
+        sock.set_inheritable(True)
+        return sock
+
+    def run(self) -> None:
+        """Warm the server, fork the workers and supervise them until stopped."""
+        started = time.perf_counter()
+        warm_server(self.server)
+        logger.info(
+            "Engine warmed in %.0f ms, forking %d workers",
+            (time.perf_counter() - started) * 1000,
+            self.workers,
+        )
+        self.socket = self.bind()
+        signal.signal(signal.SIGTERM, self._stop)
+        signal.signal(signal.SIGINT, self._stop)
+        try:
+            for index in range(self.workers):
+                self._spawn(index)
+            self._supervise()
+        finally:
+            self.socket.close()
+
+    def _spawn(self, index: int) -> None:
+        """Fork the worker process with the given index."""
+        pid = os.fork()
+        if pid == 0:
+            self._run_worker(index)
+        self.children[pid] = (index, time.monotonic())
+
+    def _run_worker(self, index: int) -> None:
+        """Serve requests in a forked worker, then exit the process."""
+        assert self.socket is not None
+        signal.signal(signal.SIGTERM, signal.SIG_DFL)
+        signal.signal(signal.SIGINT, signal.SIG_DFL)
+        code = 0
+        try:
+            asyncio.run(self._serve(self.socket, index))
+        except BaseException:
+            logger.exception("Worker %d failed", os.getpid())
+            code = 1
+        finally:
+            os._exit(code)
+
+    async def _serve(self, sock: socket.socket, index: int) -> None:
+        """Serve HTTP on the shared socket until shutdown."""
+        metrics_port = self.server.engine.settings.metrics_port
+        metrics_server = None
+        if metrics_port > 0:
+            metrics_server = await self.server.serve_metrics(metrics_port + index)
+        try:
+            await serve_http(self.server, [sock])
+        finally:
+            if metrics_server is not None:
+                metrics_server.close()
+            self.server.worker_pool.shutdown()
+
+    def _supervise(self) -> None:
+        """Reap workers, restarting them unless shutting down."""
+        while self.children:
+            try:
+                pid, status = os.wait()
+            except ChildProcessError:
+                break
+            child = self.children.pop(pid, None)
+            if child is None or self.stopping:
+                continue
+            index, started = child
+            logger.warning(
+                "Worker %d exited with status %d, restarting",
+                pid,
+                os.waitstatus_to_exitcode(status),
+            )
+            if time.monotonic() - started < RESTART_DELAY_SECONDS:
+                time.sleep(RESTART_DELAY_SECONDS)
+            if not self.stopping:
+                self._spawn(index)
+
+    def _stop(self, signum: int, frame: FrameType | None) -> None:
+        """Forward a shutdown signal to the workers."""
+        self.stopping = True
+        for pid in self.children:
+            try:
+                os.kill(pid, signal.SIGTERM)
+            except ProcessLookupError:
+                pass
@@ -0,0 +1,224 @@
+"""
+Sampled profiling of tool calls.
+
+With ``LUNAR_MCP_PROFILE_SAMPLE_RATE`` above 0 the server gets a
+``CallProfiler``, which picks that fraction of the tool calls that are
+actually computed (not result cache hits or coalesced waits) and runs their
+handler and result encoding under cProfile, on the thread doing the work.
+Each profiled call writes files sharing the stem
+``<time>-<tool>-<argument hash>-<pid>-<n>`` to the profile directory:
+
+- ``.pstats``: cProfile statistics, for ``pstats`` or snakeviz
+- ``.collapsed``: collapsed stacks (``a;b;c <microseconds>``) for
+  flamegraph.pl or speedscope, estimated from the caller graph
+- ``.json``: tool name, arguments and elapsed time, plus the peak traced
+  memory and top allocation sites when memory tracing is on
+- ``.tracemalloc``: the tracemalloc snapshot at the end of the call, when
+  memory tracing is on (``LUNAR_MCP_PROFILE_MEMORY``)
+
+With sampling off the server has no profiler and calls pay nothing.
+tracemalloc is process-wide, so only one call at a time is traced and its
+allocations include those of other threads running meanwhile. Tools running
+on the event loop are profiled there, so other coroutines resumed while the
+handler awaits show up in its profile.
+"""
+
+import cProfile
+import hashlib
+import itertools
+import json
+import logging
+import os
+import pstats
+import random
+import tempfile
+import threading
+import time
+import tracemalloc
+from collections import defaultdict
+from collections.abc import Awaitable, Callable
+from pathlib import Path
+from typing import Any, TypeVar
+
+from .single_flight import call_key
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+# Allocation sites listed in the .json summary
+TOP_ALLOCATIONS = 25
+
+# Stack frames tracemalloc keeps per allocation
+TRACEMALLOC_FRAMES = 16
+
+# Stacks taking less than this fraction of a call are left out of .collapsed
+MIN_STACK_FRACTION = 1e-4
+
+# A pstats function key: (file name, line number, function name)
+Function = tuple[str, int, str]
+
+
+def default_profile_dir() -> str:
+    """Profile directory used when none is configured."""
+    return os.path.join(tempfile.gettempdir(), "lunar-mcp-profiles")
+
+
+def _label(function: Function) -> str:
+    """Frame label of a function in collapsed stacks."""
+    file_name, line, name = function
+    if file_name == "~":
+        # Built-in functions have no source location
+        label = name
+    else:
+        label = f"{name} ({os.path.basename(file_name)}:{line})"
+    return label.replace(";", ",")
+
+
+def collapsed_stacks(stats: pstats.Stats) -> dict[str, float]:
+    """Estimate the time of each call stack, in microseconds.
+
+    cProfile only records caller/callee pairs, so the time of a function is
+    split between the stacks reaching it in proportion to the time spent
+    in it from each caller.
+    """
+    raw: dict[Function, Any] = stats.stats  # type: ignore[attr-defined]
+    callees: dict[Function, list[tuple[Function, float]]] = defaultdict(list)
+    for function, (_, _, _, _, callers) in raw.items():
+        for caller, (_, _, _, caller_time) in callers.items():
+            callees[caller].append((function, caller_time))
+    roots = [function for function, value in raw.items() if not value[4]]
+    total = sum(raw[function][3] for function in roots)
+    min_seconds = total * MIN_STACK_FRACTION
+    stacks: dict[str, float] = defaultdict(float)
+
+    def walk(function: Function, path: tuple[Function, ...], seconds: float) -> None:
+        _, _, own_time, cumulative, _ = raw[function]
+        path = (*path, function)
+        share = seconds / cumulative if cumulative else 0.0
+        if own_time * share > 0:
+            stacks[";".join(map(_label, path))] += own_time * share * 1e6
+        for callee, callee_time in callees[function]:
+            # Recursive calls are already counted in the outer frame
+            if callee not in path and callee_time * share >= min_seconds:
+                walk(callee, path, callee_time * share)
+
+    for root in roots:
+        walk(root, (), raw[root][3])
+    return dict(stacks)
+
+
+class CallProfiler:
+    """Profiles a sampled fraction of tool calls to files."""
+
+    def __init__(
+        self,
+        directory: str,
+        sample_rate: float,
+        trace_memory: bool = False,
+        sampler: Callable[[], float] = random.random,
+    ) -> None:
+        """Initialize the profiler.
+
+        ``sampler`` returns a number in [0, 1) and picks the profiled calls.
+        """
+        self.directory = Path(directory)
+        self.sample_rate = sample_rate
+        self.trace_memory = trace_memory
+        self._sampler = sampler
+        self._memory_lock = threading.Lock()
+        self._sequence = itertools.count(1)
+        self.profiled = 0
+
+    def sample(self) -> bool:
+        """Decide whether to profile the next call."""
+        return self._sampler() < self.sample_rate
+
+    async def profile(
+        self,
+        tool: str,
+        arguments: dict[str, Any],
+        factory: Callable[[], Awaitable[T]],
+    ) -> T:
+        """Run ``factory()`` under cProfile and write its profile files."""
+        trace = self.trace_memory and self._memory_lock.acquire(blocking=False)
+        started_tracing = False
+        if trace:
+            if not tracemalloc.is_tracing():
+                tracemalloc.start(TRACEMALLOC_FRAMES)
+                started_tracing = True
+            tracemalloc.reset_peak()
+        profiler = cProfile.Profile()
+        started = time.perf_counter()
+        profiler.enable()
+        try:
+            return await factory()
+        finally:
+            profiler.disable()
+            elapsed = time.perf_counter() - started
+            snapshot = None
+            peak = 0
+            if trace:
+                snapshot = tracemalloc.take_snapshot()
+                peak = tracemalloc.get_traced_memory()[1]
+                if started_tracing:
+                    tracemalloc.stop()
+                self._memory_lock.release()
+            try:
+                self._write(tool, arguments, elapsed, profiler, snapshot, peak)
+            except OSError:
+                logger.exception("Could not write the profile of %s", tool)
+
+    def _write(
+        self,
+        tool: str,
+        arguments: dict[str, Any],
+        elapsed: float,
+        profiler: cProfile.Profile,
+        snapshot: tracemalloc.Snapshot | None,
+        peak: int,
+    ) -> None:
+        """Write the files of one profiled call."""
+        self.directory.mkdir(parents=True, exist_ok=True)
+        digest = hashlib.sha1(call_key(tool, arguments).encode()).hexdigest()[:8]
+        stem = (
+            f"{time.strftime('%Y%m%dT%H%M%S')}-{tool}-{digest}"
+            f"-{os.getpid()}-{next(self._sequence)}"
+        )
+        base = self.directory / stem
+
+        stats = pstats.Stats(profiler)
+        stats.dump_stats(f"{base}.pstats")
+        stacks = collapsed_stacks(stats)
+        Path(f"{base}.collapsed").write_text(
+            "".join(
+                f"{stack} {round(micros)}\n"
+                for stack, micros in sorted(stacks.items())
+                if round(micros)
+            )
+        )
+
+        summary: dict[str, Any] = {
+            "tool": tool,
+            "arguments": arguments,
+            "elapsed_ms": round(elapsed * 1000, 3),
+            "pid": os.getpid(),
+            "thread": threading.current_thread().name,
+        }
+        if snapshot is not None:
+            snapshot.dump(f"{base}.tracemalloc")
+            summary["memory"] = {
+                "peak_bytes": peak,
+                "top_allocations": [
+                    {
+                        "location": f"{stat.traceback[0].filename}:"
+                        f"{stat.traceback[0].lineno}",
+                        "size_bytes": stat.size,
+                        "count": stat.count,
+                    }
+                    for stat in snapshot.statistics("lineno")[:TOP_ALLOCATIONS]
+                ],
+            }
+        Path(f"{base}.json").write_text(json.dumps(summary, indent=2, default=str))
+        self.profiled += 1
+        logger.info("Profiled %s in %.1f ms: %s", tool, elapsed * 1000, stem)
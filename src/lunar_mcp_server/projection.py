@@ -0,0 +1,40 @@
+"""
+Field projection for tool results.
+
+Heavy tools accept a ``fields`` argument naming the top-level result keys to
+return. A ``Projection`` tells the tool which sections are wanted, so it
+only computes those, and trims the finished result to them.
+"""
+
+from collections.abc import Collection, Iterable
+from typing import Any
+
+
+class Projection:
+    """The requested top-level fields of a tool result."""
+
+    def __init__(
+        self,
+        fields: Iterable[str] | None,
+        available: Collection[str],
+        always: Iterable[str] = (),
+    ) -> None:
+        """Select ``fields`` (all of ``available`` when empty or None).
+
+        Keys in ``always`` identify the result and are always kept.
+        """
+        requested = frozenset(fields or ())
+        unknown = requested.difference(available)
+        if unknown:
+            raise ValueError(f"Unknown fields: {', '.join(sorted(unknown))}")
+        self.selected = requested.union(always) if requested else None
+
+    def wants(self, *names: str) -> bool:
+        """Check whether any of the named fields is requested."""
+        return self.selected is None or not self.selected.isdisjoint(names)
+
+    def apply(self, result: dict[str, Any]) -> dict[str, Any]:
+        """Keep only the requested keys of a result."""
+        if self.selected is None:
+            return result
+        return {key: value for key, value in result.items() if key in self.selected}
@@ -0,0 +1,149 @@
+"""
+Cache of serialized tool results.
+
+Most tools are pure functions of their arguments, so their encoded results
+can be reused for identical calls. ``ResultCache`` is an LRU bounded by
+both entry count and encoded size, with a time to live per entry. Tools
+whose results read the clock declare the unit they depend on (see
+``tools.CLOCK_DEPENDENT_TOOLS``), and their entries also expire when that
+unit rolls over, e.g. at the next hour for the current hour's zodiac.
+
+The cache is used from the event loop only and is not thread-safe.
+"""
+
+import time
+from collections import OrderedDict
+from collections.abc import Callable
+from datetime import datetime, timedelta
+from typing import Any, NamedTuple
+
+# Clock units a result can depend on
+CLOCK_UNITS = ("hour", "day")
+
+
+def seconds_until_rollover(clock: str, now: datetime) -> float:
+    """Seconds from ``now`` (local time) until the clock unit changes."""
+    if clock == "hour":
+        start = now.replace(minute=0, second=0, microsecond=0)
+        rollover = start + timedelta(hours=1)
+    elif clock == "day":
+        start = now.replace(hour=0, minute=0, second=0, microsecond=0)
+        rollover = start + timedelta(days=1)
+    else:
+        raise ValueError(f"Unknown clock unit: {clock}")
+    return (rollover - now).total_seconds()
+
+
+class CachedResult(NamedTuple):
+    """An encoded result and its size in bytes."""
+
+    text: str
+    size: int
+
+
+class _Entry(NamedTuple):
+    text: str
+    size: int
+    expires_at: float
+
+
+class ResultCache:
+    """LRU of encoded tool results bounded by entries and bytes."""
+
+    def __init__(
+        self,
+        max_entries: int,
+        max_bytes: int,
+        clock: Callable[[], float] = time.time,
+    ) -> None:
+        """Initialize an empty cache.
+
+        ``clock`` returns the current Unix time and is used for expiry.
+        """
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self._clock = clock
+        self._entries: OrderedDict[str, _Entry] = OrderedDict()
+        self.bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, key: str) -> str | None:
+        """Look up a result, counting the hit or miss."""
+        cached = self.lookup(key)
+        return cached.text if cached is not None else None
+
+    def lookup(self, key: str) -> CachedResult | None:
+        """Look up a result with its encoded size, counting the hit or miss."""
+        entry = self._entries.get(key)
+        if entry is not None and entry.expires_at <= self._clock():
+            self._remove(key)
+            self.expirations += 1
+            entry = None
+        if entry is None:
+            self.misses += 1
+            return None
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return CachedResult(entry.text, entry.size)
+
+    def put(
+        self,
+        key: str,
+        text: str,
+        ttl: float,
+        clock: str | None = None,
+        size: int | None = None,
+    ) -> None:
+        """Store a result for ``ttl`` seconds.
+
+        With a ``clock`` unit the entry also expires when that unit rolls
+        over. ``size`` is the UTF-8 length of ``text`` when the caller has
+        already measured it. Results larger than the whole cache are not
+        stored.
+        """
+        now = self._clock()
+        if clock is not None:
+            ttl = min(ttl, seconds_until_rollover(clock, datetime.fromtimestamp(now)))
+        if size is None:
+            size = len(text.encode())
+        if ttl <= 0 or size > self.max_bytes:
+            return
+        if key in self._entries:
+            self._remove(key)
+        self._entries[key] = _Entry(text, size, now + ttl)
+        self.bytes += size
+        while len(self._entries) > self.max_entries or self.bytes > self.max_bytes:
+            self._remove(next(iter(self._entries)))
+            self.evictions += 1
+
+    def _remove(self, key: str) -> None:
+        """Drop an entry and its size."""
+        self.bytes -= self._entries.pop(key).size
+
+    def clear(self) -> None:
+        """Drop all results and reset the counters."""
+        self._entries.clear()
+        self.bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+
+    def stats(self) -> dict[str, Any]:
+        """Cache counters for monitoring."""
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "expirations": self.expirations,
+            "size": len(self._entries),
+            "bytes": self.bytes,
+            "max_entries": self.max_entries,
+            "max_bytes": self.max_bytes,
+        }
@@ -0,0 +1,74 @@
+"""
+JSON serialization of tool results.
+
+Results are encoded compactly by default, with orjson when it is installed
+and the standard library otherwise. Pretty-printing (two-space indentation)
+is only used when requested through ``LUNAR_MCP_JSON_PRETTY``.
+"""
+
+import json
+from collections.abc import Callable
+from typing import Any
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - depends on the environment
+    orjson = None  # type: ignore[assignment]
+
+Serializer = Callable[[Any], str]
+
+BACKENDS = ("auto", "orjson", "json")
+
+
+def _default(value: Any) -> Any:
+    """Encode values the JSON backends do not handle natively.
+
+    Numeric scalars such as ``numpy.float64`` stay numbers; anything else
+    (dates, for instance) is encoded as its string form.
+    """
+    if isinstance(value, float):
+        return float(value)
+    if hasattr(value, "item"):
+        # numpy scalars
+        return value.item()
+    return str(value)
+
+
+def _orjson_serializer(pretty: bool) -> Serializer:
+    """Build an orjson serializer (non-string keys such as months allowed)."""
+    option = orjson.OPT_NON_STR_KEYS
+    if pretty:
+        option |= orjson.OPT_INDENT_2
+
+    def serialize(result: Any) -> str:
+        return orjson.dumps(result, default=_default, option=option).decode()
+
+    return serialize
+
+
+def _json_serializer(pretty: bool) -> Serializer:
+    """Build a standard library serializer."""
+    if pretty:
+        options: dict[str, Any] = {"indent": 2}
+    else:
+        options = {"separators": (",", ":")}
+
+    def serialize(result: Any) -> str:
+        return json.dumps(result, ensure_ascii=False, default=_default, **options)
+
+    return serialize
+
+
+def get_serializer(backend: str = "auto", pretty: bool = False) -> Serializer:
+    """Get a result serializer.
+
+    ``backend`` is ``"orjson"``, ``"json"`` or ``"auto"`` (orjson when
+    installed).
+    """
+    if backend not in BACKENDS:
+        raise ValueError(f"Unknown JSON backend: {backend}")
+    if backend == "orjson" and orjson is None:
+        raise ValueError("JSON backend 'orjson' requires the orjson package")
+    if backend != "json" and orjson is not None:
+        return _orjson_serializer(pretty)
+    return _json_serializer(pretty)
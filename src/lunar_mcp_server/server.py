@@ -2,30 +2,104 @@
 Main MCP server implementation for Lunar Calendar services.
 """
 
+import argparse
 import asyncio
-import json
+import dataclasses
+import functools
 import logging
-from typing import Any
+import threading
+import time
+from collections.abc import Awaitable, Callable, Sequence
+from contextlib import AbstractAsyncContextManager, nullcontext
+from datetime import datetime
+from typing import TYPE_CHECKING, Any
 
 from mcp.server import Server
 from mcp.server.lowlevel import NotificationOptions
-from mcp.types import TextContent, Tool
+from mcp.server.lowlevel.helper_types import ReadResourceContents
+from mcp.types import Resource, TextContent, Tool
+from pydantic import AnyUrl
 
 from .auspicious_dates import AuspiciousDateChecker
-from .calendar_conversions import CalendarConverter
+from .config import Settings
+from .engine import LunarEngine, get_engine
 from .festivals import FestivalManager
-from .lunar_calculations import LunarCalculator
+from .metrics import METRICS_URI, ToolMetrics, start_metrics_server
+from .result_cache import ResultCache
+from .serialization import get_serializer
+from .single_flight import SingleFlight, call_key
+from .tools import TOOLS, ToolHandler, build_registry
+from .worker_pool import WorkerPool
+
+if TYPE_CHECKING:
+    from .profiling import CallProfiler
+
+logger = logging.getLogger(__name__)
+
+METRICS_RESOURCE = Resource(
+    uri=AnyUrl(METRICS_URI),
+    name="tool-metrics",
+    description="Per-tool call counts, errors, latency percentiles and "
+    "response sizes, with cache and worker pool counters",
+    mimeType="application/json",
+)
 
 
 class LunarMCPServer:
     """MCP Server for Lunar Calendar operations."""
 
-    def __init__(self) -> None:
+    def __init__(self, engine: LunarEngine | None = None) -> None:
         self.server = Server("lunar-mcp-server", version="0.1.0")
-        self.lunar_calc = LunarCalculator()
-        self.auspicious_checker = AuspiciousDateChecker()
-        self.festival_manager = FestivalManager()
-        self.calendar_converter = CalendarConverter()
+        self.engine = engine or get_engine()
+        self.lunar_calc = self.engine.lunar_calc
+        self.auspicious_checker = AuspiciousDateChecker(self.engine)
+        self.festival_manager = FestivalManager(self.engine)
+        self.calendar_converter = self.engine.calendar_converter
+        # Tool handlers are the methods named after each tool
+        self.tools = build_registry(
+            {tool.name: getattr(self, f"_{tool.name}") for tool in TOOLS}
+        )
+        self._tool_definitions = [tool.definition for tool in self.tools.values()]
+        settings = self.engine.settings
+        self._serialize = get_serializer(settings.json_backend, settings.json_pretty)
+        # Blocking calculations run here so the event loop stays responsive
+        self.worker_pool = WorkerPool("calc", settings.worker_threads)
+        max_calls = settings.max_concurrent_calls
+        # Bounds the tool calls in flight across all sessions of a process
+        self._call_slots: AbstractAsyncContextManager[Any] = (
+            asyncio.Semaphore(max_calls) if max_calls > 0 else nullcontext()
+        )
+        # Identical calls in flight at the same time share one computation
+        self.single_flight = SingleFlight() if settings.coalesce_calls else None
+        # Encoded results of identical earlier calls
+        self.result_cache = (
+            ResultCache(
+                settings.result_cache_max_entries, settings.result_cache_max_bytes
+            )
+            if settings.result_cache_ttl > 0
+            else None
+        )
+        # Sampled cProfile/tracemalloc profiles of computed calls; the
+        # profiling modules are only imported when sampling is on
+        self.profiler: CallProfiler | None = None
+        if settings.profile_sample_rate > 0:
+            from . import profiling
+
+            self.profiler = profiling.CallProfiler(
+                settings.profile_dir or profiling.default_profile_dir(),
+                settings.profile_sample_rate,
+                settings.profile_memory,
+            )
+        # Call metrics, reported with the counters of these components
+        sources: dict[str, Callable[[], dict[str, Any]]] = {
+            "worker_pool": self.worker_pool.stats,
+            "day_facts_cache": self.engine.day_facts_cache.stats,
+        }
+        if self.result_cache is not None:
+            sources["result_cache"] = self.result_cache.stats
+        if self.single_flight is not None:
+            sources["single_flight"] = self.single_flight.stats
+        self.metrics = ToolMetrics(sources)
         self._setup_handlers()
 
     def _setup_handlers(self) -> None:
@@ -34,437 +108,130 @@ class LunarMCPServer:
         @self.server.list_tools()
         async def handle_list_tools() -> list[Tool]:
             """List available tools."""
-            return [
-                Tool(
-                    name="check_auspicious_date",
-                    description="Check if a date is favorable for specific activities",
-                    inputSchema={
-                        "type": "object",
-                        "properties": {
-                            "date": {
-                                "type": "string",
-                                "description": "Date in YYYY-MM-DD format",
-                            },
-                            "activity": {
-                                "type": "string",
-                                "description": "Activity type (e.g., wedding, business_opening, travel)",
-                            },
-                            "culture": {
-                                "type": "string",
-                                "description": "Cultural tradition (chinese)",
-                                "default": "chinese",
-                            },
-                        },
-                        "required": ["date", "activity"],
-                    },
-                ),
-                Tool(
-                    name="find_good_dates",
-                    description="Find optimal dates in a range for specific activities",
-                    inputSchema={
-                        "type": "object",
-                        "properties": {
-                            "start_date": {
-                                "type": "string",
-                                "description": "Start date in YYYY-MM-DD format",
-                            },
-                            "end_date": {
-                                "type": "string",
-                                "description": "End date in YYYY-MM-DD format",
-                            },
-                            "activity": {
-                                "type": "string",
-                                "description": "Activity type",
-                            },
-                            "culture": {
-                                "type": "string",
-                                "description": "Cultural tradition",
-                                "default": "chinese",
-                            },
-                            "limit": {
-                                "type": "integer",
-                                "description": "Maximum number of dates to return",
-                                "default": 10,
-                            },
-                        },
-                        "required": ["start_date", "end_date", "activity"],
-                    },
-                ),
-                Tool(
-                    name="get_daily_fortune",
-                    description="Get daily fortune and luck information",
-                    inputSchema={
-                        "type": "object",
-                        "properties": {
-                            "date": {
-                                "type": "string",
-                                "description": "Date in YYYY-MM-DD format",
-                            },
-                            "culture": {
-                                "type": "string",
-                                "description": "Cultural tradition",
-                                "default": "chinese",
-                            },
-                        },
-                        "required": ["date"],
-                    },
-                ),
-                Tool(
-                    name="check_zodiac_compatibility",
-                    description="Check compatibility between dates based on zodiac",
-                    inputSchema={
-                        "type": "object",
-                        "properties": {
-                            "date1": {
-                                "type": "string",
-                                "description": "First date in YYYY-MM-DD format",
-                            },
-                            "date2": {
-                                "type": "string",
-                                "description": "Second date in YYYY-MM-DD format",
-                            },
-                            "culture": {
-                                "type": "string",
-                                "description": "Cultural tradition",
-                                "default": "chinese",
-                            },
-                        },
-                        "required": ["date1", "date2"],
-                    },
-                ),
-                Tool(
-                    name="get_lunar_festivals",
-                    description="Get festivals for a specific date",
-                    inputSchema={
-                        "type": "object",
-                        "properties": {
-                            "date": {
-                                "type": "string",
-                                "description": "Date in YYYY-MM-DD format",
-                            },
-                            "culture": {
-                                "type": "string",
-                                "description": "Cultural tradition",
-                                "default": "chinese",
-                            },
-                        },
-                        "required": ["date"],
-                    },
-                ),
-                Tool(
-                    name="get_next_festival",
-                    description="Find next upcoming festival",
-                    inputSchema={
-                        "type": "object",
-                        "properties": {
-                            "date": {
-                                "type": "string",
-                                "description": "Reference date in YYYY-MM-DD format",
-                            },
-                            "culture": {
-                                "type": "string",
-                                "description": "Cultural tradition",
-                                "default": "chinese",
-                            },
-                        },
-                        "required": ["date"],
-                    },
-                ),
-                Tool(
-                    name="get_festival_details",
-                    description="Get detailed festival information",
-                    inputSchema={
-                        "type": "object",
-                        "properties": {
-                            "festival_name": {
-                                "type": "string",
-                                "description": "Name of the festival",
-                            },
-                            "culture": {
-                                "type": "string",
-                                "description": "Cultural tradition",
-                                "default": "chinese",
-                            },
-                        },
-                        "required": ["festival_name"],
-                    },
-                ),
-                Tool(
-                    name="get_annual_festivals",
-                    description="Get all festivals for a year",
-                    inputSchema={
-                        "type": "object",
-                        "properties": {
-                            "year": {"type": "integer", "description": "Year"},
-                            "culture": {
-                                "type": "string",
-                                "description": "Cultural tradition",
-                                "default": "chinese",
-                            },
-                        },
-                        "required": ["year"],
-                    },
-                ),
-                Tool(
-                    name="get_moon_phase",
-                    description="Get current moon phase with details",
-                    inputSchema={
-                        "type": "object",
-                        "properties": {
-                            "date": {
-                                "type": "string",
-                                "description": "Date in YYYY-MM-DD format",
-                            },
-                            "location": {
-                                "type": "string",
-                                "description": "Location for calculations (lat,lon or city name)",
-                                "default": "0,0",
-                            },
-                        },
-                        "required": ["date"],
-                    },
-                ),
-                Tool(
-                    name="get_moon_calendar",
-                    description="Get monthly calendar with moon phases",
-                    inputSchema={
-                        "type": "object",
-                        "properties": {
-                            "month": {"type": "integer", "description": "Month (1-12)"},
-                            "year": {"type": "integer", "description": "Year"},
-                            "location": {
-                                "type": "string",
-                                "description": "Location for calculations",
-                                "default": "0,0",
-                            },
-                        },
-                        "required": ["month", "year"],
-                    },
-                ),
-                Tool(
-                    name="get_moon_influence",
-                    description="Get how moon affects specific activities",
-                    inputSchema={
-                        "type": "object",
-                        "properties": {
-                            "date": {
-                                "type": "string",
-                                "description": "Date in YYYY-MM-DD format",
-                            },
-                            "activity": {
-                                "type": "string",
-                                "description": "Activity type",
-                            },
-                        },
-                        "required": ["date", "activity"],
-                    },
-                ),
-                Tool(
-                    name="predict_moon_phases",
-                    description="Predict future moon phases in date range",
-                    inputSchema={
-                        "type": "object",
-                        "properties": {
-                            "start_date": {
-                                "type": "string",
-                                "description": "Start date in YYYY-MM-DD format",
-                            },
-                            "end_date": {
-                                "type": "string",
-                                "description": "End date in YYYY-MM-DD format",
-                            },
-                        },
-                        "required": ["start_date", "end_date"],
-                    },
-                ),
-                Tool(
-                    name="solar_to_lunar",
-                    description="Convert solar date to lunar date",
-                    inputSchema={
-                        "type": "object",
-                        "properties": {
-                            "solar_date": {
-                                "type": "string",
-                                "description": "Solar date in YYYY-MM-DD format",
-                            },
-                            "culture": {
-                                "type": "string",
-                                "description": "Cultural tradition",
-                                "default": "chinese",
-                            },
-                        },
-                        "required": ["solar_date"],
-                    },
-                ),
-                Tool(
-                    name="lunar_to_solar",
-                    description="Convert lunar date to solar date",
-                    inputSchema={
-                        "type": "object",
-                        "properties": {
-                            "lunar_date": {
-                                "type": "string",
-                                "description": "Lunar date in YYYY-MM-DD format",
-                            },
-                            "culture": {
-                                "type": "string",
-                                "description": "Cultural tradition",
-                                "default": "chinese",
-                            },
-                        },
-                        "required": ["lunar_date"],
-                    },
-                ),
-                Tool(
-                    name="get_zodiac_info",
-                    description="Get zodiac animal/sign information for date",
-                    inputSchema={
-                        "type": "object",
-                        "properties": {
-                            "date": {
-                                "type": "string",
-                                "description": "Date in YYYY-MM-DD format",
-                            },
-                            "culture": {
-                                "type": "string",
-                                "description": "Cultural tradition",
-                                "default": "chinese",
-                            },
-                        },
-                        "required": ["date"],
-                    },
-                ),
-                Tool(
-                    name="batch_check_dates",
-                    description="Check multiple dates at once for efficiency",
-                    inputSchema={
-                        "type": "object",
-                        "properties": {
-                            "dates": {
-                                "type": "array",
-                                "items": {"type": "string"},
-                                "description": "Array of dates in YYYY-MM-DD format",
-                            },
-                            "activity": {
-                                "type": "string",
-                                "description": "Activity type",
-                            },
-                            "culture": {
-                                "type": "string",
-                                "description": "Cultural tradition",
-                                "default": "chinese",
-                            },
-                        },
-                        "required": ["dates", "activity"],
-                    },
-                ),
-                Tool(
-                    name="compare_dates",
-                    description="Compare multiple dates side-by-side",
-                    inputSchema={
-                        "type": "object",
-                        "properties": {
-                            "dates": {
-                                "type": "array",
-                                "items": {"type": "string"},
-                                "description": "Array of dates to compare",
-                            },
-                            "activity": {
-                                "type": "string",
-                                "description": "Activity type for comparison",
-                            },
-                            "culture": {
-                                "type": "string",
-                                "description": "Cultural tradition",
-                                "default": "chinese",
-                            },
-                        },
-                        "required": ["dates"],
-                    },
-                ),
-                Tool(
-                    name="get_lucky_hours",
-                    description="Get auspicious hours within a specific day",
-                    inputSchema={
-                        "type": "object",
-                        "properties": {
-                            "date": {
-                                "type": "string",
-                                "description": "Date in YYYY-MM-DD format",
-                            },
-                            "activity": {
-                                "type": "string",
-                                "description": "Activity type",
-                            },
-                            "culture": {
-                                "type": "string",
-                                "description": "Cultural tradition",
-                                "default": "chinese",
-                            },
-                        },
-                        "required": ["date"],
-                    },
-                ),
-            ]
+            return self._tool_definitions
 
-        @self.server.call_tool()
+        # Arguments are checked by the compiled validators in dispatch_tool
+        @self.server.call_tool(validate_input=False)
         async def handle_call_tool(
             name: str, arguments: dict[str, Any]
         ) -> list[TextContent]:
             """Handle tool calls."""
+            started = time.perf_counter()
+            text, size, error = await call_tool(name, arguments)
+            self.metrics.record(
+                # Unknown names share one series to bound the label values
+                name if name in self.tools else "unknown",
+                time.perf_counter() - started,
+                size,
+                error,
+            )
+            return [TextContent(type="text", text=text)]
+
+        async def call_tool(
+            name: str, arguments: dict[str, Any]
+        ) -> tuple[str, int, bool]:
+            """Answer a call from the result cache or by running it.
+
+            Returns the encoded result, its size in bytes and whether it is
+            an error.
+            """
+            key = call_key(name, arguments)
+            if self.result_cache is not None:
+                cached = self.result_cache.lookup(key)
+                if cached is not None:
+                    return cached.text, cached.size, False
+            if self.single_flight is None:
+                return await run_call(name, arguments, key)
+            return await self.single_flight.run(
+                key, lambda: run_call(name, arguments, key)
+            )
+
+        async def run_call(
+            name: str, arguments: dict[str, Any], key: str
+        ) -> tuple[str, int, bool]:
+            """Dispatch a call once a call slot is free."""
+            async with self._call_slots:
+                return await dispatch_tool(name, arguments, key)
+
+        async def dispatch_tool(
+            name: str, arguments: dict[str, Any], key: str
+        ) -> tuple[str, int, bool]:
+            """Validate and run one tool call and serialize its result.
+
+            Returns the encoded result, its size in bytes and whether it is
+            an error. Successful results are stored in the result cache under
+            ``key``.
+            """
             try:
-                if name == "check_auspicious_date":
-                    result = await self._check_auspicious_date(**arguments)
-                elif name == "find_good_dates":
-                    result = await self._find_good_dates(**arguments)
-                elif name == "get_daily_fortune":
-                    result = await self._get_daily_fortune(**arguments)
-                elif name == "check_zodiac_compatibility":
-                    result = await self._check_zodiac_compatibility(**arguments)
-                elif name == "get_lunar_festivals":
-                    result = await self._get_lunar_festivals(**arguments)
-                elif name == "get_next_festival":
-                    result = await self._get_next_festival(**arguments)
-                elif name == "get_festival_details":
-                    result = await self._get_festival_details(**arguments)
-                elif name == "get_annual_festivals":
-                    result = await self._get_annual_festivals(**arguments)
-                elif name == "get_moon_phase":
-                    result = await self._get_moon_phase(**arguments)
-                elif name == "get_moon_calendar":
-                    result = await self._get_moon_calendar(**arguments)
-                elif name == "get_moon_influence":
-                    result = await self._get_moon_influence(**arguments)
-                elif name == "predict_moon_phases":
-                    result = await self._predict_moon_phases(**arguments)
-                elif name == "solar_to_lunar":
-                    result = await self._solar_to_lunar(**arguments)
-                elif name == "lunar_to_solar":
-                    result = await self._lunar_to_solar(**arguments)
-                elif name == "get_zodiac_info":
-                    result = await self._get_zodiac_info(**arguments)
-                elif name == "batch_check_dates":
-                    result = await self._batch_check_dates(**arguments)
-                elif name == "compare_dates":
-                    result = await self._compare_dates(**arguments)
-                elif name == "get_lucky_hours":
-                    result = await self._get_lucky_hours(**arguments)
-                else:
+                registered = self.tools.get(name)
+                if registered is None:
                     raise ValueError(f"Unknown tool: {name}")
-
-                return [TextContent(type="text", text=json.dumps(result, indent=2))]
+                arguments = registered.validate(arguments)
+                compute: Callable[[], Awaitable[tuple[dict[str, Any], str]]] = (
+                    functools.partial(self._compute, registered.handler, arguments)
+                )
+                if self.profiler is not None and self.profiler.sample():
+                    compute = functools.partial(
+                        self.profiler.profile, name, arguments, compute
+                    )
+                if registered.offload:
+                    result, text = await self.worker_pool.run(compute)
+                else:
+                    result, text = await compute()
+
+                error = "error" in result
+                size = len(text.encode())
+                if self.result_cache is not None and not error:
+                    self.result_cache.put(
+                        key,
+                        text,
+                        self.engine.settings.result_cache_ttl,
+                        registered.clock,
+                        size,
+                    )
+                return text, size, error
 
             except Exception as e:
-                error_result = {"error": str(e), "tool": name}
-                return [
-                    TextContent(type="text", text=json.dumps(error_result, indent=2))
-                ]
+                text = self._serialize({"error": str(e), "tool": name})
+                return text, len(text.encode()), True
+
+        @self.server.list_resources()
+        async def handle_list_resources() -> list[Resource]:
+            """List available resources."""
+            return [METRICS_RESOURCE]
+
+        @self.server.read_resource()
+        async def handle_read_resource(uri: AnyUrl) -> list[ReadResourceContents]:
+            """Read a resource."""
+            if str(uri) != METRICS_URI:
+                raise ValueError(f"Unknown resource: {uri}")
+            return [
+                ReadResourceContents(
+                    content=self._serialize(self.metrics.snapshot()),
+                    mime_type="application/json",
+                )
+            ]
+
+    async def _compute(
+        self,
+        handler: ToolHandler,
+        arguments: dict[str, Any],
+    ) -> tuple[dict[str, Any], str]:
+        """Run a tool handler and encode its result."""
+        result = await handler(**arguments)
+        return result, self._serialize(result)
 
     async def _check_auspicious_date(
-        self, date: str, activity: str, culture: str = "chinese"
+        self,
+        date: str,
+        activity: str,
+        culture: str = "chinese",
+        fields: list[str] | None = None,
     ) -> dict[str, Any]:
         """Check if a date is auspicious for an activity."""
-        return await self.auspicious_checker.check_date(date, activity, culture)
+        return await self.auspicious_checker.check_date(
+            date, activity, culture, fields=fields
+        )
 
     async def _find_good_dates(
         self,
@@ -480,10 +247,10 @@ class LunarMCPServer:
         )
 
     async def _get_daily_fortune(
-        self, date: str, culture: str = "chinese"
+        self, date: str, culture: str = "chinese", fields: list[str] | None = None
     ) -> dict[str, Any]:
         """Get daily fortune information."""
-        return await self.auspicious_checker.get_daily_fortune(date, culture)
+        return await self.auspicious_checker.get_daily_fortune(date, culture, fields)
 
     async def _check_zodiac_compatibility(
         self, date1: str, date2: str, culture: str = "chinese"
@@ -506,10 +273,15 @@ class LunarMCPServer:
         return await self.festival_manager.get_next_festival(date, culture)
 
     async def _get_festival_details(
-        self, festival_name: str, culture: str = "chinese"
+        self,
+        festival_name: str,
+        culture: str = "chinese",
+        fields: list[str] | None = None,
     ) -> dict[str, Any]:
         """Get detailed festival information."""
-        return await self.festival_manager.get_festival_details(festival_name, culture)
+        return await self.festival_manager.get_festival_details(
+            festival_name, culture, fields
+        )
 
     async def _get_annual_festivals(
         self, year: int, culture: str = "chinese"
@@ -519,7 +291,14 @@ class LunarMCPServer:
 
     async def _get_moon_phase(self, date: str, location: str = "0,0") -> dict[str, Any]:
         """Get moon phase for date and location."""
-        return await self.lunar_calc.get_moon_phase(date, location)
+        try:
+            target_date = datetime.strptime(date, "%Y-%m-%d")
+            facts = self.engine.day_facts(target_date.date())
+            return self.lunar_calc.describe_moon_phase(
+                target_date, facts.illumination, facts.phase_angle, location
+            )
+        except Exception as e:
+            return {"error": f"Failed to calculate moon phase: {str(e)}"}
 
     async def _get_moon_calendar(
         self, month: int, year: int, location: str = "0,0"
@@ -549,32 +328,96 @@ class LunarMCPServer:
         """Convert lunar to solar date."""
         return await self.calendar_converter.lunar_to_solar(lunar_date, culture)
 
+    def _page_limit(
+        self, dates: list[str] | None, limit: int | None
+    ) -> tuple[int, dict[str, Any] | None]:
+        """Page size of a range conversion, or an error for too long a list.
+
+        Pages and date lists are bounded by ``batch_max_dates``.
+        """
+        max_dates = self.engine.settings.batch_max_dates
+        if dates is not None and len(dates) > max_dates:
+            return max_dates, {
+                "error": f"Too many dates: {len(dates)} (maximum {max_dates})",
+                "max_dates": max_dates,
+            }
+        return min(limit or max_dates, max_dates), None
+
+    async def _solar_to_lunar_range(
+        self,
+        start_date: str | None = None,
+        end_date: str | None = None,
+        dates: list[str] | None = None,
+        offset: int = 0,
+        limit: int | None = None,
+        culture: str = "chinese",
+    ) -> dict[str, Any]:
+        """Convert a span or list of solar dates to lunar dates."""
+        page_limit, error = self._page_limit(dates, limit)
+        if error:
+            return error
+        return await self.calendar_converter.solar_to_lunar_range(
+            start_date, end_date, dates, offset, page_limit, culture
+        )
+
+    async def _lunar_to_solar_range(
+        self,
+        start_lunar_date: str | None = None,
+        end_lunar_date: str | None = None,
+        lunar_dates: list[str] | None = None,
+        offset: int = 0,
+        limit: int | None = None,
+        culture: str = "chinese",
+    ) -> dict[str, Any]:
+        """Convert a span or list of lunar dates to solar dates."""
+        page_limit, error = self._page_limit(lunar_dates, limit)
+        if error:
+            return error
+        return await self.calendar_converter.lunar_to_solar_range(
+            start_lunar_date, end_lunar_date, lunar_dates, offset, page_limit, culture
+        )
+
     async def _get_zodiac_info(
-        self, date: str, culture: str = "chinese"
+        self, date: str, culture: str = "chinese", fields: list[str] | None = None
     ) -> dict[str, Any]:
         """Get zodiac information for date."""
-        return await self.calendar_converter.get_zodiac_info(date, culture)
+        lunar = None
+        if not fields or "lunar_info" in fields:
+            try:
+                target_date = datetime.strptime(date, "%Y-%m-%d").date()
+                lunar = self.engine.day_facts(target_date).lunar_date
+            except ValueError:
+                # Let the converter report the invalid date
+                pass
+        return await self.calendar_converter.get_zodiac_info(
+            date, culture, lunar, fields
+        )
 
     async def _batch_check_dates(
         self, dates: list[str], activity: str, culture: str = "chinese"
     ) -> dict[str, Any]:
-        """Check multiple dates at once for efficiency."""
-        results = []
-        for date in dates[:30]:  # Limit to 30 dates to prevent abuse
-            try:
-                check_result = await self.auspicious_checker.check_date(
-                    date, activity, culture
-                )
-                results.append(
-                    {
-                        "date": date,
-                        "score": check_result.get("score", 0),
-                        "level": check_result.get("auspicious_level", "unknown"),
-                        "details": check_result,
-                    }
-                )
-            except Exception as e:
-                results.append({"date": date, "error": str(e)})
+        """Check multiple dates at once for efficiency.
+
+        Each distinct date is checked once, and results are returned in input
+        order (repeated dates included).
+        """
+        max_dates = self.engine.settings.batch_max_dates
+        if len(dates) > max_dates:
+            return {
+                "error": f"Too many dates: {len(dates)} (maximum {max_dates})",
+                "max_dates": max_dates,
+            }
+
+        checked = await self.auspicious_checker.check_dates(dates, activity, culture)
+        results = [
+            {
+                "date": date,
+                "score": checked[date].get("score", 0),
+                "level": checked[date].get("auspicious_level", "unknown"),
+                "details": checked[date],
+            }
+            for date in dates
+        ]
 
         # Find best and worst dates
         valid_results = [r for r in results if "score" in r]
@@ -614,7 +457,7 @@ class LunarMCPServer:
                     aspects["good_for"] = auspicious.get("good_for", [])
                     aspects["avoid"] = auspicious.get("avoid", [])
 
-                moon = await self.lunar_calc.get_moon_phase(date, "0,0")
+                moon = await self._get_moon_phase(date, "0,0")
                 aspects["moon_phase"] = moon.get("phase_name")
                 aspects["moon_illumination"] = moon.get("illumination")
 
@@ -625,7 +468,7 @@ class LunarMCPServer:
                     f.get("name") for f in festivals.get("festivals", [])
                 ]
 
-                zodiac = await self.calendar_converter.get_zodiac_info(date, culture)
+                zodiac = await self._get_zodiac_info(date, culture)
                 aspects["zodiac"] = zodiac.get("zodiac", {})
 
                 comparison[date] = aspects
@@ -756,31 +599,118 @@ class LunarMCPServer:
 
         return activity_map.get(zodiac_animal, ["general_activities"])
 
-    async def run(self, transport_type: str = "stdio") -> None:
-        """Run the MCP server."""
-        if transport_type == "stdio":
-            from mcp.server.stdio import stdio_server
-
-            async with stdio_server() as (read_stream, write_stream):
-                await self.server.run(
-                    read_stream,
-                    write_stream,
-                    self.server.create_initialization_options(
-                        notification_options=NotificationOptions(tools_changed=True)
-                    ),
-                )
-
+    async def serve_metrics(self, port: int) -> asyncio.Server:
+        """Serve Prometheus metrics on a local port."""
+        server = await start_metrics_server(
+            self.metrics.render_prometheus, self.engine.settings.metrics_host, port
+        )
+        logger.info("Serving metrics on port %d", port)
+        return server
 
-async def _run_server() -> None:
+    async def run(self, transport_type: str = "stdio") -> None:
+        """Run the MCP server over stdio or streamable HTTP."""
+        settings = self.engine.settings
+        if settings.preload_ephemeris:
+            threading.Thread(
+                target=self.lunar_calc.warm_up, name="ephemeris-preload", daemon=True
+            ).start()
+
+        metrics_server = None
+        if settings.metrics_port > 0:
+            metrics_server = await self.serve_metrics(settings.metrics_port)
+        try:
+            if transport_type == "stdio":
+                from mcp.server.stdio import stdio_server
+
+                async with stdio_server() as (read_stream, write_stream):
+                    await self.server.run(
+                        read_stream,
+                        write_stream,
+                        self.server.create_initialization_options(
+                            notification_options=NotificationOptions(tools_changed=True)
+                        ),
+                    )
+            elif transport_type == "http":
+                from .http_app import serve_http
+
+                await serve_http(self)
+            else:
+                raise ValueError(f"Unknown transport: {transport_type}")
+        finally:
+            if metrics_server is not None:
+                metrics_server.close()
+            self.worker_pool.shutdown()
+
+
+def _parse_settings(argv: Sequence[str] | None = None) -> Settings:
+    """Build settings from the environment and command line overrides."""
+    settings = Settings.from_env()
+    parser = argparse.ArgumentParser(
+        prog="lunar-mcp-server", description="Lunar Calendar MCP server"
+    )
+    parser.add_argument(
+        "--transport", choices=["stdio", "http"], default=settings.transport
+    )
+    parser.add_argument("--host", default=settings.http_host)
+    parser.add_argument("--port", type=int, default=settings.http_port)
+    parser.add_argument("--path", default=settings.http_path)
+    parser.add_argument(
+        "--stateless",
+        action="store_true",
+        default=settings.http_stateless,
+        help="serve HTTP without session state",
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=settings.workers,
+        help="HTTP worker processes forked from one warmed engine",
+    )
+    parser.add_argument(
+        "--max-connections",
+        type=int,
+        default=settings.http_max_connections,
+        help="open HTTP connections allowed (0 for no limit)",
+    )
+    parser.add_argument(
+        "--max-concurrent-calls",
+        type=int,
+        default=settings.max_concurrent_calls,
+        help="tool calls evaluated at once (0 for no limit)",
+    )
+    args = parser.parse_args(argv)
+    if args.workers > 1 and args.transport != "http":
+        parser.error("--workers requires --transport http")
+    return dataclasses.replace(
+        settings,
+        transport=args.transport,
+        http_host=args.host,
+        http_port=args.port,
+        http_path=args.path,
+        http_stateless=args.stateless,
+        workers=args.workers,
+        http_max_connections=args.max_connections,
+        max_concurrent_calls=args.max_concurrent_calls,
+    )
+
+
+async def _run_server(settings: Settings | None = None) -> None:
     """Start the MCP server event loop."""
-    server = LunarMCPServer()
-    await server.run()
+    settings = settings or Settings.from_env()
+    server = LunarMCPServer(LunarEngine(settings))
+    await server.run(settings.transport)
 
 
-def main() -> None:
+def main(argv: Sequence[str] | None = None) -> None:
     """Synchronous entry point for console scripts."""
+    settings = _parse_settings(argv)
     logging.basicConfig(level=logging.INFO)
-    asyncio.run(_run_server())
+    if settings.workers > 1:
+        from .prefork import Supervisor
+
+        Supervisor(LunarMCPServer(LunarEngine(settings)), settings.workers).run()
+    else:
+        asyncio.run(_run_server(settings))
 
 
 if __name__ == "__main__":
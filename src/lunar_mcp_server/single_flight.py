@@ -0,0 +1,57 @@
+"""
+Single-flight coalescing of identical in-flight tool calls.
+
+Agents often make the same call from many sessions at once (this year's
+festivals, today's fortune). ``SingleFlight`` runs the first such call and
+lets every identical call arriving before it finishes await the same
+result instead of computing it again.
+"""
+
+import asyncio
+import json
+from collections.abc import Awaitable, Callable, Mapping
+from typing import Any, TypeVar
+
+T = TypeVar("T")
+
+
+def call_key(name: str, arguments: Mapping[str, Any]) -> str:
+    """Canonical key of a tool call (argument order does not matter)."""
+    return name + json.dumps(
+        arguments, sort_keys=True, separators=(",", ":"), default=str
+    )
+
+
+class SingleFlight:
+    """Coalesces concurrent calls sharing a key into one execution.
+
+    The shared execution runs as its own task, so a caller giving up does
+    not cancel it for the callers still waiting.
+    """
+
+    def __init__(self) -> None:
+        """Initialize with no calls in flight."""
+        self._in_flight: dict[str, asyncio.Future[Any]] = {}
+        self.executed = 0
+        self.coalesced = 0
+
+    async def run(self, key: str, factory: Callable[[], Awaitable[T]]) -> T:
+        """Run ``factory`` unless a call with the same key is in flight."""
+        future = self._in_flight.get(key)
+        if future is None:
+            self.executed += 1
+            future = asyncio.ensure_future(factory())
+            self._in_flight[key] = future
+            future.add_done_callback(lambda _: self._in_flight.pop(key, None))
+        else:
+            self.coalesced += 1
+        result: T = await asyncio.shield(future)
+        return result
+
+    def stats(self) -> dict[str, Any]:
+        """Coalescing counters for monitoring."""
+        return {
+            "executed": self.executed,
+            "coalesced": self.coalesced,
+            "in_flight": len(self._in_flight),
+        }
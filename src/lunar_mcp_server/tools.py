@@ -0,0 +1,682 @@
+"""
+Tool definitions and argument validation for the Lunar MCP server.
+
+The ``Tool`` objects are built once at import time and each input schema is
+compiled into a validator, so listing tools allocates nothing and bad
+arguments are rejected before a handler runs. Tools in ``OFFLOADED_TOOLS``
+run on the server's worker pool, and ``CLOCK_DEPENDENT_TOOLS`` marks the
+tools whose results cannot be cached beyond the current hour or day.
+"""
+
+from collections.abc import Awaitable, Callable, Mapping
+from datetime import datetime
+from typing import Any, NamedTuple
+
+from mcp.types import Tool
+
+from .auspicious_dates import CHECK_DATE_FIELDS, DAILY_FORTUNE_FIELDS
+from .calendar_conversions import ZODIAC_INFO_FIELDS
+from .festivals import FESTIVAL_DETAILS_FIELDS
+
+ToolHandler = Callable[..., Awaitable[dict[str, Any]]]
+Validator = Callable[[dict[str, Any]], dict[str, Any]]
+Check = tuple[Callable[[Any], bool], str]
+
+
+class ToolArgumentError(ValueError):
+    """Raised when tool arguments do not match the tool's input schema."""
+
+
+# Tools doing ephemeris or range work, run on the worker pool
+OFFLOADED_TOOLS = frozenset(
+    {
+        "check_auspicious_date",
+        "find_good_dates",
+        "get_daily_fortune",
+        "get_moon_phase",
+        "get_moon_calendar",
+        "get_moon_influence",
+        "predict_moon_phases",
+        "get_zodiac_info",
+        "solar_to_lunar_range",
+        "lunar_to_solar_range",
+        "batch_check_dates",
+        "compare_dates",
+        "get_lucky_hours",
+    }
+)
+
+# Tools whose results read the clock, with the unit they depend on. All other
+# tools are pure functions of their arguments. Cached results of these tools
+# expire when the unit rolls over.
+CLOCK_DEPENDENT_TOOLS = {
+    # hourly_zodiac is taken from the current hour
+    "get_zodiac_info": "hour",
+    # next_occurrence counts days from today
+    "get_festival_details": "day",
+}
+
+# Most dates find_good_dates may return
+MAX_GOOD_DATES = 100
+
+# Years covered by the lunar month table, the range get_annual_festivals accepts
+FESTIVAL_YEARS = (1900, 2100)
+
+# Paging arguments of the range conversion tools
+_PAGE_PROPERTIES: dict[str, Any] = {
+    "offset": {
+        "type": "integer",
+        "minimum": 0,
+        "description": "Index of the first conversion to return (next_offset "
+        "of the previous page)",
+        "default": 0,
+    },
+    "limit": {
+        "type": "integer",
+        "minimum": 1,
+        "description": "Maximum number of conversions to return (default and "
+        "maximum: LUNAR_MCP_BATCH_MAX_DATES)",
+    },
+    "culture": {
+        "type": "string",
+        "description": "Cultural tradition",
+        "default": "chinese",
+    },
+}
+
+
+def _fields_property(fields: tuple[str, ...]) -> dict[str, Any]:
+    """Schema of the ``fields`` argument selecting result keys."""
+    return {
+        "type": "array",
+        "items": {"type": "string", "enum": list(fields)},
+        "description": (
+            "Result fields to return (default: all); "
+            "sections not requested are not computed"
+        ),
+    }
+
+
+TOOLS: tuple[Tool, ...] = (
+    Tool(
+        name="check_auspicious_date",
+        description="Check if a date is favorable for specific activities",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "date": {
+                    "type": "string",
+                    "format": "date",
+                    "description": "Date in YYYY-MM-DD format",
+                },
+                "activity": {
+                    "type": "string",
+                    "description": "Activity type (e.g., wedding, business_opening, travel)",
+                },
+                "culture": {
+                    "type": "string",
+                    "description": "Cultural tradition (chinese)",
+                    "default": "chinese",
+                },
+                "fields": _fields_property(CHECK_DATE_FIELDS),
+            },
+            "required": ["date", "activity"],
+        },
+    ),
+    Tool(
+        name="find_good_dates",
+        description="Find optimal dates in a range for specific activities",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "start_date": {
+                    "type": "string",
+                    "format": "date",
+                    "description": "Start date in YYYY-MM-DD format",
+                },
+                "end_date": {
+                    "type": "string",
+                    "format": "date",
+                    "description": "End date in YYYY-MM-DD format",
+                },
+                "activity": {
+                    "type": "string",
+                    "description": "Activity type",
+                },
+                "culture": {
+                    "type": "string",
+                    "description": "Cultural tradition",
+                    "default": "chinese",
+                },
+                "limit": {
+                    "type": "integer",
+                    "minimum": 1,
+                    "maximum": MAX_GOOD_DATES,
+                    "description": "Maximum number of dates to return",
+                    "default": 10,
+                },
+            },
+            "required": ["start_date", "end_date", "activity"],
+        },
+    ),
+    Tool(
+        name="get_daily_fortune",
+        description="Get daily fortune and luck information",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "date": {
+                    "type": "string",
+                    "format": "date",
+                    "description": "Date in YYYY-MM-DD format",
+                },
+                "culture": {
+                    "type": "string",
+                    "description": "Cultural tradition",
+                    "default": "chinese",
+                },
+                "fields": _fields_property(DAILY_FORTUNE_FIELDS),
+            },
+            "required": ["date"],
+        },
+    ),
+    Tool(
+        name="check_zodiac_compatibility",
+        description="Check compatibility between dates based on zodiac",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "date1": {
+                    "type": "string",
+                    "description": "First date in YYYY-MM-DD format",
+                },
+                "date2": {
+                    "type": "string",
+                    "description": "Second date in YYYY-MM-DD format",
+                },
+                "culture": {
+                    "type": "string",
+                    "description": "Cultural tradition",
+                    "default": "chinese",
+                },
+            },
+            "required": ["date1", "date2"],
+        },
+    ),
+    Tool(
+        name="get_lunar_festivals",
+        description="Get festivals for a specific date",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "date": {
+                    "type": "string",
+                    "format": "date",
+                    "description": "Date in YYYY-MM-DD format",
+                },
+                "culture": {
+                    "type": "string",
+                    "description": "Cultural tradition",
+                    "default": "chinese",
+                },
+            },
+            "required": ["date"],
+        },
+    ),
+    Tool(
+        name="get_next_festival",
+        description="Find next upcoming festival",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "date": {
+                    "type": "string",
+                    "format": "date",
+                    "description": "Reference date in YYYY-MM-DD format",
+                },
+                "culture": {
+                    "type": "string",
+                    "description": "Cultural tradition",
+                    "default": "chinese",
+                },
+            },
+            "required": ["date"],
+        },
+    ),
+    Tool(
+        name="get_festival_details",
+        description="Get detailed festival information",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "festival_name": {
+                    "type": "string",
+                    "description": "Name of the festival",
+                },
+                "culture": {
+                    "type": "string",
+                    "description": "Cultural tradition",
+                    "default": "chinese",
+                },
+                "fields": _fields_property(FESTIVAL_DETAILS_FIELDS),
+            },
+            "required": ["festival_name"],
+        },
+    ),
+    Tool(
+        name="get_annual_festivals",
+        description="Get all festivals for a year",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "year": {
+                    "type": "integer",
+                    "minimum": FESTIVAL_YEARS[0],
+                    "maximum": FESTIVAL_YEARS[1],
+                    "description": "Year",
+                },
+                "culture": {
+                    "type": "string",
+                    "description": "Cultural tradition",
+                    "default": "chinese",
+                },
+            },
+            "required": ["year"],
+        },
+    ),
+    Tool(
+        name="get_moon_phase",
+        description="Get current moon phase with details",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "date": {
+                    "type": "string",
+                    "format": "date",
+                    "description": "Date in YYYY-MM-DD format",
+                },
+                "location": {
+                    "type": "string",
+                    "description": "Location for calculations (lat,lon or city name)",
+                    "default": "0,0",
+                },
+            },
+            "required": ["date"],
+        },
+    ),
+    Tool(
+        name="get_moon_calendar",
+        description="Get monthly calendar with moon phases",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "month": {
+                    "type": "integer",
+                    "minimum": 1,
+                    "maximum": 12,
+                    "description": "Month (1-12)",
+                },
+                "year": {"type": "integer", "description": "Year"},
+                "location": {
+                    "type": "string",
+                    "description": "Location for calculations",
+                    "default": "0,0",
+                },
+            },
+            "required": ["month", "year"],
+        },
+    ),
+    Tool(
+        name="get_moon_influence",
+        description="Get how moon affects specific activities",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "date": {
+                    "type": "string",
+                    "format": "date",
+                    "description": "Date in YYYY-MM-DD format",
+                },
+                "activity": {
+                    "type": "string",
+                    "description": "Activity type",
+                },
+            },
+            "required": ["date", "activity"],
+        },
+    ),
+    Tool(
+        name="predict_moon_phases",
+        description="Predict future moon phases in date range (at most 10 years)",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "start_date": {
+                    "type": "string",
+                    "format": "date",
+                    "description": "Start date in YYYY-MM-DD format",
+                },
+                "end_date": {
+                    "type": "string",
+                    "format": "date",
+                    "description": "End date in YYYY-MM-DD format",
+                },
+            },
+            "required": ["start_date", "end_date"],
+        },
+    ),
+    Tool(
+        name="solar_to_lunar",
+        description="Convert solar date to lunar date",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "solar_date": {
+                    "type": "string",
+                    "format": "date",
+                    "description": "Solar date in YYYY-MM-DD format",
+                },
+                "culture": {
+                    "type": "string",
+                    "description": "Cultural tradition",
+                    "default": "chinese",
+                },
+            },
+            "required": ["solar_date"],
+        },
+    ),
+    Tool(
+        name="lunar_to_solar",
+        description="Convert lunar date to solar date",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "lunar_date": {
+                    "type": "string",
+                    "description": "Lunar date in YYYY-MM-DD format",
+                },
+                "culture": {
+                    "type": "string",
+                    "description": "Cultural tradition",
+                    "default": "chinese",
+                },
+            },
+            "required": ["lunar_date"],
+        },
+    ),
+    Tool(
+        name="solar_to_lunar_range",
+        description="Convert every day of a solar date range, or a list of "
+        "solar dates, to lunar dates, a page at a time",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "start_date": {
+                    "type": "string",
+                    "format": "date",
+                    "description": "First solar date in YYYY-MM-DD format",
+                },
+                "end_date": {
+                    "type": "string",
+                    "format": "date",
+                    "description": "Last solar date in YYYY-MM-DD format",
+                },
+                "dates": {
+                    "type": "array",
+                    "items": {"type": "string"},
+                    "description": "Solar dates in YYYY-MM-DD format, instead "
+                    "of a range",
+                },
+                **_PAGE_PROPERTIES,
+            },
+        },
+    ),
+    Tool(
+        name="lunar_to_solar_range",
+        description="Convert every day of a lunar date range, or a list of "
+        "lunar dates, to solar dates, a page at a time",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "start_lunar_date": {
+                    "type": "string",
+                    "description": "First lunar date in YYYY-MM-DD format",
+                },
+                "end_lunar_date": {
+                    "type": "string",
+                    "description": "Last lunar date in YYYY-MM-DD format",
+                },
+                "lunar_dates": {
+                    "type": "array",
+                    "items": {"type": "string"},
+                    "description": "Lunar dates in YYYY-MM-DD format, instead "
+                    "of a range",
+                },
+                **_PAGE_PROPERTIES,
+            },
+        },
+    ),
+    Tool(
+        name="get_zodiac_info",
+        description="Get zodiac animal/sign information for date",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "date": {
+                    "type": "string",
+                    "format": "date",
+                    "description": "Date in YYYY-MM-DD format",
+                },
+                "culture": {
+                    "type": "string",
+                    "description": "Cultural tradition",
+                    "default": "chinese",
+                },
+                "fields": _fields_property(ZODIAC_INFO_FIELDS),
+            },
+            "required": ["date"],
+        },
+    ),
+    Tool(
+        name="batch_check_dates",
+        description="Check multiple dates at once for efficiency",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "dates": {
+                    "type": "array",
+                    "items": {"type": "string"},
+                    "description": "Array of dates in YYYY-MM-DD format",
+                },
+                "activity": {
+                    "type": "string",
+                    "description": "Activity type",
+                },
+                "culture": {
+                    "type": "string",
+                    "description": "Cultural tradition",
+                    "default": "chinese",
+                },
+            },
+            "required": ["dates", "activity"],
+        },
+    ),
+    Tool(
+        name="compare_dates",
+        description="Compare multiple dates side-by-side",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "dates": {
+                    "type": "array",
+                    "items": {"type": "string"},
+                    "description": "Array of dates to compare",
+                },
+                "activity": {
+                    "type": "string",
+                    "description": "Activity type for comparison",
+                },
+                "culture": {
+                    "type": "string",
+                    "description": "Cultural tradition",
+                    "default": "chinese",
+                },
+            },
+            "required": ["dates"],
+        },
+    ),
+    Tool(
+        name="get_lucky_hours",
+        description="Get auspicious hours within a specific day",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "date": {
+                    "type": "string",
+                    "format": "date",
+                    "description": "Date in YYYY-MM-DD format",
+                },
+                "activity": {
+                    "type": "string",
+                    "description": "Activity type",
+                },
+                "culture": {
+                    "type": "string",
+                    "description": "Cultural tradition",
+                    "default": "chinese",
+                },
+            },
+            "required": ["date"],
+        },
+    ),
+)
+
+_TYPE_CHECKS: dict[str, tuple[Callable[[Any], bool], str]] = {
+    "string": (lambda value: isinstance(value, str), "a string"),
+    "integer": (
+        lambda value: isinstance(value, int) and not isinstance(value, bool),
+        "an integer",
+    ),
+    "array": (lambda value: isinstance(value, list), "an array"),
+}
+
+
+def _is_date(value: str) -> bool:
+    """Check a string is a date in the YYYY-MM-DD format the tools parse."""
+    try:
+        datetime.strptime(value, "%Y-%m-%d")
+    except ValueError:
+        return False
+    return True
+
+
+def _property_checks(name: str, schema: Mapping[str, Any]) -> list[Check]:
+    """Compile the checks for one property schema."""
+    is_type, type_name = _TYPE_CHECKS[schema["type"]]
+    checks: list[Check] = [(is_type, f"'{name}' must be {type_name}")]
+    if "items" in schema:
+        is_item, item_name = _TYPE_CHECKS[schema["items"]["type"]]
+        checks.append(
+            (
+                lambda value: all(is_item(item) for item in value),
+                f"'{name}' items must each be {item_name}",
+            )
+        )
+    if "enum" in schema:
+        allowed = frozenset(schema["enum"])
+        checks.append(
+            (
+                lambda value: value in allowed,
+                f"'{name}' must be one of: {', '.join(schema['enum'])}",
+            )
+        )
+    if "items" in schema and "enum" in schema["items"]:
+        allowed_items = frozenset(schema["items"]["enum"])
+        checks.append(
+            (
+                lambda value: allowed_items.issuperset(value),
+                f"'{name}' items must each be one of: "
+                + ", ".join(schema["items"]["enum"]),
+            )
+        )
+    if schema.get("format") == "date":
+        checks.append((_is_date, f"'{name}' must be a date in YYYY-MM-DD format"))
+    if "minimum" in schema:
+        minimum = schema["minimum"]
+        checks.append(
+            (lambda value: value >= minimum, f"'{name}' must be at least {minimum}")
+        )
+    if "maximum" in schema:
+        maximum = schema["maximum"]
+        checks.append(
+            (lambda value: value <= maximum, f"'{name}' must be at most {maximum}")
+        )
+    return checks
+
+
+def compile_validator(schema: Mapping[str, Any]) -> Validator:
+    """Compile an object input schema into an argument validator.
+
+    Supports the subset of JSON Schema used by ``TOOLS``: required and
+    unknown properties, string/integer/array types, array item types,
+    ``enum`` (for values and array items), the ``date`` format and integer
+    bounds. The validator returns the arguments to pass to the handler,
+    with optional arguments given as ``null`` dropped so their defaults
+    apply.
+    """
+    properties = {
+        name: _property_checks(name, prop)
+        for name, prop in schema.get("properties", {}).items()
+    }
+    required = tuple(schema.get("required", ()))
+
+    def validate(arguments: dict[str, Any]) -> dict[str, Any]:
+        if not isinstance(arguments, dict):
+            raise ToolArgumentError("Arguments must be an object")
+        for name in required:
+            if name not in arguments:
+                raise ToolArgumentError(f"Missing required argument '{name}'")
+        omitted = False
+        for name, value in arguments.items():
+            checks = properties.get(name)
+            if checks is None:
+                raise ToolArgumentError(f"Unknown argument '{name}'")
+            if value is None and name not in required:
+                omitted = True
+                continue
+            for check, message in checks:
+                if not check(value):
+                    raise ToolArgumentError(message)
+        if omitted:
+            return {
+                name: value for name, value in arguments.items() if value is not None
+            }
+        return arguments
+
+    return validate
+
+
+class RegisteredTool(NamedTuple):
+    """A tool definition with its handler and compiled validator."""
+
+    definition: Tool
+    handler: ToolHandler
+    validate: Validator
+    # Whether calls run on the worker pool instead of the event loop
+    offload: bool
+    # Clock unit the results depend on, or None for pure tools
+    clock: str | None
+
+
+def build_registry(handlers: Mapping[str, ToolHandler]) -> dict[str, RegisteredTool]:
+    """Map every tool name to its definition, handler and validator."""
+    return {
+        tool.name: RegisteredTool(
+            tool,
+            handlers[tool.name],
+            compile_validator(tool.inputSchema),
+            tool.name in OFFLOADED_TOOLS,
+            CLOCK_DEPENDENT_TOOLS.get(tool.name),
+        )
+        for tool in TOOLS
+    }
@@ -0,0 +1,114 @@
+"""
+Worker pool for blocking tool calculations.
+
+Tool handlers are coroutines, but most of their work (ephemeris
+evaluation, lunar conversions, scoring loops) is blocking CPU work. A
+``WorkerPool`` runs such calls on worker threads, each with its own event
+loop, so the server's event loop keeps serving other requests meanwhile.
+Threads share the process-wide engine and its caches.
+"""
+
+import asyncio
+import threading
+from collections.abc import Awaitable, Callable
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, TypeVar
+
+T = TypeVar("T")
+
+_thread_state = threading.local()
+
+
+def _run_coroutine(factory: Callable[[], Awaitable[T]]) -> T:
+    """Run a coroutine to completion on the worker thread's event loop."""
+
+    async def run() -> T:
+        return await factory()
+
+    loop: asyncio.AbstractEventLoop = _thread_state.loop
+    return loop.run_until_complete(run())
+
+
+class WorkerPool:
+    """Thread pool running blocking tool calls off the event loop.
+
+    With ``max_workers`` of 0 calls run inline on the event loop.
+    """
+
+    def __init__(self, name: str, max_workers: int) -> None:
+        """Initialize the pool."""
+        self.name = name
+        self.max_workers = max_workers
+        self._lock = threading.Lock()
+        self._loops: list[asyncio.AbstractEventLoop] = []
+        self._executor = (
+            ThreadPoolExecutor(
+                max_workers,
+                thread_name_prefix=f"lunar-{name}",
+                initializer=self._start_worker,
+            )
+            if max_workers > 0
+            else None
+        )
+        self.queued = 0
+        self.running = 0
+        self.completed = 0
+        self.max_queued = 0
+
+    def _start_worker(self) -> None:
+        """Give a new worker thread its own event loop."""
+        loop = asyncio.new_event_loop()
+        _thread_state.loop = loop
+        with self._lock:
+            self._loops.append(loop)
+
+    async def run(self, factory: Callable[[], Awaitable[T]]) -> T:
+        """Run a coroutine on a worker thread and wait for its result."""
+        if self._executor is None:
+            return await factory()
+
+        with self._lock:
+            self.queued += 1
+            self.max_queued = max(self.max_queued, self.queued)
+
+        def task() -> T:
+            with self._lock:
+                self.queued -= 1
+                self.running += 1
+            try:
+                return _run_coroutine(factory)
+            finally:
+                with self._lock:
+                    self.running -= 1
+                    self.completed += 1
+
+        future = self._executor.submit(task)
+        future.add_done_callback(self._discard_cancelled)
+        return await asyncio.wrap_future(future)
+
+    def _discard_cancelled(self, future: "Future[Any]") -> None:
+        """Stop counting a call that was cancelled before it started."""
+        if future.cancelled():
+            with self._lock:
+                self.queued -= 1
+
+    def stats(self) -> dict[str, Any]:
+        """Pool counters for monitoring."""
+        with self._lock:
+            return {
+                "name": self.name,
+                "workers": self.max_workers,
+                "queued": self.queued,
+                "running": self.running,
+                "completed": self.completed,
+                "max_queued": self.max_queued,
+            }
+
+    def shutdown(self) -> None:
+        """Stop the worker threads once queued calls finish."""
+        if self._executor is not None:
+            self._executor.shutdown(wait=True)
+        with self._lock:
+            for loop in self._loops:
+                loop.close()
+            self._loops.clear()
@@ -1,11 +1,13 @@
 """Tests for auspicious dates module."""
 
-from datetime import datetime
+from datetime import datetime, timedelta
 from unittest.mock import patch
 
 import pytest
 
 from lunar_mcp_server.auspicious_dates import AuspiciousDateChecker
+from lunar_mcp_server.config import Settings
+from lunar_mcp_server.engine import LunarEngine
 
 
 class TestAuspiciousDateChecker:
@@ -72,6 +74,34 @@ class TestAuspiciousDateChecker:
             assert "recommendations" in result
             assert result["date"] == "2024-01-15"
 
+    @pytest.mark.asyncio
+    async def test_check_date_fields(self):
+        """Test unrequested sections are neither returned nor computed."""
+        with (
+            patch.object(self.checker.engine, "day_facts") as mock_facts,
+            patch.object(self.checker, "_find_alternative_dates") as mock_alternatives,
+        ):
+            result = await self.checker.check_date(
+                "2024-01-15", "wedding", "chinese", fields=["score", "zodiac_day"]
+            )
+
+            mock_facts.assert_not_called()
+            mock_alternatives.assert_not_called()
+
+        full = await self.checker.check_date("2024-01-15", "wedding", "chinese")
+        assert result == {
+            "date": "2024-01-15",
+            "score": full["score"],
+            "zodiac_day": full["zodiac_day"],
+        }
+
+    @pytest.mark.asyncio
+    async def test_check_date_unknown_fields(self):
+        """Test unknown fields are reported."""
+        result = await self.checker.check_date("2024-01-15", "wedding", fields=["x"])
+
+        assert result == {"error": "Failed to check auspicious date: Unknown fields: x"}
+
     @pytest.mark.asyncio
     async def test_check_date_invalid(self):
         """Test checking invalid date."""
@@ -100,6 +130,126 @@ class TestAuspiciousDateChecker:
             assert result["activity"] == "wedding"
             assert len(result["good_dates"]) <= 3
 
+    def test_score_cycle_matches_auspiciousness(self):
+        """Test the precomputed score cycle agrees with per-day scoring."""
+        cycle = self.checker._score_cycle("wedding")
+        start = datetime(2024, 1, 1)
+        offset = (start - datetime(1900, 1, 31)).days
+
+        for day in range(450):
+            expected = self.checker._calculate_auspiciousness(
+                start + timedelta(days=day), "wedding", "chinese"
+            )
+            assert cycle[(offset + day) % len(cycle)] == expected["score"]
+
+    def test_score_cycles_bounded(self):
+        """Test activities no rule names share one cached score cycle."""
+        shared = self.checker._score_cycle("unknown activity 1")
+        for index in range(2, 200):
+            assert self.checker._score_cycle(f"unknown activity {index}") is shared
+        self.checker._score_cycle("wedding")
+        self.checker._score_cycle("travel")
+
+        assert len(self.checker._score_cycles) == 3
+        assert set(shared) == {5}
+        assert self.checker._score_cycle("travel") != shared
+
+    @pytest.mark.asyncio
+    async def test_find_alternative_dates(self):
+        """Test alternatives are the nearest good neighbors, best first."""
+        reference = datetime(2024, 1, 15)
+        with patch.object(self.checker, "check_date") as mock_check:
+            alternatives = await self.checker._find_alternative_dates(
+                reference, "wedding", "chinese"
+            )
+            mock_check.assert_not_called()
+
+        assert 0 < len(alternatives) <= 3
+        scores = [alt["score"] for alt in alternatives]
+        assert scores == sorted(scores, reverse=True)
+        for alt in alternatives:
+            day = reference + timedelta(days=alt["days_away"])
+            assert alt["date"] == day.strftime("%Y-%m-%d")
+            assert alt["score"] >= 7
+            expected = self.checker._calculate_auspiciousness(day, "wedding", "chinese")
+            assert alt["score"] == expected["score"]
+            assert alt["reason"].startswith(expected["chinese_info"]["zodiac_day"])
+
+    @pytest.mark.asyncio
+    async def test_find_alternative_dates_window_and_count(self):
+        """Test the search window and result count are configurable."""
+        reference = datetime(2024, 1, 15)
+
+        wide = await self.checker._find_alternative_dates(
+            reference, "wedding", "chinese", days_to_check=60, count=10
+        )
+        narrow = await self.checker._find_alternative_dates(
+            reference, "wedding", "chinese", days_to_check=2, count=10
+        )
+
+        assert len(wide) == 10
+        assert all(abs(alt["days_away"]) <= 2 for alt in narrow)
+        assert (
+            await self.checker._find_alternative_dates(reference, "wedding", "western")
+            == []
+        )
+
+    @pytest.mark.asyncio
+    async def test_check_dates(self):
+        """Test bulk checks match single checks, one per distinct date."""
+        dates = ["2024-03-01", "2024-01-15", "2024-03-01", "not-a-date"]
+        # A small cache forces several prewarmed chunks
+        checker = AuspiciousDateChecker(LunarEngine(Settings(day_facts_cache_size=32)))
+
+        results = await checker.check_dates(dates, "wedding")
+
+        assert list(results) == ["not-a-date", "2024-01-15", "2024-03-01"]
+        for date_str in ("2024-01-15", "2024-03-01"):
+            assert results[date_str] == await self.checker.check_date(
+                date_str, "wedding"
+            )
+        assert "error" in results["not-a-date"]
+
+    @pytest.mark.asyncio
+    async def test_find_good_dates_ranked(self):
+        """Test the best dates are returned without per-day checks."""
+        with patch.object(self.checker, "check_date") as mock_check:
+            result = await self.checker.find_good_dates(
+                "2024-01-01", "2025-12-31", "wedding", "chinese", 5
+            )
+            mock_check.assert_not_called()
+
+        scores = [entry["score"] for entry in result["good_dates"]]
+        assert result["found_dates"] == 5
+        assert scores == sorted(scores, reverse=True)
+        assert scores[0] == max(self.checker._score_cycle("wedding"))
+        assert result["best_date"] == result["good_dates"][0]
+        assert all(entry["moon_phase"] for entry in result["good_dates"])
+
+    @pytest.mark.asyncio
+    async def test_find_good_dates_prefers_earlier_ties(self):
+        """Test equally scored dates are returned in date order."""
+        full = await self.checker.find_good_dates(
+            "2024-01-01", "2024-12-31", "wedding", "chinese", 1000
+        )
+        limited = await self.checker.find_good_dates(
+            "2024-01-01", "2024-12-31", "wedding", "chinese", 3
+        )
+
+        assert limited["good_dates"] == full["good_dates"][:3]
+        ranked = [(entry["score"], entry["date"]) for entry in full["good_dates"]]
+        assert ranked == sorted(ranked, key=lambda item: (-item[0], item[1]))
+
+    @pytest.mark.asyncio
+    async def test_find_good_dates_other_culture(self):
+        """Test non-Chinese traditions have no good dates."""
+        result = await self.checker.find_good_dates(
+            "2024-01-01", "2024-01-31", "wedding", "western", 5
+        )
+
+        assert result["found_dates"] == 0
+        assert result["best_date"] is None
+
     @pytest.mark.asyncio
     async def test_get_daily_fortune(self):
         """Test getting daily fortune."""
@@ -117,6 +267,28 @@ class TestAuspiciousDateChecker:
             assert "lucky_numbers" in result
             assert "advice" in result
 
+    @pytest.mark.asyncio
+    async def test_get_daily_fortune_fields(self):
+        """Test the moon phase is only looked up for fields depending on it."""
+        full = await self.checker.get_daily_fortune("2024-01-15", "chinese")
+
+        with patch.object(self.checker.engine, "day_facts") as mock_facts:
+            result = await self.checker.get_daily_fortune(
+                "2024-01-15", "chinese", ["lucky_colors", "lucky_numbers"]
+            )
+
+            mock_facts.assert_not_called()
+        assert result == {
+            "date": "2024-01-15",
+            "lucky_colors": full["lucky_colors"],
+            "lucky_numbers": full["lucky_numbers"],
+        }
+
+        result = await self.checker.get_daily_fortune(
+            "2024-01-15", "chinese", ["advice"]
+        )
+        assert result == {"date": "2024-01-15", "advice": full["advice"]}
+
     @pytest.mark.asyncio
     async def test_check_zodiac_compatibility(self):
         """Test checking zodiac compatibility."""
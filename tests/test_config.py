@@ -0,0 +1,92 @@
+"""Tests for runtime settings."""
+
+from lunar_mcp_server.config import Settings
+from lunar_mcp_server.engine import LunarEngine
+
+
+class TestSettings:
+    """Test cases for Settings."""
+
+    def test_defaults(self):
+        """Test settings with no environment variables."""
+        settings = Settings.from_env({})
+
+        assert settings.ephemeris_dir is None
+        assert settings.ephemeris_download is False
+        assert settings.preload_ephemeris is False
+        assert settings.day_facts_cache_size == 4096
+        assert settings.alternative_window_days == 14
+        assert settings.alternative_count == 3
+        assert settings.transport == "stdio"
+        assert settings.http_path == "/mcp"
+        assert settings.max_concurrent_calls == 64
+        assert settings.coalesce_calls is True
+        assert settings.workers == 1
+        assert settings.result_cache_ttl == 3600
+        assert settings.result_cache_max_entries == 1024
+        assert settings.result_cache_max_bytes == 32 * 1024 * 1024
+        assert settings.metrics_port == 0
+        assert settings.profile_sample_rate == 0.0
+        assert settings.profile_dir is None
+        assert settings.batch_max_dates == 1000
+        assert settings.worker_threads == 2
+        assert settings.json_backend == "auto"
+        assert settings.json_pretty is False
+
+    def test_from_env(self):
+        """Test settings are read from LUNAR_MCP_* variables."""
+        settings = Settings.from_env(
+            {
+                "LUNAR_MCP_EPHEMERIS_DIR": "/data/skyfield",
+                "LUNAR_MCP_EPHEMERIS_DOWNLOAD": "true",
+                "LUNAR_MCP_PRELOAD_EPHEMERIS": "1",
+                "LUNAR_MCP_DAY_FACTS_CACHE_SIZE": "128",
+                "LUNAR_MCP_ALTERNATIVE_WINDOW_DAYS": "30",
+                "LUNAR_MCP_ALTERNATIVE_COUNT": "5",
+                "LUNAR_MCP_TRANSPORT": "http",
+                "LUNAR_MCP_HTTP_PORT": "9000",
+                "LUNAR_MCP_HTTP_STATELESS": "yes",
+                "LUNAR_MCP_MAX_CONCURRENT_CALLS": "8",
+                "LUNAR_MCP_COALESCE_CALLS": "false",
+                "LUNAR_MCP_WORKERS": "4",
+                "LUNAR_MCP_RESULT_CACHE_TTL": "0",
+                "LUNAR_MCP_RESULT_CACHE_MAX_BYTES": "1048576",
+                "LUNAR_MCP_METRICS_PORT": "9464",
+                "LUNAR_MCP_PROFILE_SAMPLE_RATE": "0.05",
+                "LUNAR_MCP_PROFILE_MEMORY": "true",
+            }
+        )
+
+        assert settings.ephemeris_dir == "/data/skyfield"
+        assert settings.ephemeris_download is True
+        assert settings.preload_ephemeris is True
+        assert settings.day_facts_cache_size == 128
+        assert settings.alternative_window_days == 30
+        assert settings.alternative_count == 5
+        assert settings.transport == "http"
+        assert settings.http_port == 9000
+        assert settings.http_stateless is True
+        assert settings.max_concurrent_calls == 8
+        assert settings.coalesce_calls is False
+        assert settings.workers == 4
+        assert settings.result_cache_ttl == 0
+        assert settings.result_cache_max_bytes == 1048576
+        assert settings.metrics_port == 9464
+        assert settings.profile_sample_rate == 0.05
+        assert settings.profile_memory is True
+
+    def test_blank_values_use_defaults(self):
+        """Test empty variables fall back to the defaults."""
+        settings = Settings.from_env(
+            {"LUNAR_MCP_EPHEMERIS_DIR": " ", "LUNAR_MCP_EPHEMERIS_DOWNLOAD": ""}
+        )
+
+        assert settings.ephemeris_dir is None
+        assert settings.ephemeris_download is False
+
+    def test_engine_passes_ephemeris_settings(self):
+        """Test the engine configures its calculator from settings."""
+        engine = LunarEngine(Settings(ephemeris_dir="/tmp/eph"))
+
+        assert engine.lunar_calc.ephemeris_dir == "/tmp/eph"
+        assert engine.lunar_calc.ephemeris_download is False
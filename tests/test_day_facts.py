@@ -0,0 +1,133 @@
+"""Tests for per-date facts and their cache."""
+
+from datetime import date, datetime
+
+import pytest
+
+from lunar_mcp_server.auspicious_dates import AuspiciousDateChecker
+from lunar_mcp_server.config import Settings
+from lunar_mcp_server.day_facts import DayFactsCache, build_day_facts, day_cycle
+from lunar_mcp_server.engine import LunarEngine
+from lunar_mcp_server.festivals import FestivalManager
+from lunar_mcp_server.lunar_table import ChineseLunarDate
+
+
+class TestDayFacts:
+    """Test cases for DayFacts and DayFactsCache."""
+
+    def setup_method(self):
+        """Set up test fixtures."""
+        self.engine = LunarEngine(Settings(day_facts_cache_size=64))
+
+    def test_build_day_facts(self):
+        """Test cycle fields are counted from 1900-01-31."""
+        ordinal = date(1900, 1, 31).toordinal()
+        facts = build_day_facts(
+            ordinal, ChineseLunarDate(1900, 1, 1, False), 0.0, 0.0, "New Moon"
+        )
+
+        assert facts.date == date(1900, 1, 31)
+        assert (facts.stem, facts.branch, facts.mansion) == ("甲", "子", "角")
+        assert facts.element == "Wood"
+        assert facts.zodiac_day == "Rat"
+        assert facts.sexagenary_day == 0
+        assert facts.lunar_date == ChineseLunarDate(1900, 1, 1, False)
+
+    def test_day_cycle(self):
+        """Test the cycle position matches the facts without an ephemeris."""
+        facts = self.engine.day_facts(date(2024, 2, 10))
+
+        assert tuple(day_cycle(facts.ordinal)) == facts[1:7]
+        assert day_cycle(facts.ordinal).zodiac_day == facts.zodiac_day
+
+    def test_day_facts(self):
+        """Test facts combine the lunar date and moon phase."""
+        facts = self.engine.day_facts(date(2024, 2, 10))
+
+        assert facts.lunar_date == ChineseLunarDate(2024, 1, 1, False)
+        assert facts.phase_name == "New Moon"
+        assert facts.illumination < 0.01
+
+    def test_day_facts_outside_table(self):
+        """Test lunar fields are empty outside the lunar month table."""
+        facts = self.engine.day_facts(date(1850, 6, 1))
+
+        assert facts.lunar_year is None
+        assert facts.lunar_date is None
+        assert facts.phase_name
+
+    def test_day_facts_range_matches_single_days(self):
+        """Test a range is built consistently with single-day lookups."""
+        days = self.engine.day_facts_range(date(2024, 3, 1), date(2024, 3, 31))
+        single = LunarEngine().day_facts(date(2024, 3, 17))
+
+        assert len(days) == 31
+        assert days[16] == single
+
+    def test_day_facts_range_invalid(self):
+        """Test a reversed range is rejected."""
+        with pytest.raises(ValueError):
+            self.engine.day_facts_range(date(2024, 3, 2), date(2024, 3, 1))
+
+    def test_cache_counters(self):
+        """Test hits and misses are counted per date."""
+        self.engine.day_facts(date(2024, 5, 1))
+        self.engine.day_facts(date(2024, 5, 1))
+        self.engine.day_facts_range(date(2024, 5, 1), date(2024, 5, 3))
+
+        stats = self.engine.day_facts_cache.stats()
+        assert stats["hits"] == 2
+        assert stats["misses"] == 3
+        assert stats["size"] == 3
+
+    def test_cache_evicts_least_recently_used(self):
+        """Test the cache stays within its size bound."""
+        cache = DayFactsCache(maxsize=2)
+        records = [
+            build_day_facts(ordinal, None, 0.0, 0.0, "New Moon")
+            for ordinal in (1, 2, 3)
+        ]
+
+        cache.put(records[0].ordinal, records[0])
+        cache.put(records[1].ordinal, records[1])
+        cache.get(1)
+        cache.put(records[2].ordinal, records[2])
+
+        assert len(cache) == 2
+        assert cache.get(2) is None
+        assert cache.get(1) is records[0]
+
+    @pytest.mark.asyncio
+    async def test_tools_share_day_facts(self):
+        """Test different tools read the same cached record."""
+        checker = AuspiciousDateChecker(self.engine)
+        festivals = FestivalManager(self.engine)
+
+        result = await checker.check_date(
+            "2024-02-10", "wedding", find_alternatives=False
+        )
+        fortune = await checker.get_daily_fortune("2024-02-10")
+        found = await festivals.get_festivals_for_date("2024-02-10")
+
+        stats = self.engine.day_facts_cache.stats()
+        # Scoring uses day_cycle, so only the moon phase lookups hit the cache
+        assert stats["misses"] == 1
+        assert stats["hits"] >= 1
+        assert result["lunar_date"] == "2024-1-1"
+        assert result["moon_phase"] == fortune["moon_phase"] == "New Moon"
+        assert found["festivals"][0]["id"] == "spring_festival"
+
+    @pytest.mark.asyncio
+    async def test_check_date_matches_calendar_info(self):
+        """Test check_date reports the cycle fields from the facts."""
+        checker = AuspiciousDateChecker(self.engine)
+        facts = self.engine.day_facts(date(2024, 6, 1))
+
+        result = await checker.check_date(
+            "2024-06-01", "travel", find_alternatives=False
+        )
+        info = checker._get_chinese_calendar_info(datetime(2024, 6, 1))
+
+        assert result["zodiac_day"] == facts.zodiac_day == info["zodiac_day"]
+        assert result["lunar_mansion"] == facts.mansion
+        assert result["five_elements"] == facts.element
@@ -0,0 +1,41 @@
+"""Tests for the shared calculation engine."""
+
+from lunar_mcp_server.auspicious_dates import AuspiciousDateChecker
+from lunar_mcp_server.engine import LunarEngine, get_engine
+from lunar_mcp_server.festivals import FestivalManager
+from lunar_mcp_server.lunar_table import get_lunar_table
+from lunar_mcp_server.server import LunarMCPServer
+
+
+class TestLunarEngine:
+    """Test cases for LunarEngine."""
+
+    def test_get_engine_is_shared(self):
+        """Test the process-wide engine is created once."""
+        assert get_engine() is get_engine()
+
+    def test_engine_uses_packaged_table(self):
+        """Test the engine and its converter share the lunar table."""
+        engine = LunarEngine()
+
+        assert engine.lunar_table is get_lunar_table()
+        assert engine.calendar_converter.lunar_table is engine.lunar_table
+
+    def test_subsystems_default_to_shared_engine(self):
+        """Test subsystems created without an engine share the default one."""
+        checker = AuspiciousDateChecker()
+        festivals = FestivalManager()
+
+        assert checker.engine is get_engine()
+        assert festivals.calendar_converter is get_engine().calendar_converter
+
+    def test_server_injects_engine(self):
+        """Test the server wires one engine into every subsystem."""
+        engine = LunarEngine()
+        server = LunarMCPServer(engine)
+
+        assert server.lunar_calc is engine.lunar_calc
+        assert server.calendar_converter is engine.calendar_converter
+        assert server.auspicious_checker.lunar_calc is engine.lunar_calc
+        assert server.auspicious_checker.calendar_converter is engine.calendar_converter
+        assert server.festival_manager.calendar_converter is engine.calendar_converter
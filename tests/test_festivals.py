@@ -0,0 +1,176 @@
+"""Tests for festival lookups."""
+
+from datetime import date
+from unittest.mock import patch
+
+import pytest
+
+from lunar_mcp_server.festivals import FestivalManager
+from lunar_mcp_server.lru import LRUCache
+
+
+class TestFestivalManager:
+    """Test cases for FestivalManager."""
+
+    def setup_method(self):
+        """Set up test fixtures."""
+        self.manager = FestivalManager()
+
+    @pytest.mark.asyncio
+    async def test_festival_index(self):
+        """Test the per-year index places lunar and solar festivals."""
+        festival_year = await self.manager._get_festival_year(2024)
+        index = festival_year.festivals
+
+        assert index[date(2024, 2, 10).toordinal()] == ("spring_festival",)
+        assert index[date(2024, 9, 17).toordinal()] == ("mid_autumn",)
+        assert index[date(2024, 4, 4).toordinal()] == ("qingming",)
+        assert len(index) == len(self.manager.chinese_festivals)
+        assert festival_year.ordinals == tuple(sorted(index))
+        assert await self.manager._get_festival_year(2024) is festival_year
+
+    @pytest.mark.asyncio
+    async def test_festival_years_bounded(self):
+        """Test festival years are kept in a bounded LRU."""
+        self.manager.festival_years = LRUCache(maxsize=2)
+
+        first = await self.manager._get_festival_year(2024)
+        await self.manager._get_festival_year(2025)
+        await self.manager._get_festival_year(2024)
+        await self.manager._get_festival_year(2026)
+
+        assert len(self.manager.festival_years) == 2
+        assert self.manager.festival_years.get(2025) is None
+        assert self.manager.festival_years.get(2024) is first
+
+    @pytest.mark.asyncio
+    async def test_festival_index_skips_leap_month(self):
+        """Test festivals are not repeated in a leap month."""
+        # 2028 has a leap fifth month
+        index = (await self.manager._get_festival_year(2028)).festivals
+
+        dragon_boat = [day for day, ids in index.items() if "dragon_boat" in ids]
+        assert [date.fromordinal(day) for day in dragon_boat] == [date(2028, 5, 28)]
+
+    @pytest.mark.asyncio
+    async def test_get_festivals_for_date(self, sample_dates):
+        """Test festivals are found for a date."""
+        result = await self.manager.get_festivals_for_date(
+            sample_dates["spring_festival"]
+        )
+
+        assert result["festival_count"] == 1
+        assert result["festivals"][0]["id"] == "spring_festival"
+        assert result["is_major_festival"] is True
+        assert result["celebration_level"] == "major"
+
+    @pytest.mark.asyncio
+    async def test_get_festivals_for_date_none(self, sample_dates):
+        """Test ordinary dates and other cultures have no festivals."""
+        ordinary = await self.manager.get_festivals_for_date(sample_dates["valid_date"])
+        western = await self.manager.get_festivals_for_date(
+            sample_dates["spring_festival"], "western"
+        )
+
+        assert ordinary["festivals"] == []
+        assert ordinary["celebration_level"] == "none"
+        assert western["festivals"] == []
+
+    @pytest.mark.asyncio
+    async def test_get_next_festival(self):
+        """Test the next festival is found after the search date."""
+        result = await self.manager.get_next_festival("2024-02-10")
+
+        assert result["next_festival_date"] == "2024-02-24"
+        assert result["days_until"] == 14
+        assert result["festival"]["id"] == "lantern_festival"
+
+    @pytest.mark.asyncio
+    async def test_get_next_festival_across_years(self):
+        """Test the search continues into the following year."""
+        result = await self.manager.get_next_festival("2024-12-31")
+
+        assert result["next_festival_date"] == "2025-01-29"
+        assert result["festival"]["id"] == "spring_festival"
+
+    @pytest.mark.asyncio
+    async def test_get_next_festival_outside_table(self):
+        """Test years outside the lunar month table still find festivals."""
+        result = await self.manager.get_next_festival("2150-01-01")
+
+        assert "next_festival_date" in result
+        assert result["days_until"] <= 365
+
+    @pytest.mark.asyncio
+    async def test_get_annual_festivals(self):
+        """Test the annual calendar has exact dates in date order."""
+        result = await self.manager.get_annual_festivals(2024)
+
+        dates = {f["id"]: f["date"] for f in result["festivals"]}
+        assert dates["spring_festival"] == "2024-02-10"
+        assert dates["dragon_boat"] == "2024-06-10"
+        assert dates["mid_autumn"] == "2024-09-17"
+        assert dates["qingming"] == "2024-04-04"
+        assert list(dates.values()) == sorted(dates.values())
+        assert result["total_festivals"] == len(self.manager.chinese_festivals)
+        assert [f["name"] for f in result["calendar_view"][9]] == [
+            "Mid-Autumn Festival"
+        ]
+        assert {f["id"] for f in result["major_festivals"]} == {
+            "spring_festival",
+            "lantern_festival",
+            "dragon_boat",
+            "mid_autumn",
+        }
+
+    @pytest.mark.asyncio
+    async def test_get_annual_festivals_not_shared(self):
+        """Test changing an annual calendar does not affect later calls."""
+        result = await self.manager.get_annual_festivals(2024)
+        expected = await self.manager.get_annual_festivals(2024)
+        result["festivals"][0]["name"] = "changed"
+        result["festivals"].clear()
+        result["calendar_view"].clear()
+
+        assert await self.manager.get_annual_festivals(2024) == expected
+        other = await self.manager.get_annual_festivals(2024, "western")
+        assert [f["id"] for f in other["festivals"]] == ["qingming"]
+        assert other["culture"] == "western"
+        assert (await self.manager.get_annual_festivals(2024, "korean"))[
+            "culture"
+        ] == "korean"
+        # One festival year serves every culture
+        assert len(self.manager.festival_years) == 1
+
+    @pytest.mark.asyncio
+    async def test_calculate_next_occurrence(self):
+        """Test the next occurrence comes from the festival index."""
+        festival = self.manager.chinese_festivals["spring_festival"]
+        result = await self.manager._calculate_next_occurrence(
+            "spring_festival", festival, "chinese"
+        )
+
+        occurrence = date.fromisoformat(result["date"])
+        festival_year = await self.manager._get_festival_year(occurrence.year)
+        assert "spring_festival" in festival_year.festivals[occurrence.toordinal()]
+        assert 0 <= result["days_until"] <= 366
+        assert result["days_until"] == (occurrence - date.today()).days
+
+    @pytest.mark.asyncio
+    async def test_get_festival_details_fields(self):
+        """Test the next occurrence is only calculated when requested."""
+        with patch.object(self.manager, "_calculate_next_occurrence") as mock_next:
+            result = await self.manager.get_festival_details(
+                "Qingming Festival", "chinese", ["name", "foods"]
+            )
+
+            mock_next.assert_not_called()
+        assert set(result) == {"festival_id", "name", "foods"}
+        assert result["festival_id"] == "qingming"
+
+    @pytest.mark.asyncio
+    async def test_get_next_festival_invalid_date(self):
+        """Test an invalid search date is reported."""
+        result = await self.manager.get_next_festival("invalid-date")
+
+        assert "error" in result
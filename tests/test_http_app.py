@@ -0,0 +1,72 @@
+"""Tests for the streamable HTTP transport."""
+
+import json
+
+from starlette.testclient import TestClient
+
+from lunar_mcp_server.config import Settings
+from lunar_mcp_server.engine import LunarEngine
+from lunar_mcp_server.http_app import create_http_app
+from lunar_mcp_server.server import LunarMCPServer
+
+MCP_HEADERS = {
+    "Accept": "application/json, text/event-stream",
+    "Content-Type": "application/json",
+}
+
+
+def rpc(method, params=None, request_id=1):
+    """Build a JSON-RPC request body."""
+    return {"jsonrpc": "2.0", "id": request_id, "method": method, "params": params}
+
+
+def sse_result(response):
+    """Extract the JSON-RPC result from a server-sent event response."""
+    for line in response.text.splitlines():
+        if line.startswith("data: "):
+            return json.loads(line[len("data: ") :])["result"]
+    raise AssertionError(f"No event in response: {response.text!r}")
+
+
+class TestHTTPApp:
+    """Test cases for the streamable HTTP app."""
+
+    def setup_method(self):
+        """Set up test fixtures."""
+        settings = Settings(http_path="/lunar", http_stateless=True)
+        self.server = LunarMCPServer(LunarEngine(settings))
+
+    def test_health(self):
+        """Test the health check reports readiness."""
+        with TestClient(create_http_app(self.server)) as client:
+            response = client.get("/healthz")
+
+        assert response.status_code == 200
+        assert response.json()["status"] == "ok"
+
+    def test_call_tool(self):
+        """Test tools are served over HTTP at the configured path."""
+        initialize = rpc(
+            "initialize",
+            {
+                "protocolVersion": "2025-06-18",
+                "capabilities": {},
+                "clientInfo": {"name": "test", "version": "1.0"},
+            },
+        )
+        call = rpc(
+            "tools/call",
+            {"name": "solar_to_lunar", "arguments": {"solar_date": "2024-02-10"}},
+            request_id=2,
+        )
+
+        with TestClient(create_http_app(self.server)) as client:
+            info = sse_result(
+                client.post("/lunar", json=initialize, headers=MCP_HEADERS)
+            )
+            result = sse_result(client.post("/lunar", json=call, headers=MCP_HEADERS))
+
+        assert info["serverInfo"]["name"] == "lunar-mcp-server"
+        lunar = json.loads(result["content"][0]["text"])
+        assert lunar["lunar_month"] == 1
+        assert lunar["lunar_day"] == 1
@@ -0,0 +1,39 @@
+"""Tests for the shared LRU cache."""
+
+from lunar_mcp_server.lru import LRUCache
+
+
+class TestLRUCache:
+    """Test cases for LRUCache."""
+
+    def setup_method(self):
+        """Set up test fixtures."""
+        self.cache: LRUCache[str, int] = LRUCache(maxsize=2)
+
+    def test_evicts_least_recently_used(self):
+        """Test a lookup keeps an entry and the oldest one is evicted."""
+        self.cache.put("a", 1)
+        self.cache.put("b", 2)
+        assert self.cache.get("a") == 1
+        self.cache.put("c", 3)
+
+        assert len(self.cache) == 2
+        assert self.cache.get("b") is None
+        assert self.cache.get("a") == 1
+        assert self.cache.get("c") == 3
+
+    def test_stats_and_clear(self):
+        """Test hit and miss counters and that clear resets them."""
+        self.cache.put("a", 1)
+        self.cache.get("a")
+        self.cache.get("b")
+
+        assert self.cache.stats() == {
+            "hits": 1,
+            "misses": 1,
+            "size": 1,
+            "maxsize": 2,
+            "hit_rate": 0.5,
+        }
+        self.cache.clear()
+        assert self.cache.stats()["size"] == self.cache.stats()["hits"] == 0
@@ -1,10 +1,14 @@
 """Tests for lunar calculations module."""
 
-from datetime import datetime
+from datetime import date, datetime
 
 import pytest
 
-from lunar_mcp_server.lunar_calculations import LunarCalculator
+from lunar_mcp_server.lru import LRUCache
+from lunar_mcp_server.lunar_calculations import (
+    MAX_PHASE_RANGE_YEARS,
+    LunarCalculator,
+)
 
 
 class TestLunarCalculator:
@@ -126,6 +130,163 @@ class TestLunarCalculator:
         assert result["start_date"] == "2024-01-01"
         assert result["end_date"] == "2024-01-31"
 
+    def test_get_phase_series(self):
+        """Test vectorized phase evaluation over a date range."""
+        series = self.calculator.get_phase_series(date(2024, 1, 1), date(2024, 12, 31))
+
+        assert len(series.illumination) == 366
+        assert len(series.phase_angle) == 366
+        assert series.dates()[-1] == date(2024, 12, 31)
+        assert all(0 <= value <= 1 for value in series.illumination)
+        assert all(0 <= value < 360 for value in series.phase_angle)
+
+    def test_get_phase_series_invalid_range(self):
+        """Test phase series rejects reversed ranges."""
+        with pytest.raises(ValueError):
+            self.calculator.get_phase_series(date(2024, 2, 1), date(2024, 1, 1))
+
+    @pytest.mark.asyncio
+    async def test_moon_phase_matches_known_phases(self):
+        """Test new and full moon dates from the ephemeris."""
+        new_moon = await self.calculator.get_moon_phase("2024-01-11")
+        full_moon = await self.calculator.get_moon_phase("2024-01-25")
+
+        assert new_moon["phase_name"] == "New Moon"
+        assert full_moon["phase_name"] == "Full Moon"
+
+    @pytest.mark.asyncio
+    async def test_moon_calendar_matches_single_day(self):
+        """Test calendar entries agree with per-day moon phase results."""
+        calendar = await self.calculator.get_moon_calendar(3, 2024)
+        single = await self.calculator.get_moon_phase("2024-03-10")
+
+        entry = calendar["calendar"][9]
+        assert entry["date"] == "2024-03-10"
+        assert entry["phase_name"] == single["phase_name"]
+        assert entry["illumination"] == single["illumination"]
+
+    def test_get_phase_events(self):
+        """Test exact major phase instants in January 2024."""
+        events = self.calculator.get_phase_events(date(2024, 1, 1), date(2024, 1, 31))
+
+        assert [event.name for event in events] == [
+            "Third Quarter",
+            "New Moon",
+            "First Quarter",
+            "Full Moon",
+        ]
+        assert events[1].time.strftime("%Y-%m-%d %H:%M") == "2024-01-11 11:57"
+        assert events[3].time.strftime("%Y-%m-%d %H:%M") == "2024-01-25 17:54"
+
+    def test_get_phase_events_cached_per_year(self):
+        """Test phase events are computed once per year."""
+        self.calculator.get_phase_events(date(2024, 3, 1), date(2024, 3, 31))
+        cached = self.calculator._phase_events.get(2024)
+
+        self.calculator.get_phase_events(date(2024, 6, 1), date(2024, 6, 30))
+        assert self.calculator._phase_events.get(2024) is cached
+        assert len(cached) >= 48
+
+    def test_phase_events_bounded(self):
+        """Test the per-year phase event cache evicts the oldest year."""
+        self.calculator._phase_events = LRUCache(maxsize=2)
+        for year in (2060, 2061, 2062):
+            self.calculator.get_phase_events(date(year, 1, 1), date(year, 1, 31))
+
+        assert len(self.calculator._phase_events) == 2
+        assert self.calculator._phase_events.get(2060) is None
+
+    def test_estimate_phase_events(self):
+        """Test fallback phase events follow the mean synodic month."""
+        events = self.calculator._estimate_phase_events(2024)
+
+        assert [event.phase for event in events[:4]] == [3, 0, 1, 2]
+        assert events[1].time.date() == date(2024, 1, 11)
+
+    @pytest.mark.asyncio
+    async def test_predict_moon_phases_exact(self):
+        """Test predicted phases report each quarter exactly once."""
+        result = await self.calculator.predict_moon_phases("2024-01-01", "2024-12-31")
+
+        names = [phase["phase"] for phase in result["major_phases"]]
+        assert result["total_phases"] == 50
+        assert names.count("Full Moon") == 12
+        assert all(a != b for a, b in zip(names, names[1:], strict=False))
+        assert result["major_phases"][0]["time"] == "2024-01-04T03:30:27Z"
+
+    @pytest.mark.asyncio
+    async def test_predict_moon_phases_range_limit(self):
+        """Test ranges spanning too many calendar years are rejected."""
+        result = await self.calculator.predict_moon_phases("1900-01-01", "2050-12-31")
+
+        assert result["max_years"] == MAX_PHASE_RANGE_YEARS
+        assert "too long" in result["error"]
+        assert len(self.calculator._phase_events) == 0
+
+        result = await self.calculator.predict_moon_phases("2060-01-01", "2069-12-31")
+        assert result["total_phases"] > 400
+
+    @pytest.mark.asyncio
+    async def test_predict_moon_phases_straddling_ephemeris_end(self):
+        """Test a range across the end of DE421 falls back after 2053-10-09."""
+        result = await self.calculator.predict_moon_phases("2053-09-01", "2053-11-30")
+
+        assert "error" not in result
+        phases = result["major_phases"]
+        names = [phase["phase"] for phase in phases]
+        assert len(phases) == 12
+        assert all(a != b for a, b in zip(names, names[1:], strict=False))
+        # Exact instants before the end, mean month estimates after it
+        end = date(2053, 10, 9).isoformat()
+        exact = [phase for phase in phases if phase["date"] < end]
+        assert exact[0]["time"] == "2053-09-05T17:05:03Z"
+        assert phases[-1]["date"] > end
+        assert self.calculator.ephemeris_span[1] == date(2053, 10, 9).toordinal()
+
+    @pytest.mark.asyncio
+    async def test_predict_moon_phases_beyond_ephemeris(self):
+        """Test ranges outside DE421 use the mean synodic month."""
+        for start, end in (("2060-01-01", "2060-02-01"), ("1899-01-01", "1899-03-01")):
+            result = await self.calculator.predict_moon_phases(start, end)
+
+            year = int(start[:4])
+            expected = [
+                event.time.strftime("%Y-%m-%dT%H:%M:%SZ")
+                for event in self.calculator._estimate_phase_events(year)
+                if start <= event.time.date().isoformat() <= end
+            ]
+            assert "error" not in result
+            assert [phase["time"] for phase in result["major_phases"]] == expected
+            assert expected
+
+    def test_ephemeris_loaded_lazily(self):
+        """Test the ephemeris is only loaded on first use."""
+        calculator = LunarCalculator()
+        assert not calculator.ephemeris_ready.is_set()
+
+        assert calculator.load_ephemeris()
+        assert calculator.ephemeris_ready.is_set()
+        assert calculator.ephemeris_source.endswith("de421.bsp")
+
+    def test_ephemeris_from_configured_dir(self, tmp_path):
+        """Test a configured ephemeris directory is searched first."""
+        source = LunarCalculator()._find_ephemeris()
+        (tmp_path / "de421.bsp").symlink_to(source)
+
+        calculator = LunarCalculator(ephemeris_dir=str(tmp_path))
+        assert calculator.load_ephemeris()
+        assert calculator.ephemeris_source == str(tmp_path / "de421.bsp")
+
+    def test_missing_ephemeris_falls_back(self, monkeypatch):
+        """Test phases are approximated when no ephemeris can be loaded."""
+        calculator = LunarCalculator()
+        monkeypatch.setattr(calculator, "_find_ephemeris", lambda: None)
+
+        assert not calculator.load_ephemeris()
+        assert not calculator.ephemeris_ready.is_set()
+        series = calculator.get_phase_series(date(2024, 1, 1), date(2024, 1, 31))
+        assert len(series.illumination) == 31
+
     def test_get_moon_influence_traditional(self):
         """Test traditional moon influence calculation."""
         influence = self.calculator._get_moon_influence_traditional("Full Moon", 15)
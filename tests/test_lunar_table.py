@@ -0,0 +1,202 @@
+"""Tests for the precomputed lunar month table."""
+
+from datetime import date, datetime, timedelta
+
+import pytest
+from zhdate import ZhDate
+
+from lunar_mcp_server.calendar_conversions import CalendarConverter
+from lunar_mcp_server.lunar_table import get_lunar_table
+
+
+class TestLunarMonthTable:
+    """Test cases for LunarMonthTable."""
+
+    def setup_method(self):
+        """Set up test fixtures."""
+        self.table = get_lunar_table()
+
+    def test_table_range(self):
+        """Test the table spans lunar years 1900-2100."""
+        assert self.table.first_year == 1900
+        assert self.table.last_year == 2100
+        assert self.table.min_date == date(1900, 1, 31)
+        assert self.table.max_date == date(2101, 1, 28)
+
+    def test_known_new_years(self):
+        """Test Chinese New Year dates."""
+        assert self.table.lunar_to_solar(2024, 1, 1) == date(2024, 2, 10)
+        assert self.table.lunar_to_solar(2025, 1, 1) == date(2025, 1, 29)
+        assert tuple(self.table.solar_to_lunar(date(2024, 2, 10))) == (
+            2024,
+            1,
+            1,
+            False,
+        )
+
+    def test_leap_month(self):
+        """Test leap month lookup and conversion."""
+        # 2023 has a leap second month starting 2023-03-22
+        assert self.table.leap_month(2023) == 2
+        assert self.table.leap_month(2024) == 0
+        assert self.table.lunar_to_solar(2023, 2, 1, True) == date(2023, 3, 22)
+        lunar = self.table.solar_to_lunar(date(2023, 3, 22))
+        assert lunar is not None
+        assert lunar.is_leap_month
+        assert self.table.lunar_to_solar(2024, 2, 1, True) is None
+
+    def test_out_of_range(self):
+        """Test dates outside the table return None."""
+        assert self.table.solar_to_lunar(date(1900, 1, 30)) is None
+        assert self.table.solar_to_lunar(date(2101, 1, 29)) is None
+        assert self.table.lunar_to_solar(1899, 1, 1) is None
+        assert self.table.lunar_to_solar(2024, 13, 1) is None
+        assert self.table.lunar_to_solar(2024, 1, 31) is None
+
+    def test_span(self):
+        """Test a span across a leap month and a new year matches lookups."""
+        start = date(2023, 3, 1).toordinal()
+        stop = date(2024, 3, 1).toordinal()
+
+        span = list(self.table.span(start, stop))
+
+        assert span == [self.table.from_ordinal(o) for o in range(start, stop)]
+        assert list(self.table.span(start, start)) == []
+        with pytest.raises(ValueError):
+            list(self.table.span(self.table.min_ordinal - 1, start))
+        with pytest.raises(ValueError):
+            list(self.table.span(start, self.table.max_ordinal + 2))
+
+    def test_month_starts_agree_with_zhdate(self):
+        """Test every month start in the table matches zhdate."""
+        for year in range(self.table.first_year, self.table.last_year + 1):
+            leap = self.table.leap_month(year)
+            months = [(month, False) for month in range(1, 13)]
+            if leap:
+                months.insert(leap, (leap, True))
+            for month, is_leap in months:
+                expected = ZhDate(year, month, 1, is_leap).to_datetime().date()
+                assert self.table.lunar_to_solar(year, month, 1, is_leap) == expected
+                length = self.table.month_length(year, month, is_leap)
+                assert ZhDate.validate(year, month, length, is_leap)
+                assert not ZhDate.validate(year, month, length + 1, is_leap)
+
+    @pytest.mark.slow
+    def test_every_day_agrees_with_zhdate(self):
+        """Test every solar day zhdate supports converts identically."""
+        current = self.table.min_date
+        while current <= date(2100, 12, 31):
+            zh = ZhDate.from_datetime(datetime.combine(current, datetime.min.time()))
+            expected = (zh.lunar_year, zh.lunar_month, zh.lunar_day, zh.leap_month)
+            assert tuple(self.table.solar_to_lunar(current)) == expected
+            current += timedelta(days=1)
+
+
+class TestCalendarConverterTable:
+    """Test CalendarConverter conversions backed by the table."""
+
+    def setup_method(self):
+        """Set up test fixtures."""
+        self.converter = CalendarConverter()
+
+    @pytest.mark.asyncio
+    async def test_solar_to_lunar(self):
+        """Test solar to lunar conversion uses the table."""
+        result = await self.converter.solar_to_lunar("2024-09-17")
+
+        assert result["lunar_year"] == 2024
+        assert result["lunar_month"] == 8
+        assert result["lunar_day"] == 15
+        assert result["is_leap_month"] is False
+        assert result["calculation_method"] == "lunar_table"
+
+    @pytest.mark.asyncio
+    async def test_lunar_to_solar(self):
+        """Test lunar to solar conversion uses the table."""
+        result = await self.converter.lunar_to_solar("2024-8-15")
+
+        assert result["solar_date"] == "2024-09-17"
+        assert result["calculation_method"] == "lunar_table"
+
+    @pytest.mark.asyncio
+    async def test_out_of_table_range_falls_back(self):
+        """Test dates outside the table still convert."""
+        result = await self.converter.solar_to_lunar("1850-06-01")
+
+        assert "error" not in result
+        assert result["calculation_method"] != "lunar_table"
+
+    @pytest.mark.asyncio
+    async def test_solar_to_lunar_range(self):
+        """Test range conversions match single conversions, page by page."""
+        result = await self.converter.solar_to_lunar_range(
+            "2023-12-30", "2024-02-12", offset=20, limit=24
+        )
+
+        assert result["total"] == 45
+        assert result["count"] == 24
+        assert result["next_offset"] == 44
+        assert result["results"][0]["solar_date"] == "2024-01-19"
+        assert set(result["zodiac"]) == {"2023", "2024"}
+        for entry in result["results"]:
+            single = await self.converter.solar_to_lunar(entry["solar_date"])
+            assert entry == {key: single[key] for key in entry}
+
+        last = await self.converter.solar_to_lunar_range(
+            "2023-12-30", "2024-02-12", offset=44, limit=24
+        )
+        assert last["count"] == 1
+        assert last["next_offset"] is None
+
+    @pytest.mark.asyncio
+    async def test_solar_to_lunar_list(self):
+        """Test list conversions keep input order and report bad dates."""
+        result = await self.converter.solar_to_lunar_range(
+            dates=["2024-09-17", "1850-06-01", "2024-02-30", "2024-09-17"]
+        )
+
+        assert [entry["solar_date"] for entry in result["results"]] == [
+            "2024-09-17",
+            "1850-06-01",
+            "2024-02-30",
+            "2024-09-17",
+        ]
+        assert result["results"][0]["lunar_date_string"] == "2024-8-15"
+        assert "lunar month table" in result["results"][1]["error"]
+        assert result["results"][2]["error"] == "Invalid date format. Use YYYY-MM-DD"
+        assert result["results"][3] == result["results"][0]
+
+    @pytest.mark.asyncio
+    async def test_lunar_to_solar_range(self):
+        """Test lunar ranges include leap months and lists convert each date."""
+        result = await self.converter.lunar_to_solar_range("2023-2-1", "2023-3-1")
+
+        # Second month, leap second month, first day of the third month
+        assert result["total"] == 30 + 29 + 1
+        assert result["results"][30]["solar_date"] == "2023-03-22"
+        assert result["results"][30]["is_leap_month"] is True
+        assert result["results"][-1]["solar_date"] == "2023-04-20"
+
+        listed = await self.converter.lunar_to_solar_range(
+            lunar_dates=["2024-8-15", "2024-1-31"]
+        )
+        assert listed["results"][0]["lunar_date"] == "2024-8-15"
+        assert listed["results"][0]["solar_date"] == "2024-09-17"
+        assert "error" in listed["results"][1]
+
+    @pytest.mark.asyncio
+    async def test_range_errors(self):
+        """Test ranges outside the table or with conflicting arguments fail."""
+        assert "error" in await self.converter.solar_to_lunar_range(
+            "1850-01-01", "1850-12-31"
+        )
+        assert "error" in await self.converter.solar_to_lunar_range(
+            "2024-02-01", "2024-01-01"
+        )
+        assert "error" in await self.converter.solar_to_lunar_range("2024-01-01")
+        assert "error" in await self.converter.solar_to_lunar_range(
+            "2024-01-01", "2024-01-02", ["2024-01-01"]
+        )
+        assert "error" in await self.converter.lunar_to_solar_range(
+            "2024-1-1", "2024-13-1"
+        )
@@ -0,0 +1,114 @@
+"""Tests for per-tool call metrics."""
+
+import asyncio
+
+import pytest
+
+from lunar_mcp_server.metrics import (
+    LATENCY_BUCKETS,
+    Histogram,
+    ToolMetrics,
+    start_metrics_server,
+)
+
+
+class TestHistogram:
+    """Test cases for Histogram."""
+
+    def test_quantiles(self):
+        """Test quantiles are interpolated within their bucket."""
+        histogram = Histogram((1.0, 2.0, 4.0))
+        for value in (0.5, 1.5, 1.5, 3.0):
+            histogram.observe(value)
+
+        assert histogram.count == 4
+        assert histogram.sum == 6.5
+        assert histogram.quantile(0.25) == 1.0
+        assert histogram.quantile(0.5) == 1.5
+        assert histogram.quantile(1.0) == 4.0
+
+    def test_empty_and_overflow(self):
+        """Test empty histograms and values above the largest bucket."""
+        histogram = Histogram((1.0, 2.0))
+        assert histogram.quantile(0.5) is None
+
+        histogram.observe(10.0)
+
+        assert histogram.quantile(0.99) == 2.0
+        assert histogram.cumulative() == [("1", 0), ("2", 0), ("+Inf", 1)]
+
+    def test_latency_buckets(self):
+        """Test latency buckets span 50 microseconds to over 10 seconds."""
+        assert LATENCY_BUCKETS[0] == 0.00005
+        assert LATENCY_BUCKETS[-1] > 10
+
+
+class TestToolMetrics:
+    """Test cases for ToolMetrics."""
+
+    def setup_method(self):
+        """Set up test fixtures."""
+        self.metrics = ToolMetrics(
+            {"result_cache": lambda: {"hits": 3, "hit_rate": 0.75, "name": "x"}}
+        )
+        self.metrics.record("get_moon_phase", 0.002, 400, False)
+        self.metrics.record("get_moon_phase", 0.004, 600, True)
+
+    def test_snapshot(self):
+        """Test the snapshot summarizes each tool and includes components."""
+        snapshot = self.metrics.snapshot()
+        moon = snapshot["tools"]["get_moon_phase"]
+
+        assert moon["calls"] == 2
+        assert moon["errors"] == 1
+        assert moon["mean_latency_ms"] == 3.0
+        assert 1.6 <= moon["latency_ms"]["p50"] <= 3.2
+        assert moon["latency_ms"]["p50"] <= moon["latency_ms"]["p99"] <= 6.4
+        assert moon["response_bytes"] == {"total": 1000, "mean": 500}
+        assert snapshot["result_cache"]["hits"] == 3
+
+    def test_render_prometheus(self):
+        """Test the Prometheus rendering of tools and component gauges."""
+        text = self.metrics.render_prometheus()
+        lines = text.splitlines()
+
+        assert 'lunar_mcp_tool_calls_total{tool="get_moon_phase"} 2' in lines
+        assert 'lunar_mcp_tool_errors_total{tool="get_moon_phase"} 1' in lines
+        assert "# TYPE lunar_mcp_tool_latency_seconds histogram" in lines
+        assert (
+            'lunar_mcp_tool_latency_seconds_bucket{tool="get_moon_phase",le="+Inf"} 2'
+            in lines
+        )
+        assert 'lunar_mcp_tool_latency_seconds_count{tool="get_moon_phase"} 2' in lines
+        assert 'lunar_mcp_tool_response_bytes_sum{tool="get_moon_phase"} 1000' in lines
+        assert "lunar_mcp_result_cache_hits 3" in lines
+        assert "lunar_mcp_result_cache_hit_rate 0.75" in lines
+        assert "lunar_mcp_result_cache_name" not in text
+        assert text.endswith("\n")
+
+    @pytest.mark.asyncio
+    async def test_metrics_server(self):
+        """Test the local endpoint serves /metrics and rejects other paths."""
+        server = await start_metrics_server(
+            self.metrics.render_prometheus, "127.0.0.1", 0
+        )
+        port = server.sockets[0].getsockname()[1]
+
+        async def get(path):
+            reader, writer = await asyncio.open_connection("127.0.0.1", port)
+            writer.write(f"GET {path} HTTP/1.1\r\nHost: localhost\r\n\r\n".encode())
+            response = await reader.read()
+            writer.close()
+            return response.decode()
+
+        try:
+            metrics = await get("/metrics")
+            missing = await get("/other")
+        finally:
+            server.close()
+            await server.wait_closed()
+
+        assert metrics.startswith("HTTP/1.1 200 OK")
+        assert "text/plain; version=0.0.4" in metrics
+        assert 'lunar_mcp_tool_calls_total{tool="get_moon_phase"} 2' in metrics
+        assert missing.startswith("HTTP/1.1 404 Not Found")
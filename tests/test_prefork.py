@@ -0,0 +1,81 @@
+"""Tests for the pre-fork HTTP worker mode."""
+
+import gc
+import json
+import os
+import signal
+import socket
+import subprocess
+import sys
+import time
+import urllib.request
+from datetime import date
+
+import pytest
+
+from lunar_mcp_server.config import Settings
+from lunar_mcp_server.engine import LunarEngine
+from lunar_mcp_server.prefork import warm_server
+from lunar_mcp_server.server import LunarMCPServer
+
+
+def free_port() -> int:
+    """Find an unused local TCP port."""
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return int(sock.getsockname()[1])
+
+
+class TestPrefork:
+    """Test cases for the pre-fork supervisor."""
+
+    def test_warm_server(self):
+        """Test warming builds the shared tables and freezes the collector."""
+        server = LunarMCPServer(LunarEngine(Settings()))
+        try:
+            warm_server(server)
+
+            assert gc.get_freeze_count() > 0
+            assert "wedding" in server.auspicious_checker._score_cycles
+            assert server.festival_manager.festival_years.get(date.today().year)
+            assert len(server.engine.day_facts_cache) > 300
+        finally:
+            gc.unfreeze()
+
+    @pytest.mark.skipif(not hasattr(os, "fork"), reason="needs os.fork")
+    def test_workers_share_socket(self):
+        """Test forked workers serve one port and stop with the supervisor."""
+        port = free_port()
+        process = subprocess.Popen(
+            [
+                sys.executable,
+                "-m",
+                "lunar_mcp_server.server",
+                "--transport",
+                "http",
+                "--port",
+                str(port),
+                "--workers",
+                "2",
+            ],
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+        )
+        pids = set()
+        try:
+            deadline = time.monotonic() + 60
+            while len(pids) < 2 and time.monotonic() < deadline:
+                try:
+                    with urllib.request.urlopen(
+                        f"http://127.0.0.1:{port}/healthz", timeout=1
+                    ) as response:
+                        pids.add(json.loads(response.read())["pid"])
+                except OSError:
+                    time.sleep(0.1)
+        finally:
+            process.send_signal(signal.SIGTERM)
+            returncode = process.wait(timeout=30)
+
+        assert len(pids) == 2
+        assert process.pid not in pids
+        assert returncode == 0
@@ -0,0 +1,116 @@
+"""Tests for sampled tool call profiling."""
+
+import cProfile
+import json
+import pstats
+import tracemalloc
+
+import pytest
+
+from lunar_mcp_server.profiling import CallProfiler, collapsed_stacks
+
+
+def leaf(n):
+    """Allocate and sum a list."""
+    return sum(list(range(n)))
+
+
+def branch():
+    """Call leaf with two sizes."""
+    return leaf(200000) + leaf(100)
+
+
+class TestCollapsedStacks:
+    """Test cases for collapsed stack estimation."""
+
+    def test_stacks_follow_callers(self):
+        """Test stacks run from the root and add up to the profiled time."""
+        profiler = cProfile.Profile()
+        profiler.enable()
+        branch()
+        profiler.disable()
+        stats = pstats.Stats(profiler)
+
+        stacks = collapsed_stacks(stats)
+        leaf_stacks = [
+            stack for stack in stacks if stack.split(";")[-1].startswith("leaf")
+        ]
+        total = sum(value[3] for value in stats.stats.values() if not value[4])
+
+        assert leaf_stacks
+        assert all(
+            stack.startswith("branch (test_profiling.py:") for stack in leaf_stacks
+        )
+        assert any(
+            frame == "<built-in method builtins.sum>"
+            for stack in stacks
+            for frame in stack.split(";")
+        )
+        assert sum(stacks.values()) == pytest.approx(total * 1e6, rel=0.05)
+
+
+class TestCallProfiler:
+    """Test cases for CallProfiler."""
+
+    def test_sample(self):
+        """Test calls are sampled below the configured rate."""
+        assert CallProfiler("unused", 0.5, sampler=lambda: 0.25).sample()
+        assert not CallProfiler("unused", 0.5, sampler=lambda: 0.75).sample()
+        assert not CallProfiler("unused", 0.0, sampler=lambda: 0.0).sample()
+
+    @pytest.mark.asyncio
+    async def test_profile_writes_files(self, tmp_path):
+        """Test a profiled call writes pstats, collapsed stacks and a summary."""
+        profiler = CallProfiler(str(tmp_path / "profiles"), 1.0)
+
+        async def compute():
+            return branch()
+
+        result = await profiler.profile(
+            "get_moon_phase", {"date": "2024-01-15"}, compute
+        )
+
+        assert result == branch()
+        assert profiler.profiled == 1
+        files = sorted(path.suffix for path in (tmp_path / "profiles").iterdir())
+        assert files == [".collapsed", ".json", ".pstats"]
+        (summary_path,) = (tmp_path / "profiles").glob("*-get_moon_phase-*.json")
+        summary = json.loads(summary_path.read_text())
+        assert summary["tool"] == "get_moon_phase"
+        assert summary["arguments"] == {"date": "2024-01-15"}
+        assert summary["elapsed_ms"] > 0
+        assert "memory" not in summary
+        stats = pstats.Stats(str(summary_path.with_suffix(".pstats")))
+        assert any(function[2] == "leaf" for function in stats.stats)
+        collapsed = summary_path.with_suffix(".collapsed").read_text().splitlines()
+        assert any("leaf (test_profiling.py:" in line for line in collapsed)
+        assert all(int(line.rsplit(" ", 1)[1]) > 0 for line in collapsed)
+
+    @pytest.mark.asyncio
+    async def test_profile_memory(self, tmp_path):
+        """Test memory tracing records allocations and stops tracemalloc again."""
+        profiler = CallProfiler(str(tmp_path), 1.0, trace_memory=True)
+
+        async def compute():
+            return [bytes(1000) for _ in range(100)]
+
+        await profiler.profile("get_moon_phase", {}, compute)
+
+        (summary_path,) = tmp_path.glob("*.json")
+        memory = json.loads(summary_path.read_text())["memory"]
+        assert memory["peak_bytes"] >= 100000
+        assert memory["top_allocations"][0]["location"].startswith(__file__)
+        assert tracemalloc.Snapshot.load(str(summary_path.with_suffix(".tracemalloc")))
+        assert not tracemalloc.is_tracing()
+
+    @pytest.mark.asyncio
+    async def test_profile_errors_propagate(self, tmp_path):
+        """Test a failing call is still profiled and its error raised."""
+        profiler = CallProfiler(str(tmp_path), 1.0)
+
+        async def compute():
+            raise ValueError("Invalid date")
+
+        with pytest.raises(ValueError, match="Invalid date"):
+            await profiler.profile("get_moon_phase", {}, compute)
+        assert len(list(tmp_path.glob("*.pstats"))) == 1
@@ -0,0 +1,36 @@
+"""Tests for result field projection."""
+
+import pytest
+
+from lunar_mcp_server.projection import Projection
+
+AVAILABLE = ("date", "score", "moon_phase", "alternatives")
+
+
+class TestProjection:
+    """Test cases for Projection."""
+
+    def test_all_fields_by_default(self):
+        """Test no fields (or an empty list) selects the whole result."""
+        result = {"date": "2024-01-15", "score": 7}
+        for fields in (None, []):
+            projection = Projection(fields, AVAILABLE)
+
+            assert projection.wants("moon_phase")
+            assert projection.apply(result) is result
+
+    def test_selected_fields(self):
+        """Test only requested and always kept fields remain."""
+        projection = Projection(["score"], AVAILABLE, always=("date",))
+
+        assert projection.wants("score")
+        assert projection.wants("moon_phase", "score")
+        assert not projection.wants("moon_phase", "alternatives")
+        assert projection.apply(
+            {"date": "2024-01-15", "score": 7, "moon_phase": None}
+        ) == {"date": "2024-01-15", "score": 7}
+
+    def test_unknown_fields(self):
+        """Test unknown fields are rejected."""
+        with pytest.raises(ValueError, match="Unknown fields: colour, size"):
+            Projection(["size", "score", "colour"], AVAILABLE)
@@ -0,0 +1,136 @@
+"""Tests for the tool result cache."""
+
+from datetime import datetime
+
+import pytest
+
+from lunar_mcp_server.result_cache import (
+    CachedResult,
+    ResultCache,
+    seconds_until_rollover,
+)
+
+
+class FakeClock:
+    """Settable Unix time."""
+
+    def __init__(self, now: float) -> None:
+        self.now = now
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class TestResultCache:
+    """Test cases for ResultCache."""
+
+    def setup_method(self):
+        """Set up test fixtures."""
+        self.clock = FakeClock(datetime(2024, 1, 15, 10, 30).timestamp())
+        self.cache = ResultCache(3, 100, clock=self.clock)
+
+    def test_get_and_put(self):
+        """Test stored results are returned and counted."""
+        assert self.cache.get("a") is None
+        self.cache.put("a", "中秋", 60)
+
+        assert self.cache.get("a") == "中秋"
+        assert self.cache.stats() == {
+            "hits": 1,
+            "misses": 1,
+            "evictions": 0,
+            "expirations": 0,
+            "size": 1,
+            "bytes": 6,
+            "max_entries": 3,
+            "max_bytes": 100,
+        }
+
+    def test_lookup_returns_size(self):
+        """Test a measured size is stored and returned with the result."""
+        self.cache.put("a", "中秋", 60, size=6)
+
+        assert self.cache.lookup("a") == CachedResult("中秋", 6)
+        assert self.cache.lookup("b") is None
+        assert self.cache.bytes == 6
+
+    def test_ttl(self):
+        """Test results expire after their time to live."""
+        self.cache.put("a", "x", 60)
+        self.clock.now += 59
+        assert self.cache.get("a") == "x"
+
+        self.clock.now += 1
+        assert self.cache.get("a") is None
+        assert self.cache.expirations == 1
+        assert len(self.cache) == 0
+
+    def test_clock_rollover(self):
+        """Test clock-dependent results expire when the unit rolls over."""
+        self.cache.put("hour", "x", 3600, clock="hour")
+        self.cache.put("day", "x", 86400, clock="day")
+
+        self.clock.now += 30 * 60
+        assert self.cache.get("hour") is None
+        assert self.cache.get("day") == "x"
+
+        self.clock.now += 13.5 * 3600
+        assert self.cache.get("day") is None
+
+    def test_evicts_least_recently_used(self):
+        """Test the entry count bound evicts the least recently used result."""
+        for key in "abc":
+            self.cache.put(key, key, 60)
+        self.cache.get("a")
+        self.cache.put("d", "d", 60)
+
+        assert self.cache.get("b") is None
+        assert [self.cache.get(key) for key in "acd"] == ["a", "c", "d"]
+        assert self.cache.evictions == 1
+
+    def test_byte_bound(self):
+        """Test the byte bound evicts results and skips oversized ones."""
+        self.cache.put("a", "x" * 60, 60)
+        self.cache.put("b", "y" * 60, 60)
+
+        assert self.cache.get("a") is None
+        assert self.cache.bytes == 60
+
+        self.cache.put("c", "z" * 101, 60)
+        assert self.cache.get("c") is None
+        assert self.cache.get("b") == "y" * 60
+
+    def test_replace(self):
+        """Test storing a key again replaces its result and size."""
+        self.cache.put("a", "x" * 10, 60)
+        self.cache.put("a", "y", 60)
+
+        assert self.cache.get("a") == "y"
+        assert self.cache.bytes == 1
+
+    def test_clear(self):
+        """Test clearing drops results and counters."""
+        self.cache.put("a", "x", 60)
+        self.cache.get("a")
+        self.cache.clear()
+
+        assert len(self.cache) == 0
+        assert self.cache.stats()["hits"] == 0
+        assert self.cache.bytes == 0
+
+
+class TestRollover:
+    """Test cases for clock unit rollovers."""
+
+    def test_seconds_until_rollover(self):
+        """Test the time to the next hour and the next midnight."""
+        now = datetime(2024, 1, 15, 23, 45, 30)
+
+        assert seconds_until_rollover("hour", now) == 14 * 60 + 30
+        assert seconds_until_rollover("day", now) == 14 * 60 + 30
+        assert seconds_until_rollover("day", datetime(2024, 1, 15)) == 86400
+
+    def test_unknown_unit(self):
+        """Test unknown clock units are rejected."""
+        with pytest.raises(ValueError, match="Unknown clock unit: week"):
+            seconds_until_rollover("week", datetime(2024, 1, 15))
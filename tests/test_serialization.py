@@ -0,0 +1,57 @@
+"""Tests for tool result serialization."""
+
+import json
+from datetime import date
+
+import numpy as np
+import pytest
+
+from lunar_mcp_server import serialization
+from lunar_mcp_server.serialization import get_serializer
+
+RESULT = {
+    "name": "中秋節",
+    "illumination": np.float64(0.5),
+    "calendar_view": {9: [{"date": date(2024, 9, 17)}]},
+}
+
+DECODED = {
+    "name": "中秋節",
+    "illumination": 0.5,
+    "calendar_view": {"9": [{"date": "2024-09-17"}]},
+}
+
+
+class TestSerializer:
+    """Test cases for result serializers."""
+
+    @pytest.mark.parametrize("backend", ["orjson", "json"])
+    def test_compact(self, backend):
+        """Test compact output decodes to the same result."""
+        text = get_serializer(backend)(RESULT)
+
+        assert json.loads(text) == DECODED
+        assert "\n" not in text
+        assert ": " not in text
+        assert "中秋節" in text
+
+    @pytest.mark.parametrize("backend", ["orjson", "json"])
+    def test_pretty(self, backend):
+        """Test pretty output is indented."""
+        text = get_serializer(backend, pretty=True)(RESULT)
+
+        assert json.loads(text) == DECODED
+        assert '\n  "name": "中秋節"' in text
+
+    def test_auto_without_orjson(self, monkeypatch):
+        """Test the standard library is used when orjson is missing."""
+        monkeypatch.setattr(serialization, "orjson", None)
+
+        assert json.loads(get_serializer()(RESULT)) == DECODED
+        with pytest.raises(ValueError, match="requires the orjson package"):
+            get_serializer("orjson")
+
+    def test_unknown_backend(self):
+        """Test an unknown backend is rejected."""
+        with pytest.raises(ValueError, match="Unknown JSON backend"):
+            get_serializer("yaml")
@@ -1,10 +1,14 @@
 """Tests for MCP server implementation."""
 
+from datetime import date, datetime
 from unittest.mock import patch
 
 import pytest
 
-from lunar_mcp_server.server import LunarMCPServer
+from lunar_mcp_server.config import Settings
+from lunar_mcp_server.engine import LunarEngine
+from lunar_mcp_server.lunar_table import ChineseLunarDate
+from lunar_mcp_server.server import LunarMCPServer, _parse_settings
 
 
 class TestLunarMCPServer:
@@ -33,7 +37,9 @@ class TestLunarMCPServer:
 
             assert result["date"] == "2024-01-15"
             assert result["auspicious_level"] == "very_good"
-            mock_check.assert_called_once_with("2024-01-15", "wedding", "chinese")
+            mock_check.assert_called_once_with(
+                "2024-01-15", "wedding", "chinese", fields=None
+            )
 
     @pytest.mark.asyncio
     async def test_find_good_dates_tool(self):
@@ -60,7 +66,7 @@ class TestLunarMCPServer:
     @pytest.mark.asyncio
     async def test_get_moon_phase_tool(self):
         """Test get_moon_phase tool."""
-        with patch.object(self.server.lunar_calc, "get_moon_phase") as mock_moon:
+        with patch.object(self.server.lunar_calc, "describe_moon_phase") as mock_moon:
             mock_moon.return_value = {
                 "date": "2024-01-15",
                 "phase_name": "Full Moon",
@@ -72,7 +78,10 @@ class TestLunarMCPServer:
 
             assert result["date"] == "2024-01-15"
             assert result["phase_name"] == "Full Moon"
-            mock_moon.assert_called_once_with("2024-01-15", "0,0")
+            facts = self.server.engine.day_facts(date(2024, 1, 15))
+            mock_moon.assert_called_once_with(
+                datetime(2024, 1, 15), facts.illumination, facts.phase_angle, "0,0"
+            )
 
     @pytest.mark.asyncio
     async def test_get_lunar_festivals_tool(self):
@@ -132,7 +141,78 @@ class TestLunarMCPServer:
 
             assert result["date"] == "2024-01-15"
             assert result["culture"] == "chinese"
-            mock_zodiac.assert_called_once_with("2024-01-15", "chinese")
+            mock_zodiac.assert_called_once_with(
+                "2024-01-15", "chinese", ChineseLunarDate(2023, 12, 5, False), None
+            )
+
+    @pytest.mark.asyncio
+    async def test_get_zodiac_info_fields(self):
+        """Test day facts are not looked up when lunar_info is not requested."""
+        with patch.object(self.server.engine, "day_facts") as mock_facts:
+            result = await self.server._get_zodiac_info(
+                "2024-01-15", "chinese", ["year_zodiac"]
+            )
+
+            mock_facts.assert_not_called()
+        assert set(result) == {"date", "year_zodiac"}
+
+    @pytest.mark.asyncio
+    async def test_batch_check_dates_input_order(self):
+        """Test batch results follow the input, repeated dates included."""
+        dates = [f"2024-01-{day:02d}" for day in range(31, 0, -1)] + ["2024-01-31"]
+
+        with patch.object(
+            self.server.auspicious_checker,
+            "check_date",
+            wraps=self.server.auspicious_checker.check_date,
+        ) as spy:
+            result = await self.server._batch_check_dates(dates, "wedding")
+
+        assert [entry["date"] for entry in result["results"]] == dates
+        assert result["total_checked"] == 32
+        assert spy.call_count == 31
+        assert result["results"][0]["details"] == result["results"][-1]["details"]
+
+    @pytest.mark.asyncio
+    async def test_batch_check_dates_limit(self):
+        """Test batches over the configured maximum are rejected."""
+        server = LunarMCPServer(LunarEngine(Settings(batch_max_dates=2)))
+
+        result = await server._batch_check_dates(
+            ["2024-01-01", "2024-01-02", "2024-01-03"], "wedding"
+        )
+
+        assert result["error"] == "Too many dates: 3 (maximum 2)"
+
+    @pytest.mark.asyncio
+    async def test_solar_to_lunar_range_pages(self):
+        """Test ten years of daily conversions page through completely."""
+        entries = []
+        offset = 0
+        while offset is not None:
+            result = await self.server._solar_to_lunar_range(
+                "2020-01-01", "2029-12-31", offset=offset
+            )
+            entries.extend(result["results"])
+            offset = result["next_offset"]
+
+        assert len(entries) == 3653
+        assert entries[0]["solar_date"] == "2020-01-01"
+        assert entries[-1]["solar_date"] == "2029-12-31"
+
+    @pytest.mark.asyncio
+    async def test_range_conversion_limits(self):
+        """Test pages and date lists are bounded by the batch maximum."""
+        server = LunarMCPServer(LunarEngine(Settings(batch_max_dates=2)))
+
+        page = await server._solar_to_lunar_range("2024-01-01", "2024-01-31", limit=10)
+        too_many = await server._lunar_to_solar_range(
+            lunar_dates=["2024-1-1", "2024-1-2", "2024-1-3"]
+        )
+
+        assert page["count"] == 2
+        assert page["next_offset"] == 2
+        assert too_many["error"] == "Too many dates: 3 (maximum 2)"
 
     def test_server_initialization(self):
         """Test server proper initialization."""
@@ -190,3 +270,43 @@ class TestServerHandlers:
         assert hasattr(self.server, "_find_good_dates")
         assert hasattr(self.server, "_get_moon_phase")
         assert hasattr(self.server, "_get_lunar_festivals")
+
+
+class TestServerStartup:
+    """Test transport selection and command line settings."""
+
+    def test_parse_settings_defaults(self, monkeypatch):
+        """Test the command line defaults come from the environment."""
+        monkeypatch.setenv("LUNAR_MCP_HTTP_PORT", "9000")
+
+        settings = _parse_settings([])
+
+        assert settings.transport == "stdio"
+        assert settings.http_port == 9000
+
+    def test_parse_settings_http(self):
+        """Test command line options override the environment."""
+        settings = _parse_settings(
+            ["--transport", "http", "--port", "8080", "--stateless"]
+        )
+
+        assert settings.transport == "http"
+        assert settings.http_port == 8080
+        assert settings.http_stateless is True
+        assert settings.workers == 1
+
+    def test_parse_settings_workers(self):
+        """Test worker processes are only accepted for the HTTP transport."""
+        settings = _parse_settings(["--transport", "http", "--workers", "4"])
+        assert settings.workers == 4
+
+        with pytest.raises(SystemExit):
+            _parse_settings(["--workers", "4"])
+
+    @pytest.mark.asyncio
+    async def test_unknown_transport(self):
+        """Test an unknown transport is rejected."""
+        server = LunarMCPServer(LunarEngine(Settings()))
+
+        with pytest.raises(ValueError, match="Unknown transport"):
+            await server.run("carrier-pigeon")
@@ -0,0 +1,79 @@
+"""Tests for single-flight call coalescing."""
+
+import asyncio
+
+import pytest
+
+from lunar_mcp_server.single_flight import SingleFlight, call_key
+
+
+class TestSingleFlight:
+    """Test cases for SingleFlight."""
+
+    def setup_method(self):
+        """Set up test fixtures."""
+        self.flight = SingleFlight()
+        self.calls = 0
+
+    async def compute(self, value):
+        """Slow computation counting its executions."""
+        self.calls += 1
+        await asyncio.sleep(0.01)
+        return value
+
+    def test_call_key(self):
+        """Test keys ignore argument order but not values or tool names."""
+        assert call_key("a", {"x": 1, "y": [2]}) == call_key("a", {"y": [2], "x": 1})
+        assert call_key("a", {"x": 1}) != call_key("a", {"x": 2})
+        assert call_key("a", {"x": 1}) != call_key("b", {"x": 1})
+
+    @pytest.mark.asyncio
+    async def test_coalesces_concurrent_calls(self):
+        """Test concurrent calls with one key share a single execution."""
+        results = await asyncio.gather(
+            *(self.flight.run("k", lambda: self.compute(1)) for _ in range(5)),
+            self.flight.run("other", lambda: self.compute(2)),
+        )
+
+        assert results == [1, 1, 1, 1, 1, 2]
+        assert self.calls == 2
+        assert self.flight.stats() == {"executed": 2, "coalesced": 4, "in_flight": 0}
+
+    @pytest.mark.asyncio
+    async def test_sequential_calls_run_again(self):
+        """Test a finished call is not reused."""
+        await self.flight.run("k", lambda: self.compute(1))
+        await self.flight.run("k", lambda: self.compute(1))
+
+        assert self.calls == 2
+        assert self.flight.coalesced == 0
+
+    @pytest.mark.asyncio
+    async def test_shared_exception(self):
+        """Test every waiting caller gets the exception."""
+
+        async def fail():
+            await asyncio.sleep(0.01)
+            raise ValueError("boom")
+
+        results = await asyncio.gather(
+            self.flight.run("k", fail),
+            self.flight.run("k", fail),
+            return_exceptions=True,
+        )
+
+        assert [str(result) for result in results] == ["boom", "boom"]
+        assert self.flight.coalesced == 1
+
+    @pytest.mark.asyncio
+    async def test_cancelled_caller(self):
+        """Test cancelling the first caller does not cancel the others."""
+        first = asyncio.ensure_future(self.flight.run("k", lambda: self.compute(1)))
+        await asyncio.sleep(0)
+        second = asyncio.ensure_future(self.flight.run("k", lambda: self.compute(1)))
+        await asyncio.sleep(0)
+        first.cancel()
+
+        assert await second == 1
+        assert first.cancelled()
+        assert self.calls == 1
@@ -0,0 +1,70 @@
+"""Tests for server import cost."""
+
+import os
+import re
+import subprocess
+import sys
+from pathlib import Path
+
+# Modules only imported on first use, never at server startup
+LAZY_MODULES = {
+    "numpy",
+    "skyfield",
+    "ephem",
+    "astropy",
+    "chinese_calendar",
+    "cProfile",
+    "pstats",
+    "tracemalloc",
+    "lunar_mcp_server.profiling",
+}
+
+IMPORT_TIME = re.compile(r"import time:\s+(\d+) \|\s+(\d+) \| ( *)(\S+)")
+
+SRC = Path(__file__).resolve().parent.parent / "src"
+
+
+def import_times() -> list[tuple[str, int, int, int]]:
+    """Import the server in a fresh interpreter under ``-X importtime``.
+
+    Returns (module, self us, cumulative us, depth) in import order. The
+    MCP SDK is imported first so it is not counted against the package.
+    """
+    env = dict(os.environ)
+    env["PYTHONPATH"] = os.pathsep.join(filter(None, [str(SRC), env.get("PYTHONPATH")]))
+    result = subprocess.run(
+        [
+            sys.executable,
+            "-X",
+            "importtime",
+            "-c",
+            "import mcp.server, mcp.types, pydantic; import lunar_mcp_server.server",
+        ],
+        capture_output=True,
+        text=True,
+        env=env,
+        check=True,
+    )
+    return [
+        (name, int(own), int(cumulative), len(indent) // 2)
+        for own, cumulative, indent, name in IMPORT_TIME.findall(result.stderr)
+    ]
+
+
+class TestStartup:
+    """Test cases for startup import cost."""
+
+    def setup_method(self):
+        """Set up test fixtures."""
+        self.times = import_times()
+
+    def test_heavy_modules_are_lazy(self):
+        """Test numpy, skyfield and the profilers are not imported at startup."""
+        imported = {name for name, _, _, _ in self.times}
+
+        assert "lunar_mcp_server.server" in imported
+        assert {
+            name
+            for name in imported
+            if name in LAZY_MODULES or name.split(".")[0] in LAZY_MODULES
+        } == set()
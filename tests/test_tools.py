@@ -0,0 +1,331 @@
+"""Tests for tool definitions and argument validation."""
+
+import asyncio
+import json
+from unittest.mock import AsyncMock, patch
+
+import pytest
+from mcp.types import (
+    CallToolRequest,
+    CallToolRequestParams,
+    ListResourcesRequest,
+    ReadResourceRequest,
+    ReadResourceRequestParams,
+)
+
+from lunar_mcp_server.config import Settings
+from lunar_mcp_server.engine import LunarEngine
+from lunar_mcp_server.metrics import METRICS_URI
+from lunar_mcp_server.server import LunarMCPServer
+from lunar_mcp_server.single_flight import call_key
+from lunar_mcp_server.tools import TOOLS, ToolArgumentError, compile_validator
+
+
+class TestCompileValidator:
+    """Test cases for compiled argument validators."""
+
+    def setup_method(self):
+        """Set up test fixtures."""
+        self.validate = compile_validator(
+            {
+                "type": "object",
+                "properties": {
+                    "date": {"type": "string", "format": "date"},
+                    "dates": {"type": "array", "items": {"type": "string"}},
+                    "month": {"type": "integer", "minimum": 1, "maximum": 12},
+                    "culture": {"type": "string", "enum": ["chinese", "hindu"]},
+                    "fields": {
+                        "type": "array",
+                        "items": {"type": "string", "enum": ["score", "moon"]},
+                    },
+                },
+                "required": ["date"],
+            }
+        )
+
+    def test_valid_arguments(self):
+        """Test matching arguments pass."""
+        self.validate({"date": "2024-01-15", "dates": ["a"], "month": 12})
+        self.validate({"date": "2024-01-15", "culture": "hindu", "fields": ["moon"]})
+        self.validate({"date": "2024-1-5"})
+
+    @pytest.mark.parametrize(
+        "arguments, message",
+        [
+            ({}, "Missing required argument 'date'"),
+            ({"date": "2024-01-15", "extra": 1}, "Unknown argument 'extra'"),
+            ({"date": 20240115}, "'date' must be a string"),
+            ({"date": "2024-02-30"}, "'date' must be a date in YYYY-MM-DD format"),
+            ({"date": "2024-01-15", "dates": "a"}, "'dates' must be an array"),
+            ({"date": "2024-01-15", "dates": [1]}, "'dates' items must each be"),
+            ({"date": "2024-01-15", "month": True}, "'month' must be an integer"),
+            ({"date": "2024-01-15", "month": 13}, "'month' must be at most 12"),
+            ({"date": "2024-01-15", "month": 0}, "'month' must be at least 1"),
+            (
+                {"date": "2024-01-15", "culture": "mayan"},
+                "'culture' must be one of: chinese, hindu",
+            ),
+            (
+                {"date": "2024-01-15", "fields": ["score", "size"]},
+                "'fields' items must each be one of: score, moon",
+            ),
+        ],
+    )
+    def test_invalid_arguments(self, arguments, message):
+        """Test mismatching arguments are rejected with a clear message."""
+        with pytest.raises(ToolArgumentError, match=message):
+            self.validate(arguments)
+
+    def test_null_optional_arguments_omitted(self):
+        """Test null optional arguments are dropped so defaults apply."""
+        arguments = {"date": "2024-01-15", "culture": None, "month": None}
+
+        assert self.validate(arguments) == {"date": "2024-01-15"}
+        assert self.validate({"date": "2024-01-15"}) == {"date": "2024-01-15"}
+        with pytest.raises(ToolArgumentError, match="'date' must be a string"):
+            self.validate({"date": None})
+
+    def test_all_tool_schemas_compile(self):
+        """Test every tool schema compiles."""
+        for tool in TOOLS:
+            compile_validator(tool.inputSchema)
+
+
+class TestToolDispatch:
+    """Test cases for registry-based tool dispatch."""
+
+    def setup_method(self):
+        """Set up test fixtures."""
+        self.server = LunarMCPServer()
+
+    async def call(self, name, arguments):
+        """Call a tool through the MCP request handler."""
+        handler = self.server.server.request_handlers[CallToolRequest]
+        request = CallToolRequest(
+            method="tools/call",
+            params=CallToolRequestParams(name=name, arguments=arguments),
+        )
+        result = await handler(request)
+        return json.loads(result.root.content[0].text)
+
+    def test_registry_covers_all_tools(self):
+        """Test every tool has a handler and cached definition."""
+        assert len(self.server.tools) == 20
+        assert [tool.name for tool in self.server._tool_definitions] == [
+            tool.name for tool in TOOLS
+        ]
+
+    @pytest.mark.asyncio
+    async def test_dispatch(self):
+        """Test a tool call is routed to its handler."""
+        result = await self.call("solar_to_lunar", {"solar_date": "2024-02-10"})
+
+        assert result["lunar_month"] == 1
+
+    @pytest.mark.asyncio
+    async def test_offloaded_dispatch(self):
+        """Test blocking tools run on the worker pool and cheap ones inline."""
+        assert self.server.tools["find_good_dates"].offload
+        assert not self.server.tools["solar_to_lunar"].offload
+
+        result = await self.call(
+            "check_auspicious_date", {"date": "2024-01-15", "activity": "wedding"}
+        )
+        self.server.worker_pool.shutdown()
+
+        assert result["date"] == "2024-01-15"
+        assert self.server.worker_pool.stats()["completed"] == 1
+
+    @pytest.mark.asyncio
+    async def test_invalid_arguments_skip_handler(self):
+        """Test invalid arguments are rejected before the handler runs."""
+        registered = self.server.tools["check_auspicious_date"]
+        handler = AsyncMock()
+        with patch.dict(
+            self.server.tools,
+            {"check_auspicious_date": registered._replace(handler=handler)},
+        ):
+            result = await self.call(
+                "check_auspicious_date", {"date": "15/01/2024", "activity": "wedding"}
+            )
+
+        assert result == {
+            "error": "'date' must be a date in YYYY-MM-DD format",
+            "tool": "check_auspicious_date",
+        }
+        handler.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_bounded_arguments(self):
+        """Test find_good_dates limits and festival years are bounded."""
+        too_many = await self.call(
+            "find_good_dates",
+            {
+                "start_date": "2024-01-01",
+                "end_date": "2024-12-31",
+                "activity": "wedding",
+                "limit": 100_000,
+            },
+        )
+        too_late = await self.call("get_annual_festivals", {"year": 99999})
+        edge = await self.call("get_annual_festivals", {"year": 2100})
+
+        assert too_many["error"] == "'limit' must be at most 100"
+        assert too_late["error"] == "'year' must be at most 2100"
+        assert edge["total_festivals"] > 0
+
+    @pytest.mark.asyncio
+    async def test_null_argument_uses_default(self):
+        """Test a null optional argument behaves as if it were omitted."""
+        result = await self.call(
+            "find_good_dates",
+            {
+                "start_date": "2024-01-01",
+                "end_date": "2024-03-31",
+                "activity": "wedding",
+                "culture": None,
+                "limit": None,
+            },
+        )
+
+        assert "error" not in result
+        assert len(result["good_dates"]) == 10
+
+    @pytest.mark.asyncio
+    async def test_identical_calls_coalesced(self):
+        """Test concurrent identical calls run the handler once."""
+        registered = self.server.tools["get_annual_festivals"]
+
+        async def handler(**arguments):
+            await asyncio.sleep(0.01)
+            return {"year": arguments["year"]}
+
+        mock = AsyncMock(side_effect=handler)
+        with patch.dict(
+            self.server.tools,
+            {"get_annual_festivals": registered._replace(handler=mock)},
+        ):
+            results = await asyncio.gather(
+                *(self.call("get_annual_festivals", {"year": 2024}) for _ in range(4)),
+                self.call("get_annual_festivals", {"year": 2025}),
+            )
+
+        assert results == [{"year": 2024}] * 4 + [{"year": 2025}]
+        assert mock.await_count == 2
+        assert self.server.single_flight.stats()["coalesced"] == 3
+
+    @pytest.mark.asyncio
+    async def test_results_cached(self):
+        """Test repeated calls are served from the result cache."""
+        registered = self.server.tools["solar_to_lunar"]
+        mock = AsyncMock(return_value={"lunar_month": 1})
+        with patch.dict(
+            self.server.tools, {"solar_to_lunar": registered._replace(handler=mock)}
+        ):
+            first = await self.call("solar_to_lunar", {"solar_date": "2024-02-10"})
+            second = await self.call("solar_to_lunar", {"solar_date": "2024-02-10"})
+
+        assert first == second == {"lunar_month": 1}
+        assert mock.await_count == 1
+        assert self.server.result_cache.stats()["hits"] == 1
+
+    @pytest.mark.asyncio
+    async def test_errors_not_cached(self):
+        """Test error results are computed again on the next call."""
+        registered = self.server.tools["solar_to_lunar"]
+        mock = AsyncMock(return_value={"error": "Invalid date"})
+        with patch.dict(
+            self.server.tools, {"solar_to_lunar": registered._replace(handler=mock)}
+        ):
+            for _ in range(2):
+                await self.call("solar_to_lunar", {"solar_date": "2024-02-10"})
+
+        assert mock.await_count == 2
+        assert len(self.server.result_cache) == 0
+
+    def test_result_cache_disabled(self):
+        """Test a zero time to live turns the result cache off."""
+        server = LunarMCPServer(LunarEngine(Settings(result_cache_ttl=0)))
+
+        assert server.result_cache is None
+
+    def test_clock_dependent_tools(self):
+        """Test tools reading the clock declare the unit they depend on."""
+        assert self.server.tools["get_zodiac_info"].clock == "hour"
+        assert self.server.tools["get_festival_details"].clock == "day"
+        assert self.server.tools["get_moon_phase"].clock is None
+
+    @pytest.mark.asyncio
+    async def test_unknown_tool(self):
+        """Test an unknown tool name is reported."""
+        result = await self.call("no_such_tool", {})
+
+        assert result["error"] == "Unknown tool: no_such_tool"
+
+    @pytest.mark.asyncio
+    async def test_call_metrics(self):
+        """Test calls, cache hits and errors are recorded per tool."""
+        for _ in range(2):
+            await self.call("solar_to_lunar", {"solar_date": "2024-02-10"})
+        key = call_key("solar_to_lunar", {"solar_date": "2024-02-10"})
+        text = self.server.result_cache.get(key)
+        # The computed call and the cache hit record the same encoded size
+        sizes = self.server.metrics.snapshot()["tools"]["solar_to_lunar"]
+        assert sizes["response_bytes"]["total"] == 2 * len(text.encode())
+        await self.call("solar_to_lunar", {"solar_date": "2024-13-40"})
+        await self.call("no_such_tool", {})
+
+        tools = self.server.metrics.snapshot()["tools"]
+        assert tools["solar_to_lunar"]["calls"] == 3
+        assert tools["solar_to_lunar"]["errors"] == 1
+        assert tools["solar_to_lunar"]["latency_ms"]["p50"] > 0
+        assert tools["solar_to_lunar"]["response_bytes"]["total"] > 0
+        assert tools["unknown"] == {**tools["unknown"], "calls": 1, "errors": 1}
+
+    @pytest.mark.asyncio
+    async def test_metrics_resource(self):
+        """Test the metrics snapshot is readable as an MCP resource."""
+        await self.call("solar_to_lunar", {"solar_date": "2024-02-10"})
+        list_handler = self.server.server.request_handlers[ListResourcesRequest]
+        read_handler = self.server.server.request_handlers[ReadResourceRequest]
+
+        listed = await list_handler(ListResourcesRequest(method="resources/list"))
+        uri = listed.root.resources[0].uri
+        result = await read_handler(
+            ReadResourceRequest(
+                method="resources/read", params=ReadResourceRequestParams(uri=uri)
+            )
+        )
+        snapshot = json.loads(result.root.contents[0].text)
+
+        assert str(uri) == METRICS_URI
+        assert result.root.contents[0].mimeType == "application/json"
+        assert snapshot["tools"]["solar_to_lunar"]["calls"] == 1
+        assert snapshot["result_cache"]["misses"] == 1
+        assert "worker_pool" in snapshot
+
+    @pytest.mark.asyncio
+    async def test_profiled_calls(self, tmp_path):
+        """Test sampled calls are profiled on the thread computing them."""
+        assert self.server.profiler is None
+        server = LunarMCPServer(
+            LunarEngine(Settings(profile_sample_rate=1.0, profile_dir=str(tmp_path)))
+        )
+        self.server = server
+
+        result = await self.call(
+            "check_auspicious_date", {"date": "2024-01-15", "activity": "wedding"}
+        )
+        cached = await self.call(
+            "check_auspicious_date", {"date": "2024-01-15", "activity": "wedding"}
+        )
+        server.worker_pool.shutdown()
+
+        assert result == cached
+        assert server.profiler.profiled == 1
+        (summary_path,) = tmp_path.glob("*-check_auspicious_date-*.json")
+        summary = json.loads(summary_path.read_text())
+        assert summary["thread"].startswith("lunar-calc")
+        assert "check_date (auspicious_dates.py:" in (
+            summary_path.with_suffix(".collapsed").read_text()
+        )
@@ -0,0 +1,82 @@
+"""Tests for the blocking calculation worker pool."""
+
+import asyncio
+import threading
+
+import pytest
+
+from lunar_mcp_server.worker_pool import WorkerPool
+
+
+async def current_thread_name():
+    """Name of the thread running the coroutine."""
+    return threading.current_thread().name
+
+
+class TestWorkerPool:
+    """Test cases for WorkerPool."""
+
+    def setup_method(self):
+        """Set up test fixtures."""
+        self.pool = WorkerPool("test", 2)
+
+    def teardown_method(self):
+        """Stop the worker threads."""
+        self.pool.shutdown()
+
+    @pytest.mark.asyncio
+    async def test_run_on_worker_thread(self):
+        """Test coroutines run on a worker thread and return their result."""
+        name = await self.pool.run(current_thread_name)
+
+        assert name.startswith("lunar-test")
+        assert self.pool.stats() == {
+            "name": "test",
+            "workers": 2,
+            "queued": 0,
+            "running": 0,
+            "completed": 1,
+            "max_queued": 1,
+        }
+
+    @pytest.mark.asyncio
+    async def test_run_inline(self):
+        """Test a pool without workers runs calls on the event loop."""
+        pool = WorkerPool("inline", 0)
+
+        assert await pool.run(current_thread_name) == threading.current_thread().name
+        assert pool.stats()["completed"] == 0
+
+    @pytest.mark.asyncio
+    async def test_exceptions_propagate(self):
+        """Test errors raised on a worker reach the caller."""
+
+        async def fail():
+            raise ValueError("boom")
+
+        with pytest.raises(ValueError, match="boom"):
+            await self.pool.run(fail)
+        assert self.pool.stats()["running"] == 0
+
+    @pytest.mark.asyncio
+    async def test_queue_depth(self):
+        """Test queued calls are counted while the workers are busy."""
+        release = threading.Event()
+
+        async def block():
+            release.wait()
+
+        busy = [asyncio.ensure_future(self.pool.run(block)) for _ in range(3)]
+        while self.pool.stats()["running"] < 2:
+            await asyncio.sleep(0.001)
+
+        assert self.pool.stats()["queued"] == 1
+        busy[2].cancel()
+        await asyncio.gather(busy[2], return_exceptions=True)
+        release.set()
+        await asyncio.gather(*busy, return_exceptions=True)
+
+        stats = self.pool.stats()
+        assert stats["queued"] == 0
+        assert stats["completed"] == 2
+        assert stats["max_queued"] >= 1